@@ -10,7 +10,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-from openai import OpenAI
+from vaultmind.llm.client import shared_openai_client
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -25,7 +25,7 @@ class Transcriber:
 
     def __init__(self, config: VoiceConfig, api_key: str) -> None:
         self._config = config
-        self._client = OpenAI(api_key=api_key)
+        self._client = shared_openai_client(api_key)
 
     def transcribe(self, audio_path: Path) -> str:
         """Transcribe an audio file to text.
@@ -809,7 +809,11 @@ def bot(ctx: click.Context) -> None:
         store=store,
         event_bus=event_bus,
     )
-    watcher = VaultWatcher(config=settings.vault, on_change=watch_handler.handle_change)
+    watcher = VaultWatcher(
+        config=settings.vault,
+        on_change=watch_handler.handle_change,
+        coalesce_window_ms=settings.watch.coalesce_window_ms,
+    )
 
     provider = settings.llm.provider
     model = settings.llm.thinking_model
@@ -1116,6 +1120,7 @@ def watch(ctx: click.Context, with_graph: bool) -> None:
         # Force reextract_graph on since user explicitly opted in via --graph
         watch_config = WatchConfig(
             debounce_ms=settings.watch.debounce_ms,
+            coalesce_window_ms=settings.watch.coalesce_window_ms,
             hash_stability_check=settings.watch.hash_stability_check,
             reextract_graph=True,
             batch_graph_interval_seconds=settings.watch.batch_graph_interval_seconds,
@@ -1135,7 +1140,11 @@ def watch(ctx: click.Context, with_graph: bool) -> None:
         graph=graph,
         extractor=extractor,
     )
-    watcher = VaultWatcher(config=settings.vault, on_change=handler.handle_change)
+    watcher = VaultWatcher(
+        config=settings.vault,
+        on_change=handler.handle_change,
+        coalesce_window_ms=watch_config.coalesce_window_ms,
+    )
 
     console.print(f"[green]✓[/green] Watching {settings.vault.path}")
     console.print(f"  Debounce: {watch_config.debounce_ms}ms")
@@ -108,6 +108,7 @@ class EmbeddingConfig(BaseSettings):
     dimensions: int = 1536
     batch_size: int = 64
     cache_enabled: bool = True
+    parallel_requests: int = 8  # Concurrent embedding API batches
 
 
 class ChromaConfig(BaseSettings):
@@ -116,6 +117,7 @@ class ChromaConfig(BaseSettings):
     persist_dir: Path = Field(default_factory=lambda: VAULTMIND_HOME / "data" / "chromadb")
     collection_name: str = "vault_chunks"
     distance_fn: Literal["cosine", "l2", "ip"] = "cosine"
+    batch_size: int = 256  # Chunks per embed + upsert batch during full indexing
 
     @field_validator("persist_dir")
     @classmethod
@@ -187,6 +189,7 @@ class WatchConfig(BaseSettings):
     """Incremental watch mode configuration."""
 
     debounce_ms: int = 500
+    coalesce_window_ms: int = 10
     hash_stability_check: bool = True
     reextract_graph: bool = False
     batch_graph_interval_seconds: int = 300
@@ -325,6 +328,7 @@ class AutoTagConfig(BaseSettings):
     max_tags_per_note: int = 2
     min_content_length: int = 100
     tagging_model: str = ""  # Empty = use llm.fast_model
+    max_concurrency: int = 8  # Parallel LLM calls during batch tagging
 
 
 class VoiceConfig(BaseSettings):
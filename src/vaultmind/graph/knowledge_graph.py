@@ -6,11 +6,18 @@ Designed for single-user scale with upgrade path to Neo4j if needed.
 
 from __future__ import annotations
 
-import json
+import gzip
+import heapq
 import logging
+import os
+from collections import deque
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
 import networkx as nx
+import orjson
 
 if TYPE_CHECKING:
     from vaultmind.config import GraphConfig
@@ -30,6 +37,11 @@ EDGE_TYPES = {
     "preceded_by",
 }
 
+# Single-pass lowercase + space-to-underscore for ASCII entity names.
+_NORM_TABLE = str.maketrans(
+    {chr(c): chr(c + 32) for c in range(ord("A"), ord("Z") + 1)} | {" ": "_"}
+)
+
 
 class KnowledgeGraph:
     """Persistent knowledge graph over vault entities."""
@@ -38,12 +50,42 @@ class KnowledgeGraph:
         self.config = config
         self._graph = nx.DiGraph()
         self._load()
+        # Maintained set of degree-0 nodes so orphan queries are O(1)
+        # instead of an O(V) nx.isolates scan on every stats access.
+        self._isolates: set[str] = set(nx.isolates(self._graph))
+        # Mutation counter keyed into the find_path cache: bumping it on any
+        # graph change makes stale entries unreachable without explicit
+        # invalidation (old keys simply age out of the LRU).
+        self._version = 0
+        self._find_path_cached = lru_cache(maxsize=4096)(self._find_path_uncached)
+        # Cached undirected view (no copy); rebuilt lazily when the graph mutates.
+        self._ud: nx.Graph | None = None
+        self._ud_version = -1
+
+    @property
+    def _undirected(self) -> nx.Graph:
+        """Undirected view of the graph, shared by all read-only consumers.
+
+        ``to_undirected(as_view=True)`` is O(1) and copies nothing, unlike the
+        full ``to_undirected()`` materialization the query methods used to
+        build per call.
+        """
+        if self._ud is None or self._ud_version != self._version:
+            self._ud = self._graph.to_undirected(as_view=True)
+            self._ud_version = self._version
+        return self._ud
 
     def _load(self) -> None:
-        """Load graph from JSON file if it exists."""
+        """Load graph from disk if it exists.
+
+        Handles both the current gzip-compressed format (detected via the
+        gzip magic bytes) and legacy uncompressed JSON files.
+        """
         if self.config.persist_path.exists():
-            with open(self.config.persist_path) as f:
-                data = json.load(f)
+            raw = self.config.persist_path.read_bytes()
+            if raw[:2] == b"\x1f\x8b":
+                raw = gzip.decompress(raw)
+            data = orjson.loads(raw)
             self._graph = nx.node_link_graph(data, edges="edges")
             logger.info(
                 "Loaded knowledge graph: %d nodes, %d edges",
@@ -54,11 +96,18 @@ class KnowledgeGraph:
             logger.info("No existing graph found, starting fresh")
 
     def save(self) -> None:
-        """Persist graph to JSON."""
+        """Persist graph as gzip-compressed JSON, atomically.
+
+        Writes to a temp file and ``os.replace``s it over the target so a
+        crash mid-write never leaves a truncated graph behind.
+        """
         self.config.persist_path.parent.mkdir(parents=True, exist_ok=True)
         data = nx.node_link_data(self._graph, edges="edges")
-        with open(self.config.persist_path, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+        blob = orjson.dumps(data, default=str)
+        tmp = self.config.persist_path.with_suffix(".json.tmp")
+        with gzip.open(tmp, "wb", compresslevel=3) as f:
+            f.write(blob)
+        os.replace(tmp, self.config.persist_path)
         logger.debug("Saved graph to %s", self.config.persist_path)
 
     # --- Node operations ---
@@ -72,8 +121,24 @@ class KnowledgeGraph:
         **attrs: Any,
     ) -> None:
         """Add or update an entity node."""
-        node_id = self._normalize(name)
+        self._add_entity_by_id(
+            self._normalize(name), name, entity_type, source_note, confidence, **attrs
+        )
 
+    def _add_entity_by_id(
+        self,
+        node_id: str,
+        name: str,
+        entity_type: str,
+        source_note: str = "",
+        confidence: float = 1.0,
+        **attrs: Any,
+    ) -> None:
+        """Add or update an entity whose node id is already normalized.
+
+        Lets `add_relationship` reuse the ids it computed instead of
+        renormalizing each endpoint.
+        """
         if self._graph.has_node(node_id):
             # Merge: keep highest confidence, accumulate source notes
             existing = self._graph.nodes[node_id]
@@ -92,6 +157,8 @@ class KnowledgeGraph:
                 confidence=confidence,
                 **attrs,
             )
+            self._isolates.add(node_id)
+            self._version += 1
 
     def add_relationship(
         self,
@@ -106,11 +173,11 @@ class KnowledgeGraph:
         src = self._normalize(source)
         tgt = self._normalize(target)
 
-        # Ensure both nodes exist
+        # Ensure both nodes exist (ids already normalized above)
         if not self._graph.has_node(src):
-            self.add_entity(source, "concept", source_note=source_note)
+            self._add_entity_by_id(src, source, "concept", source_note=source_note)
         if not self._graph.has_node(tgt):
-            self.add_entity(target, "concept", source_note=source_note)
+            self._add_entity_by_id(tgt, target, "concept", source_note=source_note)
 
         if self._graph.has_edge(src, tgt):
             existing = self._graph.edges[src, tgt]
@@ -128,6 +195,30 @@ class KnowledgeGraph:
                 confidence=confidence,
                 **attrs,
             )
+            self._isolates.discard(src)
+            self._isolates.discard(tgt)
+            self._version += 1
+
+    def remove_entity(self, node_id: str) -> None:
+        """Remove a node (and its edges), keeping the orphan cache coherent.
+
+        Neighbors whose last edge was removed become orphans.
+        """
+        neighbors = set(chain(self._graph.succ[node_id], self._graph.pred[node_id]))
+        self._graph.remove_node(node_id)
+        self._isolates.discard(node_id)
+        self._version += 1
+        for n in neighbors:
+            if self._graph.degree(n) == 0:
+                self._isolates.add(n)
+
+    def remove_edge(self, src: str, tgt: str) -> None:
+        """Remove an edge, keeping the orphan cache coherent."""
+        self._graph.remove_edge(src, tgt)
+        self._version += 1
+        for n in (src, tgt):
+            if self._graph.degree(n) == 0:
+                self._isolates.add(n)
 
     # --- Query operations ---
 
@@ -170,13 +261,25 @@ class KnowledgeGraph:
                 }
             )
 
-        # Get N-hop neighborhood if depth > 1
+        # Get N-hop neighborhood if depth > 1 — plain BFS over succ/pred
+        # instead of nx.ego_graph, which would copy the whole radius-ball.
         neighbors = []
         if depth > 1:
-            ego = nx.ego_graph(self._graph, node_id, radius=depth, undirected=True)
-            for n in ego.nodes:
-                if n != node_id:
-                    neighbors.append({"id": n, **dict(self._graph.nodes[n])})
+            succ = self._graph.succ
+            pred = self._graph.pred
+            seen = {node_id}
+            frontier = {node_id}
+            for _ in range(depth):
+                nxt: set[str] = set()
+                for u in frontier:
+                    nxt.update(succ[u])
+                    nxt.update(pred[u])
+                nxt -= seen
+                if not nxt:
+                    break
+                seen |= nxt
+                frontier = nxt
+            neighbors = [{"id": n, **dict(self._graph.nodes[n])} for n in seen if n != node_id]
 
         return {
             "entity": entity,
@@ -186,33 +289,162 @@ class KnowledgeGraph:
         }
 
     def find_path(self, source: str, target: str) -> list[str] | None:
-        """Find shortest path between two entities."""
+        """Find shortest path between two entities (ignoring edge direction)."""
         src = self._normalize(source)
         tgt = self._normalize(target)
-        try:
-            path = nx.shortest_path(self._graph.to_undirected(), src, tgt)
-            return [self._graph.nodes[n].get("label", n) for n in path]
-        except (nx.NetworkXNoPath, nx.NodeNotFound):
+        if not self._graph.has_node(src) or not self._graph.has_node(tgt):
             return None
+        path = self._find_path_cached(self._version, src, tgt)
+        if path is None:
+            return None
+        return [self._graph.nodes[n].get("label", n) for n in path]
+
+    def shortest_path_lengths_from(self, source: str, cutoff: int = 4) -> dict[str, int]:
+        """Hop distances from *source* to every entity within *cutoff* hops.
+
+        One single-source BFS (ignoring edge direction, like ``find_path``)
+        replaces a path search per pair: callers scoring many candidates
+        against the same source do a dict lookup per candidate instead.
+        Keys are normalized node ids — run display names through
+        :meth:`normalize` before looking up, matching the normalization
+        ``find_path`` applies to both endpoints. The source itself is
+        included at distance 0. Returns an empty dict when the source is
+        not in the graph.
+        """
+        src = self._normalize(source)
+        if not self._graph.has_node(src):
+            return {}
+
+        succ = self._graph.succ
+        pred = self._graph.pred
+
+        seen = {src}
+        lengths = {src: 0}
+        queue = deque([(src, 0)])
+        while queue:
+            node, dist = queue.popleft()
+            if dist == cutoff:
+                continue
+            next_dist = dist + 1
+            for neighbor in chain(succ[node], pred[node]):
+                if neighbor in seen:
+                    continue
+                seen.add(neighbor)
+                lengths[neighbor] = next_dist
+                queue.append((neighbor, next_dist))
+        return lengths
+
+    def normalize(self, name: str) -> str:
+        """Normalize a display name to the node id used as graph keys."""
+        return self._normalize(name)
+
+    def _find_path_uncached(self, version: int, src: str, tgt: str) -> tuple[str, ...] | None:
+        """BFS body behind the per-instance LRU cache; `version` only keys it."""
+        del version
+        path = self._bidirectional_bfs(src, tgt)
+        return tuple(path) if path is not None else None
+
+    def _bidirectional_bfs(self, src: str, tgt: str) -> list[str] | None:
+        """Bidirectional BFS treating edges as undirected, without copying the graph.
+
+        Expands the smaller frontier each round, so the search touches ~sqrt(V)
+        nodes instead of V for nearby pairs and never materializes
+        ``to_undirected()``.
+        """
+        if src == tgt:
+            return [src]
+
+        succ = self._graph.succ
+        pred = self._graph.pred
+
+        # parent maps double as visited sets for each direction
+        parents_src: dict[str, str | None] = {src: None}
+        parents_tgt: dict[str, str | None] = {tgt: None}
+        frontier_src = [src]
+        frontier_tgt = [tgt]
+
+        while frontier_src and frontier_tgt:
+            # Expand the smaller frontier to keep both searches balanced
+            if len(frontier_src) <= len(frontier_tgt):
+                frontier, parents, others = frontier_src, parents_src, parents_tgt
+                forward = True
+            else:
+                frontier, parents, others = frontier_tgt, parents_tgt, parents_src
+                forward = False
+
+            next_frontier: list[str] = []
+            for node in frontier:
+                for neighbor in chain(succ[node], pred[node]):
+                    if neighbor in parents:
+                        continue
+                    parents[neighbor] = node
+                    if neighbor in others:
+                        return self._merge_paths(neighbor, parents_src, parents_tgt)
+                    next_frontier.append(neighbor)
+
+            if forward:
+                frontier_src = next_frontier
+            else:
+                frontier_tgt = next_frontier
 
-    def get_clusters(self, min_size: int = 3) -> list[list[str]]:
-        """Find connected communities in the graph."""
-        undirected = self._graph.to_undirected()
+        return None
+
+    @staticmethod
+    def _merge_paths(
+        meeting: str,
+        parents_src: dict[str, str | None],
+        parents_tgt: dict[str, str | None],
+    ) -> list[str]:
+        """Stitch the two BFS trees together at the meeting node."""
+        path: list[str] = []
+        node: str | None = meeting
+        while node is not None:
+            path.append(node)
+            node = parents_src[node]
+        path.reverse()
+        node = parents_tgt[meeting]
+        while node is not None:
+            path.append(node)
+            node = parents_tgt[node]
+        return path
+
+    def get_clusters(self, min_size: int = 3, top_n: int | None = None) -> list[list[str]]:
+        """Find connected communities in the graph, largest first.
+
+        Args:
+            min_size: Minimum community size to include.
+            top_n: If given, return only the N largest clusters (partial
+                selection via heapq instead of a full sort).
+        """
+        undirected = self._undirected
         communities = list(nx.connected_components(undirected))
         clusters = [
             [self._graph.nodes[n].get("label", n) for n in comm]
             for comm in communities
             if len(comm) >= min_size
         ]
+        if top_n is not None:
+            return heapq.nlargest(top_n, clusters, key=len)
         return sorted(clusters, key=len, reverse=True)
 
-    def get_bridge_entities(self, top_n: int = 10) -> list[dict[str, Any]]:
-        """Find entities with highest betweenness centrality (bridge nodes)."""
-        if self._graph.number_of_nodes() < 3:
+    # Above this node count, betweenness switches to k-source sampling
+    # (Brandes-Pich); exact betweenness is O(V*E) and prohibitive there.
+    _EXACT_BETWEENNESS_LIMIT = 2000
+
+    def get_bridge_entities(self, top_n: int = 10, *, exact: bool = False) -> list[dict[str, Any]]:
+        """Find entities with highest betweenness centrality (bridge nodes).
+
+        For graphs above ~2000 nodes, centrality is approximated by sampling
+        at most 500 source nodes, which keeps top-N ranking reliable at a
+        fraction of the cost. Pass ``exact=True`` to force the full run.
+        """
+        n = self._graph.number_of_nodes()
+        if n < 3:
             return []
 
-        centrality = nx.betweenness_centrality(self._graph.to_undirected())
-        sorted_nodes = sorted(centrality.items(), key=lambda x: x[1], reverse=True)[:top_n]
+        k = None if exact or n <= self._EXACT_BETWEENNESS_LIMIT else min(500, n)
+        centrality = nx.betweenness_centrality(self._undirected, k=k, seed=42)
+        sorted_nodes = heapq.nlargest(top_n, centrality.items(), key=itemgetter(1))
 
         return [
             {
@@ -232,7 +464,7 @@ class KnowledgeGraph:
         node_id = self._normalize(entity)
         if not self._graph.has_node(node_id):
             return nx.DiGraph()
-        undirected = self._graph.to_undirected()
+        undirected = self._undirected
         ego = nx.ego_graph(undirected, node_id, radius=depth)
         sub = self._graph.subgraph(ego.nodes).copy()
         return sub
@@ -256,7 +488,7 @@ class KnowledgeGraph:
             return []
 
         try:
-            undirected = self._graph.to_undirected()
+            undirected = self._undirected
             all_paths = list(nx.all_simple_paths(undirected, src, tgt, cutoff=max_length))
         except nx.NetworkXNoPath:
             return []
@@ -294,7 +526,7 @@ class KnowledgeGraph:
 
     def get_orphan_entities(self) -> list[dict[str, Any]]:
         """Find entities with no connections (degree 0)."""
-        return [{"id": n, **dict(self._graph.nodes[n])} for n in nx.isolates(self._graph)]
+        return [{"id": n, **dict(self._graph.nodes[n])} for n in sorted(self._isolates)]
 
     # --- Stats ---
 
@@ -306,14 +538,22 @@ class KnowledgeGraph:
             "edges": self._graph.number_of_edges(),
             "density": nx.density(self._graph) if self._graph.number_of_nodes() > 1 else 0,
             "components": nx.number_weakly_connected_components(self._graph),
-            "orphans": len(list(nx.isolates(self._graph))),
+            "orphans": len(self._isolates),
         }
 
     # --- Utilities ---
 
     @staticmethod
+    @lru_cache(maxsize=8192)
     def _normalize(name: str) -> str:
-        """Normalize entity name to a consistent node ID."""
+        """Normalize entity name to a consistent node ID.
+
+        ASCII names take a single-pass translate; non-ASCII names fall back to
+        full Unicode lowercasing. Cached since the same entities recur across
+        notes during bulk ingest.
+        """
+        if name.isascii():
+            return name.strip().translate(_NORM_TABLE)
         return name.strip().lower().replace(" ", "_")
 
     def to_markdown_summary(self) -> str:
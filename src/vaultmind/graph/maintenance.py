@@ -86,19 +86,16 @@ class GraphMaintainer:
         Returns:
             Count of removed nodes.
         """
-        import networkx as nx
-
-        orphans = list(nx.isolates(self._graph._graph))
+        # The graph already tracks degree-0 nodes incrementally, so no
+        # full nx.isolates scan is needed here.
+        nodes = self._graph._graph.nodes
         removed = 0
 
-        for node_id in orphans:
-            if require_no_sources:
-                data = self._graph._graph.nodes[node_id]
-                sources = data.get("source_notes", [])
-                if sources:
-                    continue
+        for node_id in list(self._graph._isolates):
+            if require_no_sources and nodes[node_id].get("source_notes"):
+                continue
 
-            self._graph._graph.remove_node(node_id)
+            self._graph.remove_entity(node_id)
             removed += 1
 
         if removed:
@@ -123,7 +120,7 @@ class GraphMaintainer:
                 continue
 
             if len(sources) == 1:
-                self._graph._graph.remove_edge(u, v)
+                self._graph.remove_edge(u, v)
                 removed += 1
             else:
                 data["source_notes"] = [s for s in sources if s != note_path]
@@ -147,7 +144,7 @@ class GraphMaintainer:
                 continue
 
             if len(sources) == 1:
-                self._graph._graph.remove_node(node_id)
+                self._graph.remove_entity(node_id)
                 removed += 1
             else:
                 data["source_notes"] = [s for s in sources if s != note_path]
@@ -14,12 +14,14 @@ Design choices:
 
 from __future__ import annotations
 
-import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import frontmatter
+import orjson
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -84,6 +86,8 @@ class AutoTagger:
         self,
         note: Note,
         vault_tags: set[str],
+        *,
+        _vocab_str: str | None = None,
     ) -> TagSuggestion | None:
         """Generate tag suggestions for a single note using the LLM.
 
@@ -92,6 +96,8 @@ class AutoTagger:
             vault_tags: Set of tags currently considered "known" vocabulary
                 (existing vault tags plus any caller-supplied approved
                 novel tags).
+            _vocab_str: Preformatted vocabulary string; `suggest_batch` passes
+                this so the sort+join happens once per batch, not per note.
 
         Returns:
             TagSuggestion or None if the note is too short.
@@ -102,9 +108,12 @@ class AutoTagger:
         if len(body) < self._config.min_content_length:
             return None
 
+        if _vocab_str is None:
+            _vocab_str = self._format_vocabulary(vault_tags)
+
         prompt = TAGGING_PROMPT.format(
             max_tags=self._config.max_tags_per_note,
-            vocabulary=", ".join(sorted(vault_tags)) if vault_tags else "(no existing tags)",
+            vocabulary=_vocab_str,
             title=note.title,
             note_type=note.note_type.value,
             current_tags=", ".join(note.tags) if note.tags else "none",
@@ -122,7 +131,7 @@ class AutoTagger:
             if raw.startswith("```"):
                 raw = raw.split("\n", 1)[1].rsplit("```", 1)[0]
 
-            result: dict[str, Any] = json.loads(raw)
+            result: dict[str, Any] = orjson.loads(raw)
             suggested = result.get("tags", [])[: self._config.max_tags_per_note]
             new_tags = result.get("new_tags", [])[:1]
 
@@ -140,7 +149,7 @@ class AutoTagger:
                 new_tags=[t for t in novel if t],
             )
 
-        except (json.JSONDecodeError, IndexError, KeyError) as e:
+        except (ValueError, IndexError, KeyError) as e:
             logger.warning("Failed to parse tagging result for %s: %s", note.title, e)
             return None
         except LLMError as e:
@@ -152,13 +161,29 @@ class AutoTagger:
         notes: list[Note],
         vault_tags: set[str],
     ) -> list[TagSuggestion]:
-        """Generate tag suggestions for multiple notes."""
-        suggestions: list[TagSuggestion] = []
-        for note in notes:
-            result = self.suggest_tags(note, vault_tags)
-            if result and (result.suggested_tags or result.new_tags):
-                suggestions.append(result)
-        return suggestions
+        """Generate tag suggestions for multiple notes.
+
+        Notes are tagged concurrently — each suggestion is an independent LLM
+        round-trip, so a bounded thread pool overlaps the network latency.
+        Result order follows note order.
+        """
+        if not notes:
+            return []
+
+        vocab_str = self._format_vocabulary(vault_tags)
+        workers = min(self._config.max_concurrency, len(notes))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                partial(self.suggest_tags, vault_tags=vault_tags, _vocab_str=vocab_str),
+                notes,
+            )
+
+        return [r for r in results if r and (r.suggested_tags or r.new_tags)]
+
+    @staticmethod
+    def _format_vocabulary(vault_tags: set[str]) -> str:
+        """Render the tag vocabulary for prompt interpolation."""
+        return ", ".join(sorted(vault_tags)) if vault_tags else "(no existing tags)"
 
     def apply_tags(self, note_path: Path, tags: list[str]) -> None:
         """Write tags to a note's frontmatter.
@@ -7,12 +7,21 @@ indexed.
 
 from __future__ import annotations
 
+import heapq
 import html
+import io
 import logging
+import os
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
+from functools import cached_property
 from typing import TYPE_CHECKING
 
+import numpy as np
+import orjson
+
+from vaultmind.indexer.embedder import truncate_for_embedding
+
 if TYPE_CHECKING:
     from pathlib import Path
 
@@ -31,6 +40,19 @@ logger = logging.getLogger(__name__)
 _CONNECTION_DEFAULT_LOW_DISTANCE = 0.15  # similarity ≥ 0.85
 _CONNECTION_DEFAULT_HIGH_DISTANCE = 0.30  # similarity ≥ 0.70
 
+# Shared sentinel for notes without wikilinks — avoids allocating a fresh
+# empty set per membership check in the connection filter.
+_EMPTY_LINKS: frozenset[str] = frozenset()
+
+# Persisted trending counts from the last run; today's "previous" window is
+# yesterday's "current" window, so the counts carry over between runs.
+_TRENDING_STATE_FILE = ".trending_state.json"
+
+# Reuse persisted counts only when the saved window start lines up with this
+# run's previous window (digests run on a fixed cron cadence; an hour of
+# drift covers clock jitter without accepting stale state).
+_TRENDING_STATE_TOLERANCE = timedelta(hours=1)
+
 
 @dataclass
 class TrendingEntity:
@@ -74,6 +96,16 @@ class DigestReport:
     skim_pending: list[str] = field(default_factory=list)
     skim_pending_count: int = 0
 
+    @cached_property
+    def escaped_orphan_notes(self) -> list[str]:
+        """Orphan titles HTML-escaped once, shared across output sinks.
+
+        The orphan list is the only section rendered in full (it can run to
+        thousands of titles); escaping lazily and memoizing means emitting
+        the digest to both Telegram and a file scans each title once.
+        """
+        return list(map(html.escape, self.orphan_notes))
+
 
 class DigestGenerator:
     """Generates a vault digest report from metadata, graph stats, and ChromaDB queries.
@@ -96,6 +128,9 @@ class DigestGenerator:
         self._config = config
         self._gap_store = gap_store
         self._review_queue = review_queue
+        # One os.stat per file per digest run — mtime/ctime are read for the
+        # same note by several analyses, and each stat is a syscall.
+        self._stat_cache: dict[Path, os.stat_result | None] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -103,6 +138,7 @@ class DigestGenerator:
 
     def generate(self) -> DigestReport:
         """Generate a digest report for the configured period."""
+        self._stat_cache.clear()
         now = datetime.now(tz=UTC)
         period_start = now - timedelta(days=self._config.period_days)
         prev_start = period_start - timedelta(days=self._config.period_days)
@@ -111,7 +147,13 @@ class DigestGenerator:
 
         new_notes: list[str] = []
         modified_notes: list[str] = []
+        mtime_by_path: dict[str, datetime] = {}
+        mtime_by_title: dict[str, datetime] = {}
+        wikilink_map: dict[str, frozenset[str]] = {}
 
+        # Single pass over the vault: activity classification, the trending
+        # mtime lookup tables, and the wikilink map all come from one walk
+        # instead of each analysis re-iterating the note list.
         for note in notes:
             mtime = self._file_mtime(note.path)
             ctime = self._file_ctime(note.path)
@@ -121,16 +163,22 @@ class DigestGenerator:
             elif mtime is not None and mtime >= period_start:
                 modified_notes.append(note.title)
 
+            if mtime is not None:
+                mtime_by_path[str(note.path)] = mtime
+                mtime_by_title.setdefault(note.title, mtime)
+
+            wikilink_map[note.title] = frozenset(note.wikilinks)
+
         # Trending entities: compare current window vs previous window
-        trending = self._compute_trending(notes, period_start, prev_start)
+        trending = self._compute_trending(mtime_by_path, mtime_by_title, period_start, prev_start)
 
         # Suggested connections for notes active in the period
         active_titles = set(new_notes) | set(modified_notes)
         active_notes = [n for n in notes if n.title in active_titles]
-        suggested = self._compute_suggested_connections(active_notes, notes)
+        suggested = self._compute_suggested_connections(active_notes, wikilink_map)
 
         # Orphan notes: notes with zero wikilinks in or out
-        orphan_notes = self._compute_orphans(notes)
+        orphan_notes = self._compute_orphans(wikilink_map)
 
         # Inbox triage: notes still sitting in inbox
         inbox_notes, oldest_inbox_note, oldest_inbox_age_days = self._compute_inbox_triage(notes)
@@ -180,7 +228,11 @@ class DigestGenerator:
         )
 
     def format_telegram(self, report: DigestReport) -> str:
-        """Format the report as a Telegram HTML message."""
+        """Format the report as a Telegram HTML message.
+
+        Writes into a single ``io.StringIO`` buffer instead of accumulating a
+        list of line strings and joining at the end.
+        """
         date_str = report.generated_at.strftime("%Y-%m-%d")
 
         if (
@@ -198,82 +250,75 @@ class DigestGenerator:
                 f"<i>No activity in the last {report.period_days} days.</i>"
             )
 
-        lines: list[str] = [f"<b>📊 Daily Digest — {date_str}</b>"]
+        buf = io.StringIO()
+        w = buf.write
+        w(f"<b>📊 Daily Digest — {date_str}</b>\n")
 
         # Activity section
         if report.new_notes or report.modified_notes:
-            lines.append("")
-            lines.append("<b>📝 Activity</b>")
+            w("\n<b>📝 Activity</b>\n")
             activity_parts: list[str] = []
             if report.new_notes:
                 activity_parts.append(f"{len(report.new_notes)} new notes")
             if report.modified_notes:
                 activity_parts.append(f"{len(report.modified_notes)} modified")
-            lines.append("• " + ", ".join(activity_parts))
+            w("• " + ", ".join(activity_parts) + "\n")
 
         # Trending topics
         if report.trending_entities:
-            lines.append("")
-            lines.append("<b>🔥 Trending Topics</b>")
+            w("\n<b>🔥 Trending Topics</b>\n")
             for entity in report.trending_entities[: self._config.max_trending]:
-                name = html.escape(entity.name)
-                lines.append(f"• {name} (+{entity.delta} mentions)")
+                w(f"• {html.escape(entity.name)} (+{entity.delta} mentions)\n")
 
         # Suggested connections
         if report.suggested_connections:
-            lines.append("")
-            lines.append("<b>🔗 Suggested Connections</b>")
+            w("\n<b>🔗 Suggested Connections</b>\n")
             for conn in report.suggested_connections[: self._config.max_suggestions]:
                 note_a = html.escape(conn.note_a)
                 note_b = html.escape(conn.note_b)
                 pct = int(conn.similarity * 100)
-                lines.append(f"• {note_a} ↔ {note_b} ({pct}%)")
+                w(f"• {note_a} ↔ {note_b} ({pct}%)\n")
 
         # Orphan notes
         if report.orphan_notes:
-            lines.append("")
-            lines.append("<b>🏝 Orphan Notes</b>")
-            for title in report.orphan_notes:
-                lines.append(f"• {html.escape(title)} (no links)")
+            w("\n<b>🏝 Orphan Notes</b>\n")
+            for title in report.escaped_orphan_notes:
+                w(f"• {title} (no links)\n")
 
         # Inbox triage
         if report.inbox_count:
-            lines.append("")
-            lines.append("<b>📥 Inbox Triage</b>")
-            lines.append(f"• {report.inbox_count} notes awaiting processing")
+            w("\n<b>📥 Inbox Triage</b>\n")
+            w(f"• {report.inbox_count} notes awaiting processing\n")
             if report.oldest_inbox_age_days > self._config.inbox_age_warning_days:
                 oldest = html.escape(report.oldest_inbox_note)
-                lines.append(f"• ⚠️ Oldest: {oldest} ({report.oldest_inbox_age_days} days)")
+                w(f"• ⚠️ Oldest: {oldest} ({report.oldest_inbox_age_days} days)\n")
             for title in report.inbox_notes[: self._config.max_inbox_shown]:
-                lines.append(f"• {html.escape(title)}")
+                w(f"• {html.escape(title)}\n")
 
         # Knowledge gaps
         if report.open_gap_count:
-            lines.append("")
-            lines.append("<b>❓ Knowledge Gaps</b>")
-            lines.append(f"• {report.open_gap_count} open gap(s)")
+            w("\n<b>❓ Knowledge Gaps</b>\n")
+            w(f"• {report.open_gap_count} open gap(s)\n")
             if report.oldest_gap_question:
                 question = html.escape(report.oldest_gap_question)
-                lines.append(f"• Oldest: {question} ({report.oldest_gap_age_days} days)")
+                w(f"• Oldest: {question} ({report.oldest_gap_age_days} days)\n")
 
         # Pending review (SKIM lane) — batched autonomy proposals, one-tap
         # approve-all via the bot's /review command.
         if report.skim_pending_count:
-            lines.append("")
-            lines.append("<b>\U0001f4e5 Pending Review</b>")
-            lines.append(f"• {report.skim_pending_count} SKIM item(s) — see /review")
+            w("\n<b>\U0001f4e5 Pending Review</b>\n")
+            w(f"• {report.skim_pending_count} SKIM item(s) — see /review\n")
             for summary in report.skim_pending[:5]:
-                lines.append(f"• {html.escape(summary)}")
+                w(f"• {html.escape(summary)}\n")
 
         # Footer
-        lines.append("")
-        lines.append(
-            f"<i>Period: last {report.period_days} days"
+        w(
+            f"\n<i>Period: last {report.period_days} days"
             f" • {report.total_notes} total notes"
             f" • {report.total_entities} entities</i>"
         )
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def save_to_vault(self, report: DigestReport, vault_root: Path) -> Path:
         """Write the digest as a markdown file to {vault_root}/_meta/digests/YYYY-MM-DD.md."""
@@ -291,30 +336,85 @@ class DigestGenerator:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _stat(self, rel_path: Path) -> os.stat_result | None:
+        """Stat a vault file once per digest run, memoized."""
+        if rel_path in self._stat_cache:
+            return self._stat_cache[rel_path]
+        try:
+            result: os.stat_result | None = os.stat(self._parser.vault_root / rel_path)
+        except OSError:
+            result = None
+        self._stat_cache[rel_path] = result
+        return result
+
     def _file_mtime(self, rel_path: Path) -> datetime | None:
         """Return mtime of a vault file as timezone-aware UTC datetime."""
-        abs_path = self._parser.vault_root / rel_path
-        if not abs_path.exists():
+        st = self._stat(rel_path)
+        if st is None:
             return None
-        return datetime.fromtimestamp(abs_path.stat().st_mtime, tz=UTC)
+        return datetime.fromtimestamp(st.st_mtime, tz=UTC)
 
     def _file_ctime(self, rel_path: Path) -> datetime | None:
         """Return ctime (creation time on most systems) as timezone-aware UTC datetime."""
-        abs_path = self._parser.vault_root / rel_path
-        if not abs_path.exists():
+        st = self._stat(rel_path)
+        if st is None:
+            return None
+        return datetime.fromtimestamp(st.st_ctime, tz=UTC)
+
+    @property
+    def _trending_state_path(self) -> Path:
+        return self._parser.vault_root / "_meta" / "digests" / _TRENDING_STATE_FILE
+
+    def _load_trending_state(self, prev_start: datetime) -> dict[str, int] | None:
+        """Load the previous window's counts persisted by the last run.
+
+        Returns None when the state file is missing, unreadable, or was
+        written for a window that does not match this run's previous window.
+        """
+        try:
+            data = orjson.loads(self._trending_state_path.read_bytes())
+            saved_start = datetime.fromisoformat(data["period_start"])
+            counts: dict[str, int] = data["counts"]
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+            return None
+        if abs(saved_start - prev_start) > _TRENDING_STATE_TOLERANCE:
             return None
-        return datetime.fromtimestamp(abs_path.stat().st_ctime, tz=UTC)
+        return counts
+
+    def _save_trending_state(self, period_start: datetime, current: dict[str, int]) -> None:
+        """Persist this run's counts so the next run skips the previous-window scan."""
+        path = self._trending_state_path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            blob = orjson.dumps({"period_start": period_start.isoformat(), "counts": current})
+            tmp = path.with_suffix(".json.tmp")
+            tmp.write_bytes(blob)
+            os.replace(tmp, path)
+        except OSError:
+            logger.warning("Could not persist trending state to %s", path)
 
     def _compute_trending(
         self,
-        notes: list[Note],
+        mtime_by_path: dict[str, datetime],
+        mtime_by_title: dict[str, datetime],
         period_start: datetime,
         prev_start: datetime,
     ) -> list[TrendingEntity]:
-        """Compare entity mention counts between current and previous window."""
+        """Compare entity mention counts between current and previous window.
+
+        Graph source_notes entries are resolved against the prebuilt mtime
+        lookup tables (by path, or title for older graphs) in O(1).
+
+        The previous window's counts are loaded from the state file written
+        by the last run when its window lines up; only when the state is
+        missing or stale does the scan rebuild both windows.
+        """
         # Build per-window mention counts from graph node source_notes
         current: dict[str, int] = {}
-        previous: dict[str, int] = {}
+        previous = self._load_trending_state(prev_start)
+        rebuild_previous = previous is None
+        if previous is None:
+            previous = {}
 
         for node_id in self._graph._graph.nodes:
             data = self._graph._graph.nodes[node_id]
@@ -322,15 +422,16 @@ class DigestGenerator:
             source_notes: list[str] = data.get("source_notes", [])
 
             for source_path in source_notes:
-                # Resolve mtime for the source note path
-                mtime = self._source_note_mtime(source_path, notes)
+                mtime = mtime_by_path.get(source_path) or mtime_by_title.get(source_path)
                 if mtime is None:
                     continue
                 if mtime >= period_start:
                     current[label] = current.get(label, 0) + 1
-                elif mtime >= prev_start:
+                elif rebuild_previous and mtime >= prev_start:
                     previous[label] = previous.get(label, 0) + 1
 
+        self._save_trending_state(period_start, current)
+
         trending: list[TrendingEntity] = []
         for entity, cur_count in current.items():
             prev_count = previous.get(entity, 0)
@@ -345,65 +446,74 @@ class DigestGenerator:
                     )
                 )
 
-        trending.sort(key=lambda e: e.delta, reverse=True)
-        return trending[: self._config.max_trending]
-
-    def _source_note_mtime(self, source_path: str, notes: list[Note]) -> datetime | None:
-        """Get mtime for a graph source note path string."""
-        # source_path is stored as the relative path string
-        for note in notes:
-            if str(note.path) == source_path or note.title == source_path:
-                return self._file_mtime(note.path)
-        return None
+        # Top-K via a K-sized heap — O(N log K) vs a full sort when the
+        # candidate list is much larger than max_trending.
+        return heapq.nlargest(self._config.max_trending, trending, key=lambda e: e.delta)
 
     def _compute_suggested_connections(
         self,
         active_notes: list[Note],
-        all_notes: list[Note],
+        wikilink_map: dict[str, frozenset[str]],
     ) -> list[SuggestedConnection]:
-        """Find high-similarity unlinked pairs for notes active in the period."""
-        # Build wikilink map: note title → set of titles it links to
-        wikilink_map: dict[str, set[str]] = {}
-        for note in all_notes:
-            wikilink_map[note.title] = set(note.wikilinks)
+        """Find high-similarity unlinked pairs for notes active in the period.
 
+        Args:
+            active_notes: Notes created/modified in the period.
+            wikilink_map: Note title → set of titles it links to, built once
+                in ``generate()``.
+        """
         low_dist = 1.0 - self._config.connection_threshold_high
         high_dist = 1.0 - self._config.connection_threshold_low
 
         seen_pairs: set[frozenset[str]] = set()
         suggestions: list[SuggestedConnection] = []
 
+        # One batched embed + Chroma query for all active notes instead of a
+        # per-note search round-trip.
+        queried_notes: list[Note] = []
+        queries: list[str] = []
         for note in active_notes:
             body = note.body_without_frontmatter().strip()
-            if not body:
+            if body:
+                queried_notes.append(note)
+                queries.append(truncate_for_embedding(body))
+
+        batched_results = self._store.search_batch(queries, n_results=20)
+
+        for note, raw_results in zip(queried_notes, batched_results, strict=True):
+            if not raw_results:
                 continue
 
-            raw_results = self._store.search(
-                query=body[:2000],
-                n_results=20,
+            source_links = wikilink_map.get(note.title, _EMPTY_LINKS)
+
+            # Vectorized band filter: one NumPy pass over the distance array
+            # replaces a Python comparison per hit.
+            distances = np.fromiter(
+                (hit.get("distance", 1.0) for hit in raw_results),
+                dtype=np.float64,
+                count=len(raw_results),
             )
+            in_band = np.nonzero((distances >= low_dist) & (distances <= high_dist))[0]
 
-            for hit in raw_results:
+            for i in in_band:
+                hit = raw_results[i]
                 meta = hit.get("metadata", {})
                 hit_path = meta.get("note_path", "")
                 hit_title = meta.get("note_title", "Untitled")
-                distance = hit.get("distance", 1.0)
+                distance = distances[i]
 
                 if hit_path == str(note.path):
                     continue
 
-                if distance < low_dist or distance > high_dist:
-                    continue
-
                 pair = frozenset([note.title, hit_title])
                 if pair in seen_pairs:
                     continue
                 seen_pairs.add(pair)
 
                 # Skip if already linked in either direction
-                if hit_title in wikilink_map.get(note.title, set()):
+                if hit_title in source_links:
                     continue
-                if note.title in wikilink_map.get(hit_title, set()):
+                if note.title in wikilink_map.get(hit_title, _EMPTY_LINKS):
                     continue
 
                 similarity = round(1.0 - distance, 4)
@@ -415,8 +525,7 @@ class DigestGenerator:
                     )
                 )
 
-        suggestions.sort(key=lambda c: c.similarity, reverse=True)
-        return suggestions[: self._config.max_suggestions]
+        return heapq.nlargest(self._config.max_suggestions, suggestions, key=lambda c: c.similarity)
 
     def _compute_inbox_triage(
         self,
@@ -452,139 +561,125 @@ class DigestGenerator:
         titles = [title for _, title in inbox]
         return titles, oldest_title, oldest_age_days
 
-    def _compute_orphans(self, notes: list[Note]) -> list[str]:
+    def _compute_orphans(self, wikilink_map: dict[str, frozenset[str]]) -> list[str]:
         """Find notes with zero wikilinks in or out across all vault notes."""
-        # Build a set of all note titles
-        all_titles = {note.title for note in notes}
+        all_titles = wikilink_map.keys()
 
-        # Build outgoing links per note
-        outgoing: dict[str, set[str]] = {}
-        incoming: dict[str, set[str]] = {}
+        # Orphanhood only needs in/out degree counts, not full adjacency
+        # sets — two int counters per title instead of set churn per link.
+        in_deg: dict[str, int] = dict.fromkeys(all_titles, 0)
+        out_deg: dict[str, int] = {}
 
-        for note in notes:
-            outgoing[note.title] = set()
-            for link in note.wikilinks:
+        for title, links in wikilink_map.items():
+            count = 0
+            for link in links:
                 # Match against known titles (exact match)
-                if link in all_titles:
-                    outgoing[note.title].add(link)
-                    incoming.setdefault(link, set()).add(note.title)
+                if link in in_deg:
+                    count += 1
+                    in_deg[link] += 1
+            out_deg[title] = count
 
-        orphans: list[str] = []
-        for note in notes:
-            has_out = bool(outgoing.get(note.title))
-            has_in = bool(incoming.get(note.title))
-            if not has_out and not has_in:
-                orphans.append(note.title)
-
-        return sorted(orphans)
+        return sorted(t for t in all_titles if in_deg[t] == 0 and out_deg[t] == 0)
 
     def _format_markdown(self, report: DigestReport) -> str:
-        """Format the report as a markdown document with frontmatter."""
+        """Format the report as a markdown document with frontmatter.
+
+        Streams into one ``io.StringIO`` buffer rather than joining a list of
+        per-line strings.
+        """
         date_str = report.generated_at.strftime("%Y-%m-%d")
         generated_iso = report.generated_at.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        lines: list[str] = [
-            "---",
-            f"title: Daily Digest — {date_str}",
-            f"date: {date_str}",
-            "tags: [digest, auto-generated]",
-            "type: digest",
-            f"generated_at: {generated_iso}",
-            f"period_days: {report.period_days}",
-            "---",
-            "",
-            f"# Daily Digest — {date_str}",
-            "",
-        ]
+        buf = io.StringIO()
+        w = buf.write
+        w(
+            f"---\n"
+            f"title: Daily Digest — {date_str}\n"
+            f"date: {date_str}\n"
+            f"tags: [digest, auto-generated]\n"
+            f"type: digest\n"
+            f"generated_at: {generated_iso}\n"
+            f"period_days: {report.period_days}\n"
+            f"---\n"
+            f"\n"
+            f"# Daily Digest — {date_str}\n"
+            f"\n"
+        )
 
         # Activity
         if report.new_notes or report.modified_notes:
-            lines.append("## Activity")
-            lines.append("")
+            w("## Activity\n\n")
             if report.new_notes:
-                lines.append(f"**New notes ({len(report.new_notes)})**")
-                lines.append("")
+                w(f"**New notes ({len(report.new_notes)})**\n\n")
                 for title in report.new_notes:
-                    lines.append(f"- {title}")
-                lines.append("")
+                    w(f"- {title}\n")
+                w("\n")
             if report.modified_notes:
-                lines.append(f"**Modified notes ({len(report.modified_notes)})**")
-                lines.append("")
+                w(f"**Modified notes ({len(report.modified_notes)})**\n\n")
                 for title in report.modified_notes:
-                    lines.append(f"- {title}")
-                lines.append("")
+                    w(f"- {title}\n")
+                w("\n")
 
         # Trending entities
         if report.trending_entities:
-            lines.append("## Trending Topics")
-            lines.append("")
+            w("## Trending Topics\n\n")
             for entity in report.trending_entities:
-                lines.append(f"- **{entity.name}** (+{entity.delta} mentions)")
-            lines.append("")
+                w(f"- **{entity.name}** (+{entity.delta} mentions)\n")
+            w("\n")
 
         # Suggested connections
         if report.suggested_connections:
-            lines.append("## Suggested Connections")
-            lines.append("")
+            w("## Suggested Connections\n\n")
             for conn in report.suggested_connections:
                 pct = int(conn.similarity * 100)
-                lines.append(f"- [[{conn.note_a}]] ↔ [[{conn.note_b}]] ({pct}% similarity)")
-            lines.append("")
+                w(f"- [[{conn.note_a}]] ↔ [[{conn.note_b}]] ({pct}% similarity)\n")
+            w("\n")
 
         # Orphan notes
         if report.orphan_notes:
-            lines.append("## Orphan Notes")
-            lines.append("")
+            w("## Orphan Notes\n\n")
             for title in report.orphan_notes:
-                lines.append(f"- [[{title}]]")
-            lines.append("")
+                w(f"- [[{title}]]\n")
+            w("\n")
 
         # Inbox triage
         if report.inbox_count:
-            lines.append("## Inbox Triage")
-            lines.append("")
-            lines.append(f"**{report.inbox_count} notes awaiting processing**")
-            lines.append("")
+            w("## Inbox Triage\n\n")
+            w(f"**{report.inbox_count} notes awaiting processing**\n\n")
             if report.oldest_inbox_age_days > self._config.inbox_age_warning_days:
-                lines.append(
+                w(
                     f"> ⚠️ Oldest: **{report.oldest_inbox_note}**"
-                    f" ({report.oldest_inbox_age_days} days)"
+                    f" ({report.oldest_inbox_age_days} days)\n\n"
                 )
-                lines.append("")
             for title in report.inbox_notes[: self._config.max_inbox_shown]:
-                lines.append(f"- [[{title}]]")
-            lines.append("")
+                w(f"- [[{title}]]\n")
+            w("\n")
 
         # Knowledge gaps
         if report.open_gap_count:
-            lines.append("## Knowledge Gaps")
-            lines.append("")
-            lines.append(f"**{report.open_gap_count} open gap(s)**")
-            lines.append("")
+            w("## Knowledge Gaps\n\n")
+            w(f"**{report.open_gap_count} open gap(s)**\n\n")
             if report.oldest_gap_question:
-                lines.append(
+                w(
                     f"> Oldest: **{report.oldest_gap_question}**"
-                    f" ({report.oldest_gap_age_days} days)"
+                    f" ({report.oldest_gap_age_days} days)\n\n"
                 )
-                lines.append("")
 
         # Pending review (SKIM lane)
         if report.skim_pending_count:
-            lines.append("## Pending Review")
-            lines.append("")
-            lines.append(f"**{report.skim_pending_count} SKIM item(s)** — see `/review`")
-            lines.append("")
+            w("## Pending Review\n\n")
+            w(f"**{report.skim_pending_count} SKIM item(s)** — see `/review`\n\n")
             for summary in report.skim_pending:
-                lines.append(f"- {summary}")
-            lines.append("")
+                w(f"- {summary}\n")
+            w("\n")
 
         # Stats footer
-        lines.append("---")
-        lines.append("")
-        lines.append(
+        w(
+            f"---\n"
+            f"\n"
             f"*{report.total_notes} total notes — "
             f"{report.total_entities} entities — "
             f"last {report.period_days} days*"
         )
 
-        return "\n".join(lines)
+        return buf.getvalue()
@@ -21,9 +21,15 @@ import asyncio
 import logging
 from dataclasses import dataclass
 from enum import StrEnum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from vaultmind.indexer.embedder import truncate_for_embedding
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from vaultmind.config import DuplicateDetectionConfig
     from vaultmind.indexer.store import VaultStore
     from vaultmind.vault.events import NoteCreatedEvent, NoteModifiedEvent
@@ -61,6 +67,77 @@ class DuplicateMatch:
     shared_heading: str = ""
 
 
+# match_type column encoding — index into this tuple is the stored uint8
+_MATCH_TYPES: tuple[MatchType, ...] = (MatchType.DUPLICATE, MatchType.MERGE)
+_MATCH_TYPE_CODES = {mt: np.uint8(i) for i, mt in enumerate(_MATCH_TYPES)}
+
+
+class _MatchTable:
+    """Columnar (struct-of-arrays) storage for one note's matches.
+
+    After a vault scan thousands of matches stay resident in ``_results``;
+    parallel columns keep that set compact (similarity as float32, match
+    type as uint8) and make cross-note filters a single vectorized
+    comparison. ``DuplicateMatch`` rows are materialized only on iteration.
+    """
+
+    __slots__ = (
+        "source_path",
+        "source_title",
+        "match_paths",
+        "match_titles",
+        "similarities",
+        "match_types",
+        "shared_headings",
+    )
+
+    def __init__(
+        self,
+        source_path: str,
+        source_title: str,
+        match_paths: list[str],
+        match_titles: list[str],
+        similarities: list[float] | np.ndarray,
+        match_types: list[np.uint8] | np.ndarray,
+        shared_headings: list[str],
+    ) -> None:
+        self.source_path = source_path
+        self.source_title = source_title
+        self.match_paths = match_paths
+        self.match_titles = match_titles
+        self.similarities = np.asarray(similarities, dtype=np.float32)
+        self.match_types = np.asarray(match_types, dtype=np.uint8)
+        self.shared_headings = shared_headings
+
+    @classmethod
+    def from_matches(cls, matches: list[DuplicateMatch]) -> _MatchTable:
+        """Build a table from materialized rows (all same source note)."""
+        return cls(
+            source_path=matches[0].source_path,
+            source_title=matches[0].source_title,
+            match_paths=[m.match_path for m in matches],
+            match_titles=[m.match_title for m in matches],
+            similarities=[m.similarity for m in matches],
+            match_types=[_MATCH_TYPE_CODES[m.match_type] for m in matches],
+            shared_headings=[m.shared_heading for m in matches],
+        )
+
+    def __len__(self) -> int:
+        return len(self.match_paths)
+
+    def __iter__(self) -> Iterator[DuplicateMatch]:
+        for i, match_path in enumerate(self.match_paths):
+            yield DuplicateMatch(
+                source_path=self.source_path,
+                source_title=self.source_title,
+                match_path=match_path,
+                match_title=self.match_titles[i],
+                similarity=float(self.similarities[i]),
+                match_type=_MATCH_TYPES[self.match_types[i]],
+                shared_heading=self.shared_headings[i],
+            )
+
+
 # ---------------------------------------------------------------------------
 # Detector
 # ---------------------------------------------------------------------------
@@ -80,8 +157,12 @@ class DuplicateDetector:
         self._config = config
         self._store = store
 
-        # In-memory results buffer — most recent per source path
-        self._results: dict[str, list[DuplicateMatch]] = {}
+        # In-memory results buffer — most recent per source path, stored
+        # columnar; rows materialize on access.
+        self._results: dict[str, _MatchTable] = {}
+        # Last-seen body hash per note path; modify events that didn't change
+        # the body (frontmatter tweaks, touch) skip the Chroma query entirely.
+        self._body_hash: dict[str, str] = {}
 
     # ------------------------------------------------------------------
     # Core detection
@@ -103,17 +184,53 @@ class DuplicateDetector:
         if len(body) < self._config.min_content_length:
             return []
 
+        # Unchanged body since last detection → cached matches still hold
+        body_hash = note.body_hash
+        if self._body_hash.get(str(note.path)) == body_hash:
+            return self.get_results(str(note.path))
+
         # Query more results than needed to account for self-chunks
         raw_results = self._store.search(
-            query=body[:2000],  # cap query length for embedding
+            query=truncate_for_embedding(body),
             n_results=max_results + 10,
         )
+        # Recorded only once the query succeeded — committing it before
+        # would route every retry after a transient store failure through
+        # the unchanged-body fast path above, serving stale results.
+        self._body_hash[str(note.path)] = body_hash
+        return self._collect_matches(note, raw_results, max_results=max_results)
 
+    def _collect_matches(
+        self,
+        note: Note,
+        raw_results: list[dict[str, Any]],
+        *,
+        max_results: int,
+    ) -> list[DuplicateMatch]:
+        """Filter raw search hits into a columnar match table and cache it."""
         note_path = str(note.path)
         seen_paths: set[str] = set()
-        matches: list[DuplicateMatch] = []
 
-        for hit in raw_results:
+        match_paths: list[str] = []
+        match_titles: list[str] = []
+        similarities: list[float] = []
+        match_types: list[np.uint8] = []
+        shared_headings: list[str] = []
+
+        if not raw_results:
+            return []
+
+        # Vectorized band filter: mask out sub-merge-threshold hits in one
+        # NumPy pass before any per-hit Python work.
+        distances = np.fromiter(
+            (hit.get("distance", 1.0) for hit in raw_results),
+            dtype=np.float64,
+            count=len(raw_results),
+        )
+        in_band = np.nonzero(distances <= _MERGE_MAX_DISTANCE)[0]
+
+        for i in in_band:
+            hit = raw_results[i]
             meta = hit.get("metadata", {})
             hit_path = meta.get("note_path", "")
 
@@ -122,42 +239,78 @@ class DuplicateDetector:
                 continue
             seen_paths.add(hit_path)
 
-            distance = hit.get("distance", 1.0)
-            similarity = 1.0 - distance
+            distance = float(distances[i])
 
             if distance <= _DUPLICATE_MAX_DISTANCE:
                 match_type = MatchType.DUPLICATE
-            elif distance <= _MERGE_MAX_DISTANCE:
-                match_type = MatchType.MERGE
             else:
-                continue  # below merge threshold
+                match_type = MatchType.MERGE
 
-            matches.append(
-                DuplicateMatch(
-                    source_path=note_path,
-                    source_title=note.title,
-                    match_path=hit_path,
-                    match_title=meta.get("note_title", "Untitled"),
-                    similarity=round(similarity, 4),
-                    match_type=match_type,
-                    shared_heading=meta.get("heading", ""),
-                )
-            )
+            match_paths.append(hit_path)
+            match_titles.append(meta.get("note_title", "Untitled"))
+            similarities.append(round(1.0 - distance, 4))
+            match_types.append(_MATCH_TYPE_CODES[match_type])
+            shared_headings.append(meta.get("heading", ""))
 
-            if len(matches) >= max_results:
+            if len(match_paths) >= max_results:
                 break
 
+        if not match_paths:
+            return []
+
         # Store results for later retrieval
-        if matches:
-            self._results[note_path] = matches
-            logger.info(
-                "Duplicates for %s: %d duplicate, %d merge",
-                note.title,
-                sum(1 for m in matches if m.match_type == MatchType.DUPLICATE),
-                sum(1 for m in matches if m.match_type == MatchType.MERGE),
-            )
+        table = _MatchTable(
+            source_path=note_path,
+            source_title=note.title,
+            match_paths=match_paths,
+            match_titles=match_titles,
+            similarities=similarities,
+            match_types=match_types,
+            shared_headings=shared_headings,
+        )
+        self._results[note_path] = table
+        dup_count = int(
+            np.count_nonzero(table.match_types == _MATCH_TYPE_CODES[MatchType.DUPLICATE])
+        )
+        logger.info(
+            "Duplicates for %s: %d duplicate, %d merge",
+            note.title,
+            dup_count,
+            len(table) - dup_count,
+        )
+
+        return list(table)
 
-        return matches
+    @staticmethod
+    def _propagate_matches(
+        rep: Note,
+        rep_matches: list[DuplicateMatch],
+        member: Note,
+    ) -> list[DuplicateMatch]:
+        """Rewrite a cluster representative's matches for an identical member.
+
+        A hit pointing at the member itself is redirected at the
+        representative (they have the same body, so the similarity holds).
+        """
+        member_path = str(member.path)
+        rewritten: list[DuplicateMatch] = []
+        for m in rep_matches:
+            if m.match_path == member_path:
+                match_path, match_title = m.source_path, rep.title
+            else:
+                match_path, match_title = m.match_path, m.match_title
+            rewritten.append(
+                DuplicateMatch(
+                    source_path=member_path,
+                    source_title=member.title,
+                    match_path=match_path,
+                    match_title=match_title,
+                    similarity=m.similarity,
+                    match_type=m.match_type,
+                    shared_heading=m.shared_heading,
+                )
+            )
+        return rewritten
 
     # ------------------------------------------------------------------
     # Event bus integration
@@ -183,11 +336,23 @@ class DuplicateDetector:
 
     def get_results(self, note_path: str) -> list[DuplicateMatch]:
         """Retrieve cached detection results for a note path."""
-        return self._results.get(note_path, [])
+        table = self._results.get(note_path)
+        return list(table) if table is not None else []
 
     def get_all_results(self) -> dict[str, list[DuplicateMatch]]:
         """All cached results, keyed by source note path."""
-        return dict(self._results)
+        return {path: list(table) for path, table in self._results.items()}
+
+    def count_by_type(self, match_type: MatchType) -> int:
+        """Total cached matches of one type, across every note.
+
+        One concatenated uint8 comparison over the stored columns instead
+        of materializing and attribute-walking every match object.
+        """
+        if not self._results:
+            return 0
+        codes = np.concatenate([t.match_types for t in self._results.values()])
+        return int(np.count_nonzero(codes == _MATCH_TYPE_CODES[match_type]))
 
     def clear_results(self, note_path: str | None = None) -> None:
         """Clear cached results. If *note_path* is None, clear all."""
@@ -211,12 +376,43 @@ class DuplicateDetector:
         Returns a dict of note_path → matches for notes that have
         at least one duplicate or merge candidate.
         """
+        # Cluster notes with identical bodies so each cluster issues one
+        # query; the representative's matches are propagated to the other
+        # members. (Exact-hash clustering — near-duplicate MinHash buckets
+        # aren't worth a new dependency at vault scale.)
+        clusters: dict[str, list[Note]] = {}
+        queries_by_hash: dict[str, str] = {}
+        for note in notes:
+            body = note.body_without_frontmatter().strip()
+            if len(body) < self._config.min_content_length:
+                continue
+            body_hash = note.body_hash
+            clusters.setdefault(body_hash, []).append(note)
+            queries_by_hash.setdefault(body_hash, truncate_for_embedding(body))
+
         all_matches: dict[str, list[DuplicateMatch]] = {}
 
-        for note in notes:
-            matches = self.find_duplicates(note)
-            if matches:
-                all_matches[str(note.path)] = matches
+        if clusters:
+            hashes = list(clusters)
+            queries = [queries_by_hash[h] for h in hashes]
+            batched_results = self._store.search_batch(queries, n_results=20)
+
+            for body_hash, raw_results in zip(hashes, batched_results, strict=True):
+                members = clusters[body_hash]
+                # Hashes are recorded only now that the batched query
+                # succeeded, so a transient store failure can't pin the
+                # unchanged-body fast path to stale results.
+                for member in members:
+                    self._body_hash[str(member.path)] = body_hash
+                rep = members[0]
+                rep_matches = self._collect_matches(rep, raw_results, max_results=10)
+                if rep_matches:
+                    all_matches[str(rep.path)] = rep_matches
+                for member in members[1:]:
+                    member_matches = self._propagate_matches(rep, rep_matches, member)
+                    if member_matches:
+                        all_matches[str(member.path)] = member_matches
+                        self._results[str(member.path)] = _MatchTable.from_matches(member_matches)
 
         logger.info(
             "Vault scan: %d/%d notes have duplicates or merge candidates",
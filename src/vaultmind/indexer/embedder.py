@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
-from openai import OpenAI
+import numpy as np
+
+from vaultmind.llm.client import shared_openai_client
 
 if TYPE_CHECKING:
     from vaultmind.config import EmbeddingConfig
@@ -13,6 +16,21 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_QUERY_MAX_BYTES = 4096
+
+
+def truncate_for_embedding(text: str, max_bytes: int = _QUERY_MAX_BYTES) -> str:
+    """Truncate text to a UTF-8 byte budget before embedding it as a query.
+
+    A character cap under-fills the budget for ASCII and overshoots it for
+    CJK or code, so bound by encoded bytes instead. Any partial trailing
+    character at the cut point is dropped.
+    """
+    encoded = text.encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return text
+    return encoded[:max_bytes].decode("utf-8", "ignore")
+
 
 class Embedder:
     """Generates embeddings for text chunks.
@@ -31,17 +49,20 @@ class Embedder:
         self.config = config
         self._cache = cache
         if config.provider == "voyage":
-            self._client = OpenAI(
-                api_key=api_key,
-                base_url="https://api.voyageai.com/v1",
-            )
+            self._client = shared_openai_client(api_key, "https://api.voyageai.com/v1")
         else:
-            self._client = OpenAI(api_key=api_key)
+            self._client = shared_openai_client(api_key)
 
-    def embed_texts(self, texts: list[str]) -> list[list[float]]:
-        """Embed a list of texts, using cache when available."""
+    def embed_texts(self, texts: list[str]) -> np.ndarray:
+        """Embed a list of texts, using cache when available.
+
+        Returns a contiguous ``(len(texts), dimensions)`` float32 array —
+        one row per input text. A single array avoids materializing
+        thousands of per-vector Python float lists on the way to ChromaDB,
+        which stores float32 internally anyway.
+        """
         if not texts:
-            return []
+            return np.empty((0, self.config.dimensions), dtype=np.float32)
 
         if self._cache is None:
             return self._embed_texts_uncached(texts)
@@ -72,43 +93,67 @@ class Embedder:
                 len(texts),
             )
 
+        # Reassemble in original order: cached rows plus freshly embedded rows
+        out = np.empty((len(texts), self.config.dimensions), dtype=np.float32)
+        for i, h in enumerate(hashes):
+            if h in cached:
+                out[i] = cached[h]
+
         # Embed uncached texts via API
         if uncached_indices:
             uncached_texts = [texts[i] for i in uncached_indices]
             fresh_embeddings = self._embed_texts_uncached(uncached_texts)
+            out[uncached_indices] = fresh_embeddings
 
             # Store in cache
-            entries: list[tuple[str, int, list[float]]] = []
-            for idx, emb in zip(uncached_indices, fresh_embeddings, strict=False):
-                h = hashes[idx]
-                cached[h] = emb
-                entries.append((h, self.config.dimensions, emb))
+            entries = [
+                (hashes[idx], self.config.dimensions, fresh_embeddings[j])
+                for j, idx in enumerate(uncached_indices)
+            ]
             self._cache.put_batch(entries, provider, model)
 
-        # Reassemble in original order
-        return [cached[h] for h in hashes]
+        return out
+
+    def _embed_texts_uncached(self, texts: list[str]) -> np.ndarray:
+        """Embed texts via API without cache, handling batching internally.
 
-    def _embed_texts_uncached(self, texts: list[str]) -> list[list[float]]:
-        """Embed texts via API without cache, handling batching internally."""
-        all_embeddings: list[list[float]] = []
+        Batches are dispatched concurrently — each request is a blocking
+        HTTP round-trip that releases the GIL, so overlapping them cuts full
+        reindex wall time near-linearly up to the provider rate limit.
+        Each batch writes its rows directly into a preallocated float32
+        array at its original offset (workers touch disjoint slices).
+        """
+        out = np.empty((len(texts), self.config.dimensions), dtype=np.float32)
+        offsets = list(range(0, len(texts), self.config.batch_size))
 
-        for i in range(0, len(texts), self.config.batch_size):
-            batch = texts[i : i + self.config.batch_size]
+        def embed_batch(offset: int) -> None:
+            batch = texts[offset : offset + self.config.batch_size]
             response = self._client.embeddings.create(
                 model=self.config.model,
                 input=batch,
             )
-            batch_embeddings = [item.embedding for item in response.data]
-            all_embeddings.extend(batch_embeddings)
             logger.debug(
                 "Embedded batch %d-%d of %d",
-                i,
-                min(i + self.config.batch_size, len(texts)),
+                offset,
+                min(offset + self.config.batch_size, len(texts)),
                 len(texts),
             )
+            out[offset : offset + len(batch)] = np.asarray(
+                [item.embedding for item in response.data], dtype=np.float32
+            )
+
+        if len(offsets) == 1:
+            embed_batch(0)
+            return out
+
+        workers = min(self.config.parallel_requests, len(offsets))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for _ in executor.map(embed_batch, offsets):
+                pass
 
-        return all_embeddings
+        return out
 
-    def embed_query(self, query: str) -> list[float]:
-        """Embed a single query string."""
-        return self.embed_texts([query])[0]
+    def embed_query(self, query: str) -> np.ndarray:
+        """Embed a single query string. Returns a 1-D float32 row."""
+        row: np.ndarray = self.embed_texts([query])[0]
+        return row
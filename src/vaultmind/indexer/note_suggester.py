@@ -19,6 +19,8 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from vaultmind.config import NoteSuggestionsConfig
     from vaultmind.graph.knowledge_graph import KnowledgeGraph
     from vaultmind.indexer.store import VaultStore
@@ -68,6 +70,15 @@ class NoteSuggester:
         # In-memory results buffer
         self._results: dict[str, list[NoteSuggestion]] = {}
 
+        # Entity-string interning: each distinct entity gets a bit position,
+        # so per-candidate overlap is an int AND + popcount instead of
+        # building a set from a split metadata string on every hit. The raw
+        # metadata strings repeat heavily across hits, so their masks are
+        # memoized too.
+        self._entity_bits: dict[str, int] = {}
+        self._entity_names: list[str] = []
+        self._raw_mask_cache: dict[str, int] = {}
+
     # ------------------------------------------------------------------
     # Core suggestion logic
     # ------------------------------------------------------------------
@@ -77,33 +88,54 @@ class NoteSuggester:
         note: Note,
         *,
         max_results: int = 5,
+        _note_entities: set[str] | None = None,
     ) -> list[NoteSuggestion]:
         """Find notes that should be linked to *note*.
 
         Returns suggestions sorted by composite score (descending).
+
+        ``_note_entities`` is batch-scan plumbing: ``scan_vault`` precomputes
+        entity sets instead of re-deriving them per note.
         """
         body = note.body_without_frontmatter().strip()
         if len(body) < self._config.min_content_length:
             return []
 
-        # Query ChromaDB for candidates in the suggestion band + above
-        # We fetch a wide range and filter locally to capture both
-        # in-band (link suggestion) and near-band results
+        note_path = str(note.path)
+
+        # Query ChromaDB for candidates in the suggestion band + above.
+        # We fetch a wide range and filter locally to capture both in-band
+        # (link suggestion) and near-band results; self-hits are excluded
+        # server-side so they never occupy candidate slots.
         raw_results = self._store.search(
             query=body[:2000],
             n_results=max_results + 20,
+            where={"note_path": {"$ne": note_path}},
         )
-
-        note_path = str(note.path)
-        note_entities = set(note.entities)
-
-        # Also extract entity names from graph nodes mentioned in content
-        if self._graph is not None:
-            note_entities |= self._entities_from_graph(note)
+        if _note_entities is not None:
+            note_entities = _note_entities
+        else:
+            note_entities = set(note.entities)
+            # Also extract entity names from graph nodes mentioned in content
+            if self._graph is not None:
+                note_entities |= self._entities_from_graph(note)
+        note_mask = self._entity_mask(note_entities)
 
         seen_paths: set[str] = set()
         suggestions: list[NoteSuggestion] = []
 
+        # Hoisted config lookups; zero-weight signals skip their whole
+        # per-candidate block rather than computing a boost of 0.
+        ew = self._config.entity_weight
+        gw = self._config.graph_weight
+        graph = self._graph if gw != 0.0 else None
+
+        # Signal 3 prep: one single-source BFS covers every candidate, so the
+        # per-hit path search collapses to a dict lookup
+        graph_dists: dict[str, int] = {}
+        if graph is not None:
+            graph_dists = graph.shortest_path_lengths_from(note.title)
+
         for hit in raw_results:
             meta = hit.get("metadata", {})
             hit_path = meta.get("note_path", "")
@@ -118,27 +150,33 @@ class NoteSuggester:
             if distance < _SUGGESTION_MIN_DISTANCE:
                 continue
 
-            # Skip below suggestion threshold
+            # Chroma returns hits in ascending-distance order, so the first
+            # hit past the band ends the scan — nothing further can qualify
             if distance > _SUGGESTION_MAX_DISTANCE:
-                continue
+                break
 
             similarity = 1.0 - distance
 
-            # Signal 2: shared entities
-            hit_entities_raw = meta.get("entities", "")
-            hit_entities = set(hit_entities_raw.split(",")) if hit_entities_raw else set()
-            shared = note_entities & hit_entities
-            shared_count = len(shared)
-
-            # Signal 3: graph distance
-            graph_dist = self._graph_distance(note.title, meta.get("note_title", ""))
+            # Signal 2: shared entities — int AND + popcount on interned
+            # entity bits; names are only decoded for kept suggestions
+            shared_mask = 0
+            if ew != 0.0:
+                hit_entities_raw = meta.get("entities", "")
+                if hit_entities_raw:
+                    shared_mask = note_mask & self._raw_entity_mask(hit_entities_raw)
+            shared_count = shared_mask.bit_count()
+
+            # Signal 3: graph distance, precomputed by the BFS above.
+            # The BFS keys by normalized node id, so normalize the title
+            # the same way find_path normalized its endpoints.
+            graph_dist = None
+            if graph is not None:
+                graph_dist = graph_dists.get(graph.normalize(meta.get("note_title", "")))
 
             # Composite score
-            entity_boost = self._config.entity_weight * shared_count
+            entity_boost = ew * shared_count
             graph_boost = (
-                self._config.graph_weight * (1.0 / graph_dist)
-                if graph_dist is not None and graph_dist > 0
-                else 0.0
+                gw * (1.0 / graph_dist) if graph_dist is not None and graph_dist > 0 else 0.0
             )
             composite = similarity + entity_boost + graph_boost
 
@@ -149,7 +187,7 @@ class NoteSuggester:
                     target_path=hit_path,
                     target_title=meta.get("note_title", "Untitled"),
                     similarity=round(similarity, 4),
-                    shared_entities=sorted(shared),
+                    shared_entities=self._mask_to_names(shared_mask),
                     graph_distance=graph_dist,
                     composite_score=round(composite, 4),
                 )
@@ -225,10 +263,21 @@ class NoteSuggester:
         Returns a dict of note_path → suggestions for notes that
         have at least one link suggestion.
         """
+        # Hoist the per-note entity sets so each is derived once per scan.
+        entities_by_path: dict[str, set[str]] = {}
+        for note in notes:
+            entities = set(note.entities)
+            if self._graph is not None:
+                entities |= self._entities_from_graph(note)
+            entities_by_path[str(note.path)] = entities
+
         all_suggestions: dict[str, list[NoteSuggestion]] = {}
 
         for note in notes:
-            results = self.suggest_links(note)
+            results = self.suggest_links(
+                note,
+                _note_entities=entities_by_path[str(note.path)],
+            )
             if results:
                 all_suggestions[str(note.path)] = results
 
@@ -243,6 +292,37 @@ class NoteSuggester:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _entity_mask(self, entities: Iterable[str]) -> int:
+        """Fold entity strings into a bitmask, interning new entities."""
+        mask = 0
+        bits = self._entity_bits
+        for entity in entities:
+            bit = bits.get(entity)
+            if bit is None:
+                bit = len(self._entity_names)
+                bits[entity] = bit
+                self._entity_names.append(entity)
+            mask |= 1 << bit
+        return mask
+
+    def _raw_entity_mask(self, raw: str) -> int:
+        """Bitmask for a comma-joined entity metadata string, memoized."""
+        mask = self._raw_mask_cache.get(raw)
+        if mask is None:
+            mask = self._entity_mask(raw.split(","))
+            self._raw_mask_cache[raw] = mask
+        return mask
+
+    def _mask_to_names(self, mask: int) -> list[str]:
+        """Decode a shared-entity mask back into sorted entity names."""
+        names: list[str] = []
+        while mask:
+            low = mask & -mask
+            names.append(self._entity_names[low.bit_length() - 1])
+            mask ^= low
+        names.sort()
+        return names
+
     def _entities_from_graph(self, note: Note) -> set[str]:
         """Extract entity names that appear in the graph for this note."""
         if self._graph is None:
@@ -260,21 +340,3 @@ class NoteSuggester:
                 entities.add(link.lower())
 
         return entities
-
-    def _graph_distance(
-        self,
-        source_title: str,
-        target_title: str,
-    ) -> int | None:
-        """Shortest path length between two note titles in the graph.
-
-        Returns None if no graph is configured or no path exists.
-        """
-        if self._graph is None:
-            return None
-
-        path = self._graph.find_path(source_title, target_title)
-        if path is None:
-            return None
-
-        return len(path) - 1  # path includes both endpoints
@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import logging
 import math
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 import chromadb
 from chromadb.config import Settings as ChromaSettings
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from vaultmind.config import ChromaConfig
     from vaultmind.indexer.bm25 import BM25Index
     from vaultmind.indexer.embedder import Embedder
@@ -18,6 +22,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Embedded-but-not-yet-upserted batches the pipeline may hold before the
+# chunking loop pauses to drain one — bounds peak memory to a few batches
+# of float32 vectors instead of the whole vault's matrix.
+_MAX_INFLIGHT_BATCHES = 4
+
 
 class VaultStore:
     """Manages the vector index over vault notes.
@@ -53,29 +62,63 @@ class VaultStore:
         )
 
     def index_notes(self, notes: list[Note], parser: VaultParser) -> int:
-        """Full index: chunk and embed all notes. Returns number of chunks indexed."""
-        all_chunks: list[NoteChunk] = []
-        for note in notes:
-            chunks = parser.chunk_note(note)
-            all_chunks.extend(chunks)
+        """Full index: chunk and embed all notes. Returns number of chunks indexed.
+
+        Chunking is CPU-bound and embedding is network-bound, so the two are
+        pipelined: completed chunk batches are handed to a background worker
+        that embeds them (fanning out internally per provider batch) while
+        the remaining notes are still being chunked on this thread. Each
+        batch is upserted as soon as its embedding lands, so memory stays
+        bounded to a few batches and a failed run resumes from the last
+        upserted batch instead of losing everything.
+        """
+        batch_size = self.config.batch_size
+        total = 0
+        pending: list[NoteChunk] = []
+        inflight: deque[tuple[list[NoteChunk], Future[np.ndarray]]] = deque()
+
+        def drain_one() -> int:
+            batch, future = inflight.popleft()
+            self._upsert_batch(batch, future.result())
+            return len(batch)
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            for note in notes:
+                pending.extend(parser.chunk_note(note))
+                while len(pending) >= batch_size:
+                    batch, pending = pending[:batch_size], pending[batch_size:]
+                    inflight.append(
+                        (batch, pool.submit(self.embedder.embed_texts, [c.content for c in batch]))
+                    )
+                    if len(inflight) >= _MAX_INFLIGHT_BATCHES:
+                        total += drain_one()
+            if pending:
+                inflight.append(
+                    (
+                        pending,
+                        pool.submit(self.embedder.embed_texts, [c.content for c in pending]),
+                    )
+                )
+            while inflight:
+                total += drain_one()
 
-        if not all_chunks:
+        if total == 0:
             logger.warning("No chunks to index")
             return 0
 
-        # Embed all chunks
-        texts = [c.content for c in all_chunks]
-        embeddings = self.embedder.embed_texts(texts)
+        logger.info("Indexed %d chunks from %d notes", total, len(notes))
+        return total
 
-        # Upsert into ChromaDB
+    def _upsert_batch(self, chunks: list[NoteChunk], embeddings: np.ndarray) -> None:
+        """Upsert one batch of chunks into ChromaDB and the BM25 index."""
+        texts = [c.content for c in chunks]
         self._collection.upsert(
-            ids=[c.chunk_id for c in all_chunks],
+            ids=[c.chunk_id for c in chunks],
             documents=texts,
-            embeddings=embeddings,  # type: ignore[arg-type]
-            metadatas=[c.to_chroma_metadata() for c in all_chunks],
+            embeddings=embeddings,
+            metadatas=[c.to_chroma_metadata() for c in chunks],
         )
 
-        # Sync BM25 index
         if self._bm25 is not None:
             bm25_rows = [
                 (
@@ -84,13 +127,10 @@ class VaultStore:
                     c.note_title,
                     c.content,
                 )
-                for c in all_chunks
+                for c in chunks
             ]
             self._bm25.upsert_batch(bm25_rows)
 
-        logger.info("Indexed %d chunks from %d notes", len(all_chunks), len(notes))
-        return len(all_chunks)
-
     def index_single_note(self, note: Note, parser: VaultParser) -> int:
         """Incremental index: re-index a single note (delete old chunks, add new)."""
         # Delete existing chunks for this note
@@ -101,28 +141,8 @@ class VaultStore:
         if not chunks:
             return 0
 
-        texts = [c.content for c in chunks]
-        embeddings = self.embedder.embed_texts(texts)
-
-        self._collection.upsert(
-            ids=[c.chunk_id for c in chunks],
-            documents=texts,
-            embeddings=embeddings,  # type: ignore[arg-type]
-            metadatas=[c.to_chroma_metadata() for c in chunks],
-        )
-
-        # Sync BM25 index (delete + re-insert handled by upsert_batch)
-        if self._bm25 is not None:
-            bm25_rows = [
-                (
-                    c.chunk_id,
-                    str(c.note_path),
-                    c.note_title,
-                    c.content,
-                )
-                for c in chunks
-            ]
-            self._bm25.upsert_batch(bm25_rows)
+        embeddings = self.embedder.embed_texts([c.content for c in chunks])
+        self._upsert_batch(chunks, embeddings)
 
         logger.info("Re-indexed %d chunks for %s", len(chunks), note.path)
         return len(chunks)
@@ -174,21 +194,23 @@ class VaultStore:
 
         results = self._collection.query(**kwargs)
 
-        # Flatten ChromaDB's nested result format
+        # Flatten ChromaDB's nested result format — hoist the inner lists
+        # once and zip, instead of re-indexing the result dict per hit
         hits: list[dict[str, Any]] = []
         if results["ids"] and results["ids"][0]:
-            docs = results["documents"]
-            metas = results["metadatas"]
-            dists = results["distances"]
-            for i, chunk_id in enumerate(results["ids"][0]):
-                hits.append(
-                    {
-                        "chunk_id": chunk_id,
-                        "content": docs[0][i] if docs else "",
-                        "metadata": metas[0][i] if metas else {},
-                        "distance": dists[0][i] if dists else 0.0,
-                    }
-                )
+            ids0 = results["ids"][0]
+            docs0 = (results.get("documents") or [[]])[0]
+            metas0 = (results.get("metadatas") or [[]])[0]
+            dists0 = (results.get("distances") or [[]])[0]
+            hits = [
+                {
+                    "chunk_id": chunk_id,
+                    "content": doc,
+                    "metadata": meta,
+                    "distance": dist,
+                }
+                for chunk_id, doc, meta, dist in zip(ids0, docs0, metas0, dists0, strict=False)
+            ]
 
         # Store in cache (only unfiltered queries)
         if self._search_cache is not None and where is None:
@@ -196,6 +218,60 @@ class VaultStore:
 
         return hits
 
+    def search_batch(
+        self,
+        queries: list[str],
+        n_results: int = 5,
+        where: dict[str, Any] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Semantic search for many queries in one round-trip.
+
+        Embeds all queries in a single batch and issues one ChromaDB query,
+        instead of a per-query embed + HNSW traversal loop. Used by batch
+        scans (digest connections, duplicate detection).
+
+        Returns:
+            One hit list per query, each in the same shape as ``search()``.
+        """
+        if not queries:
+            return []
+
+        query_embeddings = self.embedder.embed_texts(queries)
+
+        kwargs: dict[str, Any] = {
+            "query_embeddings": query_embeddings,
+            "n_results": n_results,
+            "include": ["documents", "metadatas", "distances"],
+        }
+        if where:
+            kwargs["where"] = where
+
+        results = self._collection.query(**kwargs)
+
+        n_queries = len(results["ids"])
+        docs = results.get("documents") or [[]] * n_queries
+        metas = results.get("metadatas") or [[]] * n_queries
+        dists = results.get("distances") or [[]] * n_queries
+
+        batched: list[list[dict[str, Any]]] = []
+        for chunk_ids, docs_q, metas_q, dists_q in zip(
+            results["ids"], docs, metas, dists, strict=False
+        ):
+            batched.append(
+                [
+                    {
+                        "chunk_id": chunk_id,
+                        "content": doc,
+                        "metadata": meta,
+                        "distance": dist,
+                    }
+                    for chunk_id, doc, meta, dist in zip(
+                        chunk_ids, docs_q, metas_q, dists_q, strict=False
+                    )
+                ]
+            )
+        return batched
+
     def ranked_search(
         self,
         query: str,
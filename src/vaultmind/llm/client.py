@@ -9,10 +9,18 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from typing import Literal, Protocol
+from functools import lru_cache
+from typing import TYPE_CHECKING, Literal, Protocol
+
+import httpx
 
 from vaultmind.errors import VaultMindError
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from openai import AsyncOpenAI, OpenAI
+
 logger = logging.getLogger(__name__)
 
 type Provider = Literal["anthropic", "openai", "gemini", "ollama"]
@@ -45,13 +53,25 @@ class MultimodalMessage:
     parts: list[ContentPart] = field(default_factory=list)
 
 
+@dataclass(frozen=True, slots=True)
+class Usage:
+    """Token counts for one request/response round-trip.
+
+    A slotted record instead of a per-response dict: providers build one of
+    these for every call, and the fixed fields are the whole schema.
+    """
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
 @dataclass(frozen=True, slots=True)
 class LLMResponse:
     """Unified response from any LLM provider."""
 
     text: str
     model: str
-    usage: dict[str, int]
+    usage: Usage = Usage()
 
 
 class LLMError(VaultMindError):
@@ -81,6 +101,7 @@ class LLMClient(Protocol):
         model: str,
         max_tokens: int = 4096,
         system: str | None = None,
+        stream_handler: Callable[[str], None] | None = None,
     ) -> LLMResponse:
         """Send messages and get a text response.
 
@@ -89,6 +110,8 @@ class LLMClient(Protocol):
             model: Provider-specific model identifier.
             max_tokens: Maximum tokens in the response.
             system: Optional system prompt.
+            stream_handler: Optional callback invoked with each text delta
+                as it arrives, for providers that stream responses.
 
         Returns:
             LLMResponse with the generated text.
@@ -123,9 +146,67 @@ class LLMClient(Protocol):
         ...
 
 
+def to_api_messages(messages: list[Message]) -> list[dict[str, str]]:
+    """Convert Messages to the wire-format dicts shared by all providers.
+
+    System turns are dropped; every provider routes the system prompt
+    through its own channel (dedicated parameter or prepended message).
+    """
+    return [{"role": m.role, "content": m.content} for m in messages if m.role != "system"]
+
+
+def pooled_http_client() -> httpx.Client:
+    """Pooled sync HTTP client to hand to a provider SDK.
+
+    The SDK defaults build a fresh httpx client per SDK instance with
+    conservative limits; an explicit keep-alive pool avoids repeated TLS
+    handshakes across the back-to-back calls made during indexing and
+    suggestion scans.
+    """
+    return httpx.Client(
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        timeout=60.0,
+    )
+
+
+@lru_cache(maxsize=8)
+def shared_openai_client(api_key: str, base_url: str | None = None) -> OpenAI:
+    """One OpenAI SDK instance (and connection pool) per (api_key, base_url).
+
+    The OpenAI-compatible endpoints — OpenAI itself, Gemini, Ollama, Voyage
+    embeddings, Whisper transcription — all wrap this SDK; memoizing here
+    means the chat client, the embedder, and the transcriber reuse one pool
+    instead of each negotiating TLS on its own.
+    """
+    from openai import OpenAI
+
+    if base_url:
+        return OpenAI(api_key=api_key, base_url=base_url, http_client=pooled_http_client())
+    return OpenAI(api_key=api_key, http_client=pooled_http_client())
+
+
+@lru_cache(maxsize=8)
+def shared_async_openai_client(api_key: str, base_url: str | None = None) -> AsyncOpenAI:
+    """Async counterpart of ``shared_openai_client`` for fan-out workloads."""
+    from openai import AsyncOpenAI
+
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        timeout=60.0,
+    )
+    if base_url:
+        return AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+    return AsyncOpenAI(api_key=api_key, http_client=http_client)
+
+
+@lru_cache(maxsize=8)
 def create_llm_client(provider: Provider, api_key: str, base_url: str | None = None) -> LLMClient:
     """Factory: create an LLM client for the given provider.
 
+    Clients are memoized per (provider, api_key, base_url), so repeated
+    factory calls — one per CLI command or bot handler — share one SDK
+    instance and its connection pool instead of negotiating TLS each time.
+
     Args:
         provider: One of "anthropic", "openai", "gemini", "ollama".
         api_key: API key (empty string for Ollama).
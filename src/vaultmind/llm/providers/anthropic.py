@@ -2,18 +2,30 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import anthropic
 
-from vaultmind.llm.client import ContentPart, LLMError, LLMResponse, Message, MultimodalMessage
+from vaultmind.llm.client import (
+    ContentPart,
+    LLMError,
+    LLMResponse,
+    Message,
+    MultimodalMessage,
+    Usage,
+    pooled_http_client,
+    to_api_messages,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 
 class AnthropicClient:
     """LLM client for Anthropic Claude models."""
 
     def __init__(self, api_key: str) -> None:
-        self._client = anthropic.Anthropic(api_key=api_key)
+        self._client = anthropic.Anthropic(api_key=api_key, http_client=pooled_http_client())
 
     @property
     def provider_name(self) -> str:
@@ -25,11 +37,15 @@ class AnthropicClient:
         model: str,
         max_tokens: int = 4096,
         system: str | None = None,
+        stream_handler: Callable[[str], None] | None = None,
     ) -> LLMResponse:
-        """Anthropic uses a dedicated `system` parameter."""
-        api_messages: list[anthropic.types.MessageParam] = [
-            {"role": m.role, "content": m.content} for m in messages if m.role != "system"
-        ]
+        """Anthropic uses a dedicated `system` parameter.
+
+        The response is streamed and accumulated, so text deltas can be
+        forwarded to *stream_handler* as they arrive instead of blocking
+        for the whole generation.
+        """
+        api_messages = to_api_messages(messages)
 
         kwargs: dict[str, object] = {
             "model": model,
@@ -39,23 +55,22 @@ class AnthropicClient:
         if system:
             kwargs["system"] = system
 
+        text_parts: list[str] = []
         try:
-            response = self._client.messages.create(**kwargs)  # type: ignore[arg-type,call-overload,unused-ignore]
+            with self._client.messages.stream(**kwargs) as stream:  # type: ignore[arg-type,call-overload,unused-ignore]
+                for delta in stream.text_stream:
+                    text_parts.append(delta)
+                    if stream_handler is not None:
+                        stream_handler(delta)
+                response = stream.get_final_message()
         except anthropic.APIError as e:
             raise LLMError(str(e), provider="anthropic", original=e) from e
 
-        block = response.content[0]
-        if not isinstance(block, anthropic.types.TextBlock):
-            raise LLMError(
-                f"Unexpected response block: {type(block).__name__}",
-                provider="anthropic",
-            )
-
-        usage = {
-            "input_tokens": response.usage.input_tokens,
-            "output_tokens": response.usage.output_tokens,
-        }
-        return LLMResponse(text=block.text, model=response.model, usage=usage)
+        usage = Usage(
+            input_tokens=response.usage.input_tokens,
+            output_tokens=response.usage.output_tokens,
+        )
+        return LLMResponse(text="".join(text_parts), model=response.model, usage=usage)
 
     def complete_multimodal(
         self,
@@ -97,10 +112,10 @@ class AnthropicClient:
                 provider="anthropic",
             )
 
-        usage = {
-            "input_tokens": response.usage.input_tokens,
-            "output_tokens": response.usage.output_tokens,
-        }
+        usage = Usage(
+            input_tokens=response.usage.input_tokens,
+            output_tokens=response.usage.output_tokens,
+        )
         return LLMResponse(text=block.text, model=response.model, usage=usage)
 
 
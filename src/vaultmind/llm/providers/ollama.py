@@ -2,9 +2,22 @@
 
 from __future__ import annotations
 
-from openai import OpenAI, OpenAIError
+from typing import TYPE_CHECKING
 
-from vaultmind.llm.client import LLMError, LLMResponse, Message, MultimodalMessage
+from openai import OpenAIError
+
+from vaultmind.llm.client import (
+    LLMError,
+    LLMResponse,
+    Message,
+    MultimodalMessage,
+    Usage,
+    shared_openai_client,
+    to_api_messages,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 
 class OllamaClient:
@@ -15,10 +28,7 @@ class OllamaClient:
     """
 
     def __init__(self, base_url: str = "http://localhost:11434") -> None:
-        self._client = OpenAI(
-            api_key="ollama",
-            base_url=f"{base_url.rstrip('/')}/v1",
-        )
+        self._client = shared_openai_client("ollama", f"{base_url.rstrip('/')}/v1")
 
     @property
     def provider_name(self) -> str:
@@ -30,37 +40,52 @@ class OllamaClient:
         model: str,
         max_tokens: int = 4096,
         system: str | None = None,
+        stream_handler: Callable[[str], None] | None = None,
     ) -> LLMResponse:
-        """Ollama supports the OpenAI chat completions format."""
+        """Ollama supports the OpenAI chat completions format.
+
+        The response is streamed and accumulated; text deltas are forwarded
+        to *stream_handler* as they arrive — local generation is slow enough
+        that first-token latency matters most here.
+        """
         api_messages: list[dict[str, str]] = []
         if system:
             api_messages.append({"role": "system", "content": system})
-        api_messages.extend(
-            {"role": m.role, "content": m.content} for m in messages if m.role != "system"
-        )
+        api_messages.extend(to_api_messages(messages))
 
+        text_parts: list[str] = []
+        response_model = model
+        usage = Usage()
         try:
-            response = self._client.chat.completions.create(
+            stream = self._client.chat.completions.create(  # type: ignore[call-overload]
                 model=model,
                 max_completion_tokens=max_tokens,
-                messages=api_messages,  # type: ignore[arg-type]
+                messages=api_messages,
+                stream=True,
+                stream_options={"include_usage": True},
             )
+            for chunk in stream:
+                if chunk.model:
+                    response_model = chunk.model
+                if chunk.usage:
+                    usage = Usage(
+                        input_tokens=chunk.usage.prompt_tokens,
+                        output_tokens=chunk.usage.completion_tokens or 0,
+                    )
+                if chunk.choices and chunk.choices[0].delta.content:
+                    delta = chunk.choices[0].delta.content
+                    text_parts.append(delta)
+                    if stream_handler is not None:
+                        stream_handler(delta)
         except OpenAIError as e:
             raise LLMError(str(e), provider="ollama", original=e) from e
 
-        choice = response.choices[0]
-        if choice.message.content is None:
+        if not text_parts:
             raise LLMError("Empty response from Ollama", provider="ollama")
 
-        usage = {}
-        if response.usage:
-            usage = {
-                "input_tokens": response.usage.prompt_tokens,
-                "output_tokens": response.usage.completion_tokens or 0,
-            }
         return LLMResponse(
-            text=choice.message.content,
-            model=response.model,
+            text="".join(text_parts),
+            model=response_model,
             usage=usage,
         )
 
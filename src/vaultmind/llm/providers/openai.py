@@ -2,11 +2,30 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from typing import TYPE_CHECKING, Any, cast
 
-from openai import OpenAI, OpenAIError
+from openai import OpenAIError
 
-from vaultmind.llm.client import ContentPart, LLMError, LLMResponse, Message, MultimodalMessage
+from vaultmind.llm.client import (
+    ContentPart,
+    LLMError,
+    LLMResponse,
+    Message,
+    MultimodalMessage,
+    Usage,
+    shared_async_openai_client,
+    shared_openai_client,
+    to_api_messages,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterator
+
+    from openai import AsyncStream, Stream
+    from openai.types.chat import ChatCompletionChunk
+
+    from vaultmind.llm.response_cache import SemanticResponseCache
 
 
 class OpenAIClient:
@@ -15,11 +34,15 @@ class OpenAIClient:
     Also works with any OpenAI-compatible API by setting base_url.
     """
 
-    def __init__(self, api_key: str, base_url: str | None = None) -> None:
-        if base_url:
-            self._client = OpenAI(api_key=api_key, base_url=base_url)
-        else:
-            self._client = OpenAI(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str | None = None,
+        response_cache: SemanticResponseCache | None = None,
+    ) -> None:
+        self._client = shared_openai_client(api_key, base_url)
+        self._aclient = shared_async_openai_client(api_key, base_url)
+        self._response_cache = response_cache
 
     @property
     def provider_name(self) -> str:
@@ -31,14 +54,40 @@ class OpenAIClient:
         model: str,
         max_tokens: int = 4096,
         system: str | None = None,
+        stream_handler: Callable[[str], None] | None = None,
+        stable_prefix: list[Message] | None = None,
     ) -> LLMResponse:
-        """OpenAI uses a system message prepended to the messages list."""
+        """OpenAI uses a system message prepended to the messages list.
+
+        This provider does not stream; when a *stream_handler* is given it
+        receives the full text once after the response arrives.
+
+        When a response cache is configured, repeated or near-duplicate
+        prompts are served from it without touching the API.
+
+        *stable_prefix* messages are emitted verbatim right after the
+        system message, ahead of the conversation. OpenAI's server-side
+        prompt cache discounts byte-stable prefixes, so long static
+        context (tool schemas, reference material) belongs here rather
+        than in *messages* — the server only caches prefixes of roughly
+        1024 tokens or more.
+        """
+        if stable_prefix:
+            messages = stable_prefix + messages
+
+        cache_key: str | None = None
+        if self._response_cache is not None:
+            cache_key = self._response_cache.prompt_key(messages, system)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                if stream_handler is not None:
+                    stream_handler(cached.text)
+                return cached
+
         api_messages: list[dict[str, str]] = []
         if system:
             api_messages.append({"role": "system", "content": system})
-        api_messages.extend(
-            {"role": m.role, "content": m.content} for m in messages if m.role != "system"
-        )
+        api_messages.extend(to_api_messages(messages))
 
         try:
             response = self._client.chat.completions.create(
@@ -53,18 +102,163 @@ class OpenAIClient:
         if choice.message.content is None:
             raise LLMError("Empty response from OpenAI", provider="openai")
 
-        usage = {}
+        if stream_handler is not None:
+            stream_handler(choice.message.content)
+
+        usage = Usage()
         if response.usage:
-            usage = {
-                "input_tokens": response.usage.prompt_tokens,
-                "output_tokens": response.usage.completion_tokens or 0,
-            }
+            usage = Usage(
+                input_tokens=response.usage.prompt_tokens,
+                output_tokens=response.usage.completion_tokens or 0,
+            )
+        result = LLMResponse(
+            text=choice.message.content,
+            model=response.model,
+            usage=usage,
+        )
+        if self._response_cache is not None and cache_key is not None:
+            self._response_cache.put(cache_key, result)
+        return result
+
+    def stream(
+        self,
+        messages: list[Message],
+        model: str,
+        max_tokens: int = 4096,
+        system: str | None = None,
+    ) -> Iterator[str]:
+        """Yield response text incrementally as the API generates it.
+
+        Time-to-first-token is a fraction of full generation time, so
+        callers that display output progressively should prefer this over
+        ``complete`` for long responses. Bypasses the response cache.
+        """
+        api_messages: list[dict[str, str]] = []
+        if system:
+            api_messages.append({"role": "system", "content": system})
+        api_messages.extend(to_api_messages(messages))
+
+        try:
+            # cast: overload resolution stumbles on the loosely typed
+            # api_messages; stream=True always yields a Stream.
+            response_stream = cast(
+                "Stream[ChatCompletionChunk]",
+                self._client.chat.completions.create(
+                    model=model,
+                    max_completion_tokens=max_tokens,
+                    messages=api_messages,  # type: ignore[arg-type]
+                    stream=True,
+                ),
+            )
+            for chunk in response_stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except OpenAIError as e:
+            raise LLMError(str(e), provider="openai", original=e) from e
+
+    async def astream(
+        self,
+        messages: list[Message],
+        model: str,
+        max_tokens: int = 4096,
+        system: str | None = None,
+    ) -> AsyncIterator[str]:
+        """Async counterpart of ``stream`` for event-loop callers."""
+        api_messages: list[dict[str, str]] = []
+        if system:
+            api_messages.append({"role": "system", "content": system})
+        api_messages.extend(to_api_messages(messages))
+
+        try:
+            response_stream = cast(
+                "AsyncStream[ChatCompletionChunk]",
+                await self._aclient.chat.completions.create(
+                    model=model,
+                    max_completion_tokens=max_tokens,
+                    messages=api_messages,  # type: ignore[arg-type]
+                    stream=True,
+                ),
+            )
+            async for chunk in response_stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except OpenAIError as e:
+            raise LLMError(str(e), provider="openai", original=e) from e
+
+    async def complete_async(
+        self,
+        messages: list[Message],
+        model: str,
+        max_tokens: int = 4096,
+        system: str | None = None,
+    ) -> LLMResponse:
+        """Async variant of ``complete`` for overlapping in-flight calls.
+
+        Bypasses the response cache — its embedding lookup is synchronous
+        and would block the event loop.
+        """
+        api_messages: list[dict[str, str]] = []
+        if system:
+            api_messages.append({"role": "system", "content": system})
+        api_messages.extend(to_api_messages(messages))
+
+        try:
+            response = await self._aclient.chat.completions.create(
+                model=model,
+                max_completion_tokens=max_tokens,
+                messages=api_messages,  # type: ignore[arg-type]
+            )
+        except OpenAIError as e:
+            raise LLMError(str(e), provider="openai", original=e) from e
+
+        choice = response.choices[0]
+        if choice.message.content is None:
+            raise LLMError("Empty response from OpenAI", provider="openai")
+
+        usage = Usage()
+        if response.usage:
+            usage = Usage(
+                input_tokens=response.usage.prompt_tokens,
+                output_tokens=response.usage.completion_tokens or 0,
+            )
         return LLMResponse(
             text=choice.message.content,
             model=response.model,
             usage=usage,
         )
 
+    async def complete_many(
+        self,
+        batches: list[list[Message]],
+        model: str,
+        max_tokens: int = 4096,
+        system: str | None = None,
+        concurrency: int = 8,
+    ) -> list[LLMResponse | LLMError]:
+        """Run many completions concurrently, overlapping network round-trips.
+
+        Results come back in input order; a failed call yields its LLMError
+        in place instead of aborting the batch. *concurrency* bounds the
+        in-flight calls to stay under provider rate limits.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(msgs: list[Message]) -> LLMResponse:
+            async with semaphore:
+                return await self.complete_async(msgs, model, max_tokens=max_tokens, system=system)
+
+        results = await asyncio.gather(*(run(b) for b in batches), return_exceptions=True)
+
+        out: list[LLMResponse | LLMError] = []
+        for result in results:
+            if isinstance(result, LLMResponse | LLMError):
+                out.append(result)
+            elif isinstance(result, Exception):
+                out.append(LLMError(str(result), provider="openai", original=result))
+            else:  # BaseException from gather — re-raise rather than swallow
+                raise result
+        return out
+
     def complete_multimodal(
         self,
         messages: list[Message | MultimodalMessage],
@@ -100,12 +294,12 @@ class OpenAIClient:
         if choice.message.content is None:
             raise LLMError("Empty multimodal response from OpenAI", provider="openai")
 
-        usage = {}
+        usage = Usage()
         if response.usage:
-            usage = {
-                "input_tokens": response.usage.prompt_tokens,
-                "output_tokens": response.usage.completion_tokens or 0,
-            }
+            usage = Usage(
+                input_tokens=response.usage.prompt_tokens,
+                output_tokens=response.usage.completion_tokens or 0,
+            )
         return LLMResponse(
             text=choice.message.content,
             model=response.model,
@@ -0,0 +1,157 @@
+"""In-memory LRU completion cache with semantic prompt matching."""
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from vaultmind.llm.client import LLMResponse, Message
+
+logger = logging.getLogger(__name__)
+
+# Unit-vector components are scaled by this factor before int8 rounding.
+_INT8_SCALE = 127.0
+
+# Pending embeddings a put() hasn't claimed yet. When the completion after
+# a miss fails, its entry is never popped, so the map is capped — oldest
+# orphans are evicted first.
+_MAX_PENDING_VECS = 32
+
+
+class SemanticResponseCache:
+    """LRU cache for LLM completions, keyed on the full prompt.
+
+    Exact prompt repeats are served from a dict lookup. When an *embed_fn*
+    is provided, lightly rephrased prompts are also served: the prompt is
+    embedded once and compared against cached prompt embeddings by cosine
+    similarity. One embedding call per miss is the price of catching
+    near-duplicates — orders of magnitude cheaper than the completion it
+    replaces on workloads with repeated or rephrased queries.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        similarity_threshold: float = 0.95,
+        embed_fn: Callable[[str], np.ndarray | list[float]] | None = None,
+    ) -> None:
+        self._max_entries = max_entries
+        self._threshold = similarity_threshold
+        self._embed_fn = embed_fn
+        self._cache: OrderedDict[str, tuple[np.ndarray | None, LLMResponse]] = OrderedDict()
+        # Embeddings computed during a missed get(), picked up by the
+        # following put() for the same key so the prompt is embedded once.
+        self._pending_vecs: OrderedDict[str, np.ndarray] = OrderedDict()
+        # Cached embeddings stacked row-wise as int8, rebuilt lazily after
+        # puts so the similarity scan is one matrix-vector product instead
+        # of a Python loop of per-entry dot products. Quantizing unit
+        # vectors to int8 keeps cosine error under ~1% while storing a
+        # quarter of the float32 bytes.
+        self._matrix: np.ndarray | None = None
+        self._matrix_keys: list[str] = []
+        self._matrix_stale = True
+        self._hit_count = 0
+        self._miss_count = 0
+
+    @staticmethod
+    def prompt_key(messages: list[Message], system: str | None) -> str:
+        """Canonical cache key: system prompt + every message body."""
+        parts = [system or ""]
+        parts.extend(m.content for m in messages)
+        return "\n".join(parts)
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Return a cached response for *key*, or None on miss."""
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            self._hit_count += 1
+            return entry[1]
+
+        if self._embed_fn is not None:
+            vec = self._quantized(self._embed_fn(key))
+            if self._matrix_stale:
+                self._rebuild_matrix()
+            if self._matrix is not None:
+                # Accumulate in int32 (int8 matmul would overflow), then
+                # undo the quantization scale to recover cosine similarity.
+                sims = (self._matrix.astype(np.int32) @ vec.astype(np.int32)) / (
+                    _INT8_SCALE * _INT8_SCALE
+                )
+                best = int(np.argmax(sims))
+                if float(sims[best]) >= self._threshold:
+                    best_key = self._matrix_keys[best]
+                    self._cache.move_to_end(best_key)
+                    self._hit_count += 1
+                    return self._cache[best_key][1]
+            self._pending_vecs[key] = vec
+            self._pending_vecs.move_to_end(key)
+            while len(self._pending_vecs) > _MAX_PENDING_VECS:
+                self._pending_vecs.popitem(last=False)
+
+        self._miss_count += 1
+        return None
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """Store a response, reusing the embedding computed during get()."""
+        vec = self._pending_vecs.pop(key, None)
+        if vec is None and self._embed_fn is not None:
+            vec = self._quantized(self._embed_fn(key))
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        else:
+            while len(self._cache) >= self._max_entries:
+                self._cache.popitem(last=False)
+        self._cache[key] = (vec, response)
+        self._matrix_stale = True
+
+    def _rebuild_matrix(self) -> None:
+        """Stack cached embeddings into one contiguous matrix."""
+        pairs = [(k, emb) for k, (emb, _) in self._cache.items() if emb is not None]
+        self._matrix = np.stack([emb for _, emb in pairs]) if pairs else None
+        self._matrix_keys = [k for k, _ in pairs]
+        self._matrix_stale = False
+
+    def clear(self) -> None:
+        """Clear all cached entries."""
+        self._cache.clear()
+        self._pending_vecs.clear()
+        self._matrix = None
+        self._matrix_keys = []
+        self._matrix_stale = True
+
+    @property
+    def size(self) -> int:
+        """Number of entries currently cached."""
+        return len(self._cache)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Cache hit/miss statistics."""
+        return {
+            "hits": self._hit_count,
+            "misses": self._miss_count,
+            "size": len(self._cache),
+            "max_entries": self._max_entries,
+        }
+
+    @staticmethod
+    def _quantized(embedding: np.ndarray | list[float]) -> np.ndarray:
+        """L2-normalize, then round unit components into int8.
+
+        An int8 row costs a quarter of the float32 bytes; with the fixed
+        127 scale, similarity is recovered by dividing the int32 dot
+        product by 127².
+        """
+        vec = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vec))
+        if norm:
+            vec = vec / norm
+        return np.round(vec * _INT8_SCALE).astype(np.int8)
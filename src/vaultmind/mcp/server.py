@@ -11,12 +11,20 @@ Requires: pip install vaultmind[mcp]
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import os
+from collections import deque
 from typing import TYPE_CHECKING, Any
 
+import orjson
+
 from vaultmind.mcp.auth import AuditLogger, ProfileEnforcer, ProfileError
-from vaultmind.vault.security import PathTraversalError, validate_vault_path
+from vaultmind.vault.security import (
+    PathTraversalError,
+    invalidate_validated_paths,
+    validate_vault_path,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -28,395 +36,434 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-
-def create_mcp_server(
-    vault_path: Path,
-    store: VaultStore,
-    graph: KnowledgeGraph,
-    parser: VaultParser,
-    duplicate_detector: object | None = None,
-    note_suggester: object | None = None,
-    enforcer: ProfileEnforcer | None = None,
-    audit_logger: AuditLogger | None = None,
-    # New introspection dependencies
-    episode_store: object | None = None,
-    procedural_memory: object | None = None,
-    evolution_detector: object | None = None,
-    preference_store: object | None = None,
-    retry_executor: object | None = None,
-) -> Any:  # Returns mcp.server.Server (optional dep)
-    """Create and configure the MCP server with vault tools.
-
-    Returns an MCP Server instance ready to run.
+# Serialized results above this size are split across TextContent parts so
+# no single protocol frame carries a multi-megabyte string.
+_TEXT_PART_SIZE = 256 * 1024
+
+# Capture note bodies, built once instead of re-assembling the frontmatter
+# f-string piecewise on every call — captures arrive in bursts (e.g. while
+# transcribing a meeting).
+_CAPTURE_TPL = (
+    "---\ntype: fleeting\ntags: [{tags}]\n"
+    "created: {created}\nsource: mcp\nstatus: active\n---\n\n"
+    "# {title}\n\n{body}\n"
+)
+_CAPTURE_NOTE_TPL = (
+    "---\n"
+    "title: {title}\n"
+    "type: {note_type}\n"
+    "tags: {tags}\n"
+    "created: {created}\n"
+    "source: mcp\n"
+    "status: active\n"
+    "---\n\n"
+    "# {title}\n\n"
+    "{body}\n"
+)
+
+
+def _build_tools() -> list[Any]:
+    """Construct the tool descriptors once per server.
+
+    tools/list is called repeatedly per session; rebuilding the eight
+    inputSchema dicts each time was ~100 allocations per call. Built
+    lazily (not at import) because mcp is an optional dependency.
     """
-    from mcp.server import Server
-    from mcp.types import TextContent, Tool
-
-    server = Server("vaultmind")
-
-    @server.list_tools()  # type: ignore[misc,untyped-decorator,unused-ignore]
-    async def list_tools() -> list[Tool]:
-        return [
-            Tool(
-                name="vault_search",
-                description=(
-                    "Semantic search over the Obsidian vault."
-                    " Returns relevant note chunks ranked by similarity."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Natural language search query",
-                        },
-                        "n_results": {
-                            "type": "integer",
-                            "description": "Number of results (default 5)",
-                            "default": 5,
-                        },
-                        "note_type": {
-                            "type": "string",
-                            "description": "Filter by note type (optional)",
-                        },
-                    },
-                    "required": ["query"],
-                },
+    from mcp.types import Tool
+
+    return [
+        Tool(
+            name="vault_search",
+            description=(
+                "Semantic search over the Obsidian vault."
+                " Returns relevant note chunks ranked by similarity."
             ),
-            Tool(
-                name="vault_read",
-                description=(
-                    "Read the full content of a specific note by its path relative to vault root."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": (
-                                "Note path relative to vault root"
-                                " (e.g., '02-projects/cairn/architecture.md')"
-                            ),
-                        },
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "Natural language search query",
+                    },
+                    "n_results": {
+                        "type": "integer",
+                        "description": "Number of results (default 5)",
+                        "default": 5,
+                    },
+                    "note_type": {
+                        "type": "string",
+                        "description": "Filter by note type (optional)",
                     },
-                    "required": ["path"],
                 },
+                "required": ["query"],
+            },
+        ),
+        Tool(
+            name="vault_read",
+            description=(
+                "Read the full content of a specific note by its path relative to vault root."
             ),
-            Tool(
-                name="vault_write",
-                description=(
-                    "Create or overwrite a note in the vault."
-                    " Content should be valid markdown with YAML frontmatter."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Note path relative to vault root",
-                        },
-                        "content": {
-                            "type": "string",
-                            "description": "Full markdown content including frontmatter",
-                        },
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "path": {
+                        "type": "string",
+                        "description": (
+                            "Note path relative to vault root"
+                            " (e.g., '02-projects/cairn/architecture.md')"
+                        ),
                     },
-                    "required": ["path", "content"],
                 },
+                "required": ["path"],
+            },
+        ),
+        Tool(
+            name="vault_write",
+            description=(
+                "Create or overwrite a note in the vault."
+                " Content should be valid markdown with YAML frontmatter."
             ),
-            Tool(
-                name="vault_list",
-                description=("List notes in a vault folder, optionally filtered by tag or type."),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "folder": {
-                            "type": "string",
-                            "description": ("Folder path relative to vault root (default: root)"),
-                            "default": "",
-                        },
-                        "tag": {
-                            "type": "string",
-                            "description": "Filter by tag (optional)",
-                        },
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "path": {
+                        "type": "string",
+                        "description": "Note path relative to vault root",
+                    },
+                    "content": {
+                        "type": "string",
+                        "description": "Full markdown content including frontmatter",
                     },
                 },
-            ),
-            Tool(
-                name="read_frontmatter",
-                description=(
-                    "Peek a note's parsed frontmatter (type, tags, dates, authority)"
-                    " without fetching the note body. Cheaper than vault_read for"
-                    " metadata-only lookups."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Note path relative to vault root",
-                        },
+                "required": ["path", "content"],
+            },
+        ),
+        Tool(
+            name="vault_list",
+            description=("List notes in a vault folder, optionally filtered by tag or type."),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "folder": {
+                        "type": "string",
+                        "description": ("Folder path relative to vault root (default: root)"),
+                        "default": "",
+                    },
+                    "tag": {
+                        "type": "string",
+                        "description": "Filter by tag (optional)",
                     },
-                    "required": ["path"],
                 },
+            },
+        ),
+        Tool(
+            name="read_frontmatter",
+            description=(
+                "Peek a note's parsed frontmatter (type, tags, dates, authority)"
+                " without fetching the note body. Cheaper than vault_read for"
+                " metadata-only lookups."
             ),
-            Tool(
-                name="list_folder_index",
-                description=(
-                    "List a folder's structured index: note titles and one-line"
-                    " descriptions, without fetching full note bodies."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "folder": {
-                            "type": "string",
-                            "description": ("Folder path relative to vault root (default: root)"),
-                            "default": "",
-                        },
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "path": {
+                        "type": "string",
+                        "description": "Note path relative to vault root",
                     },
                 },
+                "required": ["path"],
+            },
+        ),
+        Tool(
+            name="list_folder_index",
+            description=(
+                "List a folder's structured index: note titles and one-line"
+                " descriptions, without fetching full note bodies."
             ),
-            Tool(
-                name="follow_links",
-                description=(
-                    "Follow a note's wikilink neighborhood: outgoing [[links]] and"
-                    " incoming backlinks from other notes, without fetching note bodies."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Note path relative to vault root",
-                        },
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "folder": {
+                        "type": "string",
+                        "description": ("Folder path relative to vault root (default: root)"),
+                        "default": "",
                     },
-                    "required": ["path"],
                 },
+            },
+        ),
+        Tool(
+            name="follow_links",
+            description=(
+                "Follow a note's wikilink neighborhood: outgoing [[links]] and"
+                " incoming backlinks from other notes, without fetching note bodies."
             ),
-            Tool(
-                name="graph_query",
-                description=(
-                    "Query the knowledge graph for an entity's"
-                    " connections, neighbors, and relationships."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "entity": {
-                            "type": "string",
-                            "description": "Entity name to look up",
-                        },
-                        "depth": {
-                            "type": "integer",
-                            "description": "Neighborhood depth (default 1)",
-                            "default": 1,
-                        },
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "path": {
+                        "type": "string",
+                        "description": "Note path relative to vault root",
                     },
-                    "required": ["entity"],
                 },
+                "required": ["path"],
+            },
+        ),
+        Tool(
+            name="graph_query",
+            description=(
+                "Query the knowledge graph for an entity's"
+                " connections, neighbors, and relationships."
             ),
-            Tool(
-                name="graph_path",
-                description=("Find the shortest path between two entities in the knowledge graph."),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "source": {
-                            "type": "string",
-                            "description": "Source entity name",
-                        },
-                        "target": {
-                            "type": "string",
-                            "description": "Target entity name",
-                        },
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "entity": {
+                        "type": "string",
+                        "description": "Entity name to look up",
+                    },
+                    "depth": {
+                        "type": "integer",
+                        "description": "Neighborhood depth (default 1)",
+                        "default": 1,
                     },
-                    "required": ["source", "target"],
                 },
-            ),
-            Tool(
-                name="find_duplicates",
-                description=(
-                    "Find semantically similar or duplicate notes for a given note."
-                    " Returns matches classified as 'duplicate' (≥92% similar)"
-                    " or 'merge' (80-92% similar)."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "note_path": {
-                            "type": "string",
-                            "description": "Note path relative to vault root",
-                        },
-                        "max_results": {
-                            "type": "integer",
-                            "description": "Maximum number of matches (default 10)",
-                            "default": 10,
-                        },
+                "required": ["entity"],
+            },
+        ),
+        Tool(
+            name="graph_path",
+            description=("Find the shortest path between two entities in the knowledge graph."),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "source": {
+                        "type": "string",
+                        "description": "Source entity name",
+                    },
+                    "target": {
+                        "type": "string",
+                        "description": "Target entity name",
                     },
-                    "required": ["note_path"],
                 },
+                "required": ["source", "target"],
+            },
+        ),
+        Tool(
+            name="find_duplicates",
+            description=(
+                "Find semantically similar or duplicate notes for a given note."
+                " Returns matches classified as 'duplicate' (≥92% similar)"
+                " or 'merge' (80-92% similar)."
             ),
-            Tool(
-                name="suggest_links",
-                description=(
-                    "Find notes that should be linked to a given note."
-                    " Uses composite scoring: semantic similarity,"
-                    " shared graph entities, and graph distance."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "note_path": {
-                            "type": "string",
-                            "description": "Note path relative to vault root",
-                        },
-                        "max_results": {
-                            "type": "integer",
-                            "description": "Maximum number of suggestions (default 5)",
-                            "default": 5,
-                        },
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "note_path": {
+                        "type": "string",
+                        "description": "Note path relative to vault root",
+                    },
+                    "max_results": {
+                        "type": "integer",
+                        "description": "Maximum number of matches (default 10)",
+                        "default": 10,
                     },
-                    "required": ["note_path"],
                 },
+                "required": ["note_path"],
+            },
+        ),
+        Tool(
+            name="suggest_links",
+            description=(
+                "Find notes that should be linked to a given note."
+                " Uses composite scoring: semantic similarity,"
+                " shared graph entities, and graph distance."
             ),
-            Tool(
-                name="capture",
-                description="Quick-capture a note to the vault inbox.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "content": {
-                            "type": "string",
-                            "description": "Note content to capture",
-                        },
-                        "title": {
-                            "type": "string",
-                            "description": "Optional title (auto-generated if omitted)",
-                        },
-                        "tags": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Optional tags",
-                        },
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "note_path": {
+                        "type": "string",
+                        "description": "Note path relative to vault root",
+                    },
+                    "max_results": {
+                        "type": "integer",
+                        "description": "Maximum number of suggestions (default 5)",
+                        "default": 5,
                     },
-                    "required": ["content"],
                 },
-            ),
-            Tool(
-                name="capture_note",
-                description=(
-                    "Capture a structured note to the vault with full metadata control."
-                    " Supports note type, tags, and custom target folder."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "content": {
-                            "type": "string",
-                            "description": "Note content (markdown)",
-                        },
-                        "title": {
-                            "type": "string",
-                            "description": "Note title (auto-generated from content if omitted)",
-                        },
-                        "tags": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Tags for the note",
-                        },
-                        "note_type": {
-                            "type": "string",
-                            "enum": ["fleeting", "literature", "permanent", "project", "concept"],
-                            "default": "fleeting",
-                            "description": "Note classification type",
-                        },
-                        "folder": {
-                            "type": "string",
-                            "default": "00-inbox",
-                            "description": "Target folder relative to vault root",
-                        },
+                "required": ["note_path"],
+            },
+        ),
+        Tool(
+            name="capture",
+            description="Quick-capture a note to the vault inbox.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "content": {
+                        "type": "string",
+                        "description": "Note content to capture",
+                    },
+                    "title": {
+                        "type": "string",
+                        "description": "Optional title (auto-generated if omitted)",
+                    },
+                    "tags": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Optional tags",
                     },
-                    "required": ["content"],
                 },
+                "required": ["content"],
+            },
+        ),
+        Tool(
+            name="capture_note",
+            description=(
+                "Capture a structured note to the vault with full metadata control."
+                " Supports note type, tags, and custom target folder."
             ),
-            Tool(
-                name="vault_stats",
-                description=(
-                    "Vault health metrics: note counts by type/folder, graph size, index coverage."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "content": {
+                        "type": "string",
+                        "description": "Note content (markdown)",
+                    },
+                    "title": {
+                        "type": "string",
+                        "description": "Note title (auto-generated from content if omitted)",
+                    },
+                    "tags": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Tags for the note",
+                    },
+                    "note_type": {
+                        "type": "string",
+                        "enum": ["fleeting", "literature", "permanent", "project", "concept"],
+                        "default": "fleeting",
+                        "description": "Note classification type",
+                    },
+                    "folder": {
+                        "type": "string",
+                        "default": "00-inbox",
+                        "description": "Target folder relative to vault root",
+                    },
                 },
+                "required": ["content"],
+            },
+        ),
+        Tool(
+            name="vault_stats",
+            description=(
+                "Vault health metrics: note counts by type/folder, graph size, index coverage."
             ),
-            Tool(
-                name="episode_query",
-                description="Search episodic memory for past decisions and outcomes.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "entity": {
-                            "type": "string",
-                            "description": "Filter episodes by entity name (optional)",
-                        },
-                        "status": {
-                            "type": "string",
-                            "enum": ["pending", "resolved"],
-                            "description": "Filter by status (optional)",
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "description": "Max results (default 10)",
-                            "default": 10,
-                        },
+            inputSchema={
+                "type": "object",
+                "properties": {},
+            },
+        ),
+        Tool(
+            name="episode_query",
+            description="Search episodic memory for past decisions and outcomes.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "entity": {
+                        "type": "string",
+                        "description": "Filter episodes by entity name (optional)",
+                    },
+                    "status": {
+                        "type": "string",
+                        "enum": ["pending", "resolved"],
+                        "description": "Filter by status (optional)",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Max results (default 10)",
+                        "default": 10,
                     },
                 },
-            ),
-            Tool(
-                name="workflow_suggest",
-                description="Find matching procedural workflow for a given context.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "context": {
-                            "type": "string",
-                            "description": "Context to match against workflow trigger patterns",
-                        },
+            },
+        ),
+        Tool(
+            name="workflow_suggest",
+            description="Find matching procedural workflow for a given context.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "context": {
+                        "type": "string",
+                        "description": "Context to match against workflow trigger patterns",
                     },
-                    "required": ["context"],
                 },
+                "required": ["context"],
+            },
+        ),
+        Tool(
+            name="graph_evolution",
+            description=(
+                "Belief evolution signals: confidence drift, relationship shifts, stale claims."
             ),
-            Tool(
-                name="graph_evolution",
-                description=(
-                    "Belief evolution signals: confidence drift, relationship shifts, stale claims."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "min_severity": {
-                            "type": "number",
-                            "description": "Minimum severity threshold (0.0-1.0, default 0.0)",
-                            "default": 0.0,
-                        },
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "min_severity": {
+                        "type": "number",
+                        "description": "Minimum severity threshold (0.0-1.0, default 0.0)",
+                        "default": 0.0,
                     },
                 },
-            ),
-            Tool(
-                name="recent_activity",
-                description="Recent vault activity: notes created/modified in the last N days.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "days": {
-                            "type": "integer",
-                            "description": "Lookback period in days (default 7)",
-                            "default": 7,
-                        },
+            },
+        ),
+        Tool(
+            name="recent_activity",
+            description="Recent vault activity: notes created/modified in the last N days.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "days": {
+                        "type": "integer",
+                        "description": "Lookback period in days (default 7)",
+                        "default": 7,
                     },
                 },
-            ),
-        ]
+            },
+        ),
+    ]
+
+
+def create_mcp_server(
+    vault_path: Path,
+    store: VaultStore,
+    graph: KnowledgeGraph,
+    parser: VaultParser,
+    duplicate_detector: object | None = None,
+    note_suggester: object | None = None,
+    enforcer: ProfileEnforcer | None = None,
+    audit_logger: AuditLogger | None = None,
+    # New introspection dependencies
+    episode_store: object | None = None,
+    procedural_memory: object | None = None,
+    evolution_detector: object | None = None,
+    preference_store: object | None = None,
+    retry_executor: object | None = None,
+) -> Any:  # Returns mcp.server.Server (optional dep)
+    """Create and configure the MCP server with vault tools.
+
+    Returns an MCP Server instance ready to run.
+    """
+    from mcp.server import Server
+    from mcp.types import TextContent, Tool
+
+    server = Server("vaultmind")
+
+    tools = _build_tools()
+
+    @server.list_tools()  # type: ignore[misc,untyped-decorator,unused-ignore]
+    async def list_tools() -> list[Tool]:
+        return tools
 
     @server.call_tool()  # type: ignore[misc,untyped-decorator,unused-ignore]
     async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
@@ -465,14 +512,19 @@ def create_mcp_server(
                 "preference_store": preference_store,
             }
 
+            # Dispatch in a worker thread: the handlers do blocking file
+            # I/O and parsing, which would otherwise stall the event loop
+            # and serialize concurrent client requests.
             if retry_executor is not None:
                 from vaultmind.mcp.retry import ToolRetryExecutor
 
                 assert isinstance(retry_executor, ToolRetryExecutor)
-                result = retry_executor.execute(name, arguments, _dispatch_tool, dispatch_kwargs)
+                result = await asyncio.to_thread(
+                    retry_executor.execute, name, arguments, _dispatch_tool, dispatch_kwargs
+                )
             else:
-                result = _dispatch_tool(name, arguments, **dispatch_kwargs)
-            text = json.dumps(result, indent=2, default=str)
+                result = await asyncio.to_thread(_dispatch_tool, name, arguments, **dispatch_kwargs)
+            text = orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
             _duration_ms = int((_time.perf_counter() - _start) * 1000)
 
             # Build change detail for audit
@@ -491,7 +543,12 @@ def create_mcp_server(
                     output_summary=output_summary,
                 )
 
-            return [TextContent(type="text", text=text)]
+            if len(text) <= _TEXT_PART_SIZE:
+                return [TextContent(type="text", text=text)]
+            return [
+                TextContent(type="text", text=text[i : i + _TEXT_PART_SIZE])
+                for i in range(0, len(text), _TEXT_PART_SIZE)
+            ]
         except ProfileError as e:
             _duration_ms = int((_time.perf_counter() - _start) * 1000)
             # Audit log denial
@@ -504,7 +561,7 @@ def create_mcp_server(
                     reason=str(e),
                     duration_ms=_duration_ms,
                 )
-            err = json.dumps({"error": str(e)})
+            err = orjson.dumps({"error": str(e)}).decode()
             return [TextContent(type="text", text=err)]
         except Exception as e:
             _duration_ms = int((_time.perf_counter() - _start) * 1000)
@@ -518,12 +575,36 @@ def create_mcp_server(
                     reason=str(e),
                     duration_ms=_duration_ms,
                 )
-            err = json.dumps({"error": str(e)})
+            err = orjson.dumps({"error": str(e)}).decode()
             return [TextContent(type="text", text=err)]
 
     return server
 
 
+def _walk_md(root: Path) -> list[str]:
+    """Collect paths of all .md files under *root* via an iterative scandir walk.
+
+    rglob builds a Path and runs PurePath matching for every directory
+    entry; os.scandir reuses the stat information from the directory read
+    and only materializes strings for actual matches, which is several
+    times faster on large vaults.
+    """
+    found: list[str] = []
+    pending = deque([str(root)])
+    while pending:
+        current = pending.popleft()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(".md") and entry.is_file(follow_symlinks=False):
+                        found.append(entry.path)
+        except OSError as e:
+            logger.warning("Skipping unreadable directory %s: %s", current, e)
+    return found
+
+
 def _one_line_description(note: Note, max_len: int = 160) -> str:
     """Derive a one-line description from frontmatter, else the note's first body line."""
     fm_description = note.frontmatter.get("description")
@@ -582,6 +663,8 @@ def _dispatch_tool(
             return {"error": f"Path not allowed: {e.user_path}"}
         filepath.parent.mkdir(parents=True, exist_ok=True)
         filepath.write_text(args["content"], encoding="utf-8")
+        # Directory layout may have changed; drop memoized path validations
+        invalidate_validated_paths()
         # Re-index the note
         try:
             note = parser.parse_file(filepath)
@@ -597,11 +680,9 @@ def _dispatch_tool(
             return {"error": f"Path not allowed: {e.user_path}"}
         if not folder.exists():
             return {"error": f"Folder not found: {args.get('folder', '')}"}
-        notes = []
-        for md in folder.rglob("*.md"):
-            rel = md.relative_to(vault_path)
-            notes.append(str(rel))
-        return {"notes": sorted(notes), "count": len(notes)}
+        notes = [os.path.relpath(md_path, vault_path) for md_path in _walk_md(folder)]
+        notes.sort()
+        return {"notes": notes, "count": len(notes)}
 
     elif name == "read_frontmatter":
         try:
@@ -751,14 +832,16 @@ def _dispatch_tool(
         from datetime import datetime
 
         now = datetime.now()
-        title = args.get("title", now.strftime("Capture %Y%m%d-%H%M%S"))
+        ts_compact = now.strftime("%Y%m%d-%H%M%S")
+        title = args.get("title", f"Capture {ts_compact}")
         tags = args.get("tags", ["capture"])
         slug = title.lower().replace(" ", "-")[:60]
-        filename = f"{now.strftime('%Y%m%d-%H%M%S')}-{slug}.md"
-        content = (
-            f"---\ntype: fleeting\ntags: [{', '.join(tags)}]\n"
-            f"created: {now.strftime('%Y-%m-%d %H:%M')}\nsource: mcp\nstatus: active\n---\n\n"
-            f"# {title}\n\n{args['content']}\n"
+        filename = f"{ts_compact}-{slug}.md"
+        content = _CAPTURE_TPL.format(
+            tags=", ".join(tags),
+            created=now.strftime("%Y-%m-%d %H:%M"),
+            title=title,
+            body=args["content"],
         )
         filepath = vault_path / "00-inbox" / filename
         filepath.parent.mkdir(parents=True, exist_ok=True)
@@ -770,6 +853,7 @@ def _dispatch_tool(
         from datetime import datetime
 
         now = datetime.now()
+        ts_compact = now.strftime("%Y%m%d-%H%M%S")
         raw_content: str = args["content"]
 
         # Auto-generate title from first non-empty line if not provided
@@ -782,7 +866,7 @@ def _dispatch_tool(
                     for line in raw_content.splitlines()
                     if line.strip()
                 ),
-                now.strftime("Capture %Y%m%d-%H%M%S"),
+                f"Capture {ts_compact}",
             )
             title = first_line[:50]
 
@@ -792,21 +876,15 @@ def _dispatch_tool(
 
         # Build slug from title
         slug = re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")[:50]
-        timestamp = now.strftime("%Y%m%d-%H%M%S")
-        filename = f"{slug}-{timestamp}.md"
+        filename = f"{slug}-{ts_compact}.md"
 
         tags_yaml = "[" + ", ".join(note_tags) + "]" if note_tags else "[]"
-        file_content = (
-            f"---\n"
-            f"title: {title}\n"
-            f"type: {note_type}\n"
-            f"tags: {tags_yaml}\n"
-            f"created: {now.strftime('%Y-%m-%d %H:%M')}\n"
-            f"source: mcp\n"
-            f"status: active\n"
-            f"---\n\n"
-            f"# {title}\n\n"
-            f"{raw_content}\n"
+        file_content = _CAPTURE_NOTE_TPL.format(
+            title=title,
+            note_type=note_type,
+            tags=tags_yaml,
+            created=now.strftime("%Y-%m-%d %H:%M"),
+            body=raw_content,
         )
 
         filepath = vault_path / target_folder / filename
@@ -7,7 +7,6 @@ subscribe to specific event types without coupling to the watch handler.
 from __future__ import annotations
 
 import asyncio
-import contextlib
 import logging
 from dataclasses import dataclass, field
 from time import time
@@ -92,16 +91,37 @@ type EventCallback = Callable[[AnyVaultEvent], Coroutine[Any, Any, None]]
 # ---------------------------------------------------------------------------
 
 
+async def _safe_invoke(cb: EventCallback, event: AnyVaultEvent) -> None:
+    """Run one subscriber, logging (not raising) its failures.
+
+    Module-level rather than a closure so publish doesn't allocate a
+    fresh function object per event on the watch hot path.
+    """
+    try:
+        await cb(event)
+    except Exception:
+        logger.exception(
+            "Subscriber %s failed on %s",
+            cb.__qualname__,
+            type(event).__name__,
+        )
+
+
 class VaultEventBus:
     """Async publish/subscribe bus for vault change events.
 
     Subscribers register for specific event types. Publishing dispatches
-    to all matching subscribers concurrently via ``asyncio.gather``.
+    to all matching subscribers concurrently via ``asyncio.TaskGroup``.
     Subscriber errors are logged and do not propagate.
     """
 
     def __init__(self) -> None:
-        self._subscribers: dict[type[AnyVaultEvent], list[EventCallback]] = {}
+        # Inner dict (insertion-ordered) instead of list: O(1) unsubscribe
+        # and duplicate registrations collapse to one delivery.
+        self._subscribers: dict[type[AnyVaultEvent], dict[EventCallback, None]] = {}
+        self._pending: dict[
+            tuple[type[AnyVaultEvent], Path], tuple[AnyVaultEvent, asyncio.TimerHandle]
+        ] = {}
 
     def subscribe(
         self,
@@ -109,7 +129,7 @@ class VaultEventBus:
         callback: EventCallback,
     ) -> None:
         """Register *callback* for events of *event_type*."""
-        self._subscribers.setdefault(event_type, []).append(callback)
+        self._subscribers.setdefault(event_type, {})[callback] = None
         logger.debug(
             "Subscriber registered: %s → %s",
             event_type.__name__,
@@ -122,9 +142,7 @@ class VaultEventBus:
         callback: EventCallback,
     ) -> None:
         """Remove *callback* from *event_type* subscribers."""
-        subs = self._subscribers.get(event_type, [])
-        with contextlib.suppress(ValueError):
-            subs.remove(callback)
+        self._subscribers.get(event_type, {}).pop(callback, None)
 
     async def publish(self, event: AnyVaultEvent) -> None:
         """Dispatch *event* to all registered subscribers for its type.
@@ -132,21 +150,37 @@ class VaultEventBus:
         Each subscriber runs as a shielded task so one failure doesn't
         block others. Errors are logged, not raised.
         """
-        subs = self._subscribers.get(type(event), [])
+        subs = self._subscribers.get(type(event))
         if not subs:
             return
 
-        async def _safe_call(cb: EventCallback) -> None:
-            try:
-                await cb(event)
-            except Exception:
-                logger.exception(
-                    "Subscriber %s failed on %s",
-                    cb.__qualname__,
-                    type(event).__name__,
-                )
-
-        await asyncio.gather(*[_safe_call(cb) for cb in subs])
+        async with asyncio.TaskGroup() as tg:
+            for cb in subs:
+                tg.create_task(_safe_invoke(cb, event))
+
+    async def publish_debounced(self, event: AnyVaultEvent, window_ms: float = 150.0) -> None:
+        """Publish *event* after a quiet window, coalescing rapid duplicates.
+
+        Editors save a file several times within milliseconds; each save
+        would otherwise trigger the full subscriber fanout (re-embedding,
+        graph updates). Events are buffered per ``(type, path)`` and only
+        the last one within the window is dispatched, trading at most
+        *window_ms* of latency for a large cut in downstream work.
+        """
+        key = (type(event), event.path)
+        pending = self._pending.pop(key, None)
+        if pending is not None:
+            pending[1].cancel()
+        loop = asyncio.get_running_loop()
+        handle = loop.call_later(window_ms / 1000.0, self._flush_pending, key)
+        self._pending[key] = (event, handle)
+
+    def _flush_pending(self, key: tuple[type[AnyVaultEvent], Path]) -> None:
+        """Timer callback: dispatch the buffered event for *key*."""
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        asyncio.ensure_future(self.publish(pending[0]))  # noqa: RUF006 — fire-and-forget dispatch
 
     @property
     def subscriber_count(self) -> int:
@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
-import hashlib
+import re
+from collections.abc import Sequence  # noqa: TC003 — NoteChunk resolves hints at runtime
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
+from functools import cached_property
 from pathlib import Path  # noqa: TC003 — Pydantic needs Path at runtime
 from typing import Any
 
-from pydantic import BaseModel, Field, computed_field
+import orjson
+from blake3 import blake3
+from pydantic import BaseModel, Field, PrivateAttr, computed_field
+
+_WIKILINK_RE = re.compile(r"\[\[([^\]|]+)(?:\|[^\]]+)?\]\]")
+
+# CRLF endings and a closing fence at EOF (no trailing newline) must both
+# match — the old split("---", 2) handled them, so the regex does too.
+_FRONTMATTER_RE = re.compile(r"^---\r?\n.*?\r?\n---(?:\r?\n|\Z)", re.DOTALL)
 
 
 class NoteType(StrEnum):
@@ -51,19 +62,46 @@ class Note(BaseModel):
     modified: datetime = Field(default_factory=datetime.now)
     frontmatter: dict[str, Any] = Field(default_factory=dict)
 
-    @computed_field  # type: ignore[prop-decorator]
+    _body_hash: str | None = PrivateAttr(default=None)
+    _heading_spans: list[tuple[int, int]] | None = PrivateAttr(default=None)
+
     @property
+    def body_hash(self) -> str:
+        """BLAKE3 digest of the stripped body, computed once per instance.
+
+        Consumers that fingerprint the body on every event (duplicate
+        detection, batch scans) share this instead of re-encoding and
+        re-hashing the same content.
+        """
+        if self._body_hash is None:
+            body = self.body_without_frontmatter().strip()
+            self._body_hash = blake3(body.encode("utf-8")).hexdigest()
+        return self._body_hash
+
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
     def content_hash(self) -> str:
-        """SHA-256 hash of content for change detection."""
-        return hashlib.sha256(self.content.encode()).hexdigest()[:16]
+        """BLAKE3 hash of content for change detection, computed once per instance."""
+        return blake3(self.content.encode()).hexdigest(length=8)
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def wikilinks(self) -> list[str]:
-        """Extract [[wikilinks]] from content."""
-        import re
+        """Extract [[wikilinks]] from content, computed once per instance."""
+        return _WIKILINK_RE.findall(self.content)
+
+    @property
+    def heading_spans(self) -> list[tuple[int, int]] | None:
+        """``(line_start, line_end)`` offsets of headings in ``content``.
+
+        Populated by the parser's single-pass scan; ``None`` for notes
+        constructed elsewhere, in which case chunking re-scans the body.
+        """
+        return self._heading_spans
 
-        return re.findall(r"\[\[([^\]|]+)(?:\|[^\]]+)?\]\]", self.content)
+    def set_heading_spans(self, spans: list[tuple[int, int]]) -> None:
+        """Record heading offsets found while scanning ``content``."""
+        self._heading_spans = spans
 
     @property
     def relative_path(self) -> str:
@@ -72,32 +110,42 @@ class Note(BaseModel):
 
     def body_without_frontmatter(self) -> str:
         """Return content body without YAML frontmatter."""
-        if self.content.startswith("---"):
-            parts = self.content.split("---", 2)
-            if len(parts) >= 3:
-                return parts[2].strip()
-        return self.content
+        m = _FRONTMATTER_RE.match(self.content)
+        if m is None:
+            return self.content
+        return self.content[m.end() :].lstrip()
 
 
-class NoteChunk(BaseModel):
-    """A semantically meaningful chunk of a note, ready for embedding."""
+@dataclass(slots=True)
+class NoteChunk:
+    """A semantically meaningful chunk of a note, ready for embedding.
+
+    A slotted dataclass rather than a Pydantic model: the indexer builds
+    one per chunk in a hot loop from already-validated Note fields, so
+    per-field validation buys nothing and slots cut per-instance memory.
+    """
 
     note_path: str
     note_title: str
     chunk_idx: int
-    heading: str = ""
     content: str
+    heading: str = ""
     note_type: NoteType = NoteType.FLEETING
-    tags: list[str] = Field(default_factory=list)
-    entities: list[str] = Field(default_factory=list)
+    tags: Sequence[str] = ()
+    entities: Sequence[str] = ()
     created: str = ""
     modified: str = ""
     status: str = ""
     mode: str = ""
     authority: int = 0  # 1-5 provenance level; 0 = unstamped (neutral default)
     importance_score: float = 0.0
+    tags_csv: str = field(init=False, default="")
+    entities_csv: str = field(init=False, default="")
+
+    def __post_init__(self) -> None:
+        self.tags_csv = ",".join(self.tags)
+        self.entities_csv = ",".join(self.entities)
 
-    @computed_field  # type: ignore[prop-decorator]
     @property
     def chunk_id(self) -> str:
         """Unique identifier for this chunk."""
@@ -110,8 +158,8 @@ class NoteChunk(BaseModel):
             "note_title": self.note_title,
             "note_type": self.note_type.value,
             "heading": self.heading,
-            "tags": ",".join(self.tags),
-            "entities": ",".join(self.entities),
+            "tags": self.tags_csv,
+            "entities": self.entities_csv,
             "created": self.created,
             "modified": self.modified,
             "status": self.status,
@@ -120,3 +168,11 @@ class NoteChunk(BaseModel):
             "importance_score": self.importance_score,
             "chunk_idx": self.chunk_idx,
         }
+
+    def to_chroma_metadata_bytes(self) -> bytes:
+        """Serialized metadata for bulk export paths.
+
+        orjson encodes in C straight to bytes, skipping the intermediate
+        dict when the caller wants wire-format JSON rather than a mapping.
+        """
+        return orjson.dumps(self.to_chroma_metadata())
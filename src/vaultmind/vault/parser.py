@@ -3,25 +3,256 @@
 from __future__ import annotations
 
 import logging
+import mmap
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import chain
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import frontmatter
+import yaml
 
 from vaultmind.vault.models import Note, NoteChunk, NoteMode, NoteType
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Iterator
 
     from vaultmind.config import VaultConfig
 
 logger = logging.getLogger(__name__)
 
+# RE2 (optional: pip install vaultmind[re2]) runs these scans as a
+# linear-time DFA in C and releases the GIL; none of the patterns below
+# need backtracking features, so the stdlib engine is a drop-in fallback.
+try:
+    import re2 as _re  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    _re = re
+
 # Heading pattern: matches ## Heading but not code blocks
-HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
-WIKILINK_PATTERN = re.compile(r"\[\[([^\]|]+)(?:\|[^\]]+)?\]\]")
-TAG_PATTERN = re.compile(r"(?:^|\s)#([a-zA-Z][a-zA-Z0-9_/-]*)", re.MULTILINE)
+HEADING_PATTERN = _re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
+WIKILINK_PATTERN = _re.compile(r"\[\[([^\]|]+)(?:\|[^\]]+)?\]\]")
+TAG_PATTERN = _re.compile(r"(?:^|\s)#([a-zA-Z][a-zA-Z0-9_/-]*)", re.MULTILINE)
+
+# Fused scanner: inline tags (group 1) and heading markers in one pass
+# over the body, instead of TAG_PATTERN here plus HEADING_PATTERN again
+# in chunk_note. The heading alternative consumes only the ``#... ``
+# marker so tags inside heading text are still found.
+_CONTENT_TOKENS = _re.compile(
+    r"(?:^|\s)#([a-zA-Z][a-zA-Z0-9_/-]*)|^#{1,6}[ \t](?=[^\n])", re.MULTILINE
+)
+
+# Below this many notes a process pool costs more in fork/pickle overhead
+# than the parallel parse saves.
+_PARALLEL_THRESHOLD = 100
+
+# Files at least this large are read through mmap; below it the extra
+# syscalls cost more than the saved heap copy.
+_MMAP_THRESHOLD = 8192
+
+
+# Folder → note-type mapping, allocated once instead of per parsed note.
+_FOLDER_MAP: dict[str, NoteType] = {
+    "00-inbox": NoteType.FLEETING,
+    "01-daily": NoteType.DAILY,
+    "02-projects": NoteType.PROJECT,
+    "03-areas": NoteType.AREA,
+    "04-resources": NoteType.LITERATURE,
+    "06-templates": NoteType.TEMPLATE,
+}
+
+
+# libyaml's C loader parses 5-10x faster than the pure-Python SafeLoader
+# and accepts the same document set; fall back when PyYAML was built
+# without it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _split_frontmatter(text: str) -> tuple[dict[str, Any], str] | None:
+    """Fast-path split of a conventional ``---`` frontmatter block.
+
+    Handles the shape Obsidian writes — an opening ``---\\n`` on the first
+    line and a closing ``\\n---\\n`` fence — slicing the YAML region out
+    and parsing it with the C loader, skipping frontmatter.Post
+    construction entirely. Returns None for anything unusual (CRLF
+    fences, unclosed blocks, non-mapping YAML) so the caller can fall
+    back to the frontmatter package, whose semantics are preserved:
+    metadata {} and stripped content.
+    """
+    if not text.startswith("---"):
+        return {}, text.strip()
+    if not text.startswith("---\n"):
+        return None
+    end = text.find("\n---\n", 3)
+    if end == -1:
+        return None
+    try:
+        meta = yaml.load(text[4 : end + 1], Loader=_YAML_LOADER)
+    except yaml.YAMLError:
+        return None
+    if meta is None:
+        meta = {}
+    elif not isinstance(meta, dict):
+        return None
+    return meta, text[end + 5 :].strip()
+
+
+def _read_note_text(filepath: Path) -> str:
+    """Read a note's text, mapping large files instead of copying them.
+
+    mmap serves the decode straight from the page cache without an
+    intermediate read() buffer, which adds up across a cold vault scan.
+    """
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return bytes(mm).decode("utf-8")
+        return f.read().decode("utf-8")
+
+
+@lru_cache(maxsize=256)
+def _infer_type(type_str: str | None, first_folder: str) -> NoteType:
+    """Infer note type from the frontmatter ``type`` or the top-level folder.
+
+    Memoized — a vault has a handful of (type, folder) combinations, so
+    after the first few notes every lookup is a cache hit.
+    """
+    if type_str is not None:
+        try:
+            return NoteType(type_str)
+        except ValueError:
+            pass
+    return _FOLDER_MAP.get(first_folder, NoteType.FLEETING)
+
+
+@lru_cache(maxsize=1024)
+def _parse_date_str(value: str) -> datetime:
+    """Memoized ISO-format parse; raises ValueError for other shapes.
+
+    Daily and templated notes repeat the same created/modified strings
+    across thousands of files, so repeats skip even the C parser.
+    Failures raise and are never cached.
+    """
+    return datetime.fromisoformat(value)
+
+
+def _parse_date(value: str | datetime | None) -> datetime:
+    """Parse a date from frontmatter (string or datetime).
+
+    ``fromisoformat`` runs in C without re-parsing a format string and,
+    since 3.11, accepts every shape the old strptime loop handled
+    (date-only, T- or space-separated, with or without seconds) — so the
+    common path costs one call instead of up to three caught ValueErrors.
+    """
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            return _parse_date_str(value)
+        except ValueError:
+            pass
+    return datetime.now()
+
+
+def _scan_content(text: str) -> tuple[list[str], list[tuple[int, int]]]:
+    """Collect inline tags and heading spans in a single pass over *text*.
+
+    Returns the tag names plus ``(line_start, line_end)`` offsets for each
+    heading, so ``chunk_note`` can section the body without re-scanning it.
+    """
+    tags: list[str] = []
+    heading_spans: list[tuple[int, int]] = []
+    for m in _CONTENT_TOKENS.finditer(text):
+        tag = m.group(1)
+        if tag is not None:
+            tags.append(tag)
+        else:
+            end = text.find("\n", m.end())
+            heading_spans.append((m.start(), end if end != -1 else len(text)))
+    return tags, heading_spans
+
+
+def _parse_note(vault_root: Path, filepath: Path) -> Note:
+    """Parse a single markdown file into a Note.
+
+    Module-level (rather than a method) so process-pool workers can run
+    it without pickling a parser instance.
+    """
+    text = _read_note_text(filepath)
+    parsed = _split_frontmatter(text)
+    if parsed is not None:
+        meta, content = parsed
+    else:
+        post = frontmatter.loads(text)
+        meta, content = post.metadata or {}, post.content
+
+    rel_path = filepath.relative_to(vault_root)
+
+    # Infer note type from frontmatter or folder — partition avoids
+    # materializing the full .parts tuple just to read its first element.
+    raw_type = meta.get("type")
+    note_type = _infer_type(
+        raw_type if isinstance(raw_type, str) else None,
+        str(rel_path).partition(os.sep)[0],
+    )
+
+    # Extract note mode from frontmatter
+    mode_str = meta.get("mode", "learning")
+    try:
+        mode = NoteMode(mode_str)
+    except ValueError:
+        mode = NoteMode.LEARNING
+
+    # Extract authority (1-5 provenance level); invalid/missing -> 0 (unstamped,
+    # ranking treats this as the configured neutral default — never raises).
+    try:
+        authority = int(meta.get("authority", 0))
+    except (TypeError, ValueError):
+        authority = 0
+    if not 1 <= authority <= 5:
+        authority = 0
+
+    # Extract inline tags and heading spans in one pass over the body.
+    # dict.fromkeys dedupes in one pass while keeping frontmatter order,
+    # where the set round-trip shuffled tags and allocated three containers.
+    inline_tags, heading_spans = _scan_content(content)
+    fm_tags = meta.get("tags", [])
+    if isinstance(fm_tags, str):
+        fm_tags = [fm_tags]
+    all_tags = list(dict.fromkeys(chain(fm_tags, inline_tags)))
+
+    note = Note(
+        path=rel_path,
+        title=meta.get("title", filepath.stem.replace("-", " ").replace("_", " ")),
+        content=content,
+        note_type=note_type,
+        mode=mode,
+        tags=all_tags,
+        entities=meta.get("entities", []),
+        related=meta.get("related", []),
+        status=meta.get("status", "active"),
+        source=meta.get("source", "manual"),
+        authority=authority,
+        created=_parse_date(meta.get("created")),
+        modified=_parse_date(meta.get("modified", datetime.now())),
+        frontmatter=meta,
+    )
+    note.set_heading_spans(heading_spans)
+    return note
+
+
+def _parse_file_worker(args: tuple[str, str]) -> Note | None:
+    """Pool worker: parse one note, swallowing per-file failures."""
+    vault_root, path = args
+    try:
+        return _parse_note(Path(vault_root), Path(path))
+    except Exception:
+        logger.exception("Failed to parse %s", path)
+        return None
 
 
 class VaultParser:
@@ -32,71 +263,57 @@ class VaultParser:
         self.vault_root = config.path
 
     def iter_notes(self) -> list[Note]:
-        """Iterate all markdown files in the vault, yielding parsed Notes."""
+        """Iterate all markdown files in the vault, yielding parsed Notes.
+
+        Large vaults are parsed on a process pool — frontmatter + YAML +
+        regex scanning is CPU-bound Python, and notes are independent.
+        Small vaults stay sequential to avoid the fork and pickle cost.
+        """
+        paths = list(self._iter_md_paths(str(self.vault_root)))
+
         notes: list[Note] = []
-        for md_file in self.vault_root.rglob("*.md"):
-            # Skip excluded folders
-            rel = md_file.relative_to(self.vault_root)
-            if any(part in self.config.excluded_folders for part in rel.parts):
-                continue
-            try:
-                note = self.parse_file(md_file)
-                notes.append(note)
-            except Exception:
-                logger.exception("Failed to parse %s", md_file)
+        if len(paths) < _PARALLEL_THRESHOLD:
+            for md_path in paths:
+                try:
+                    notes.append(_parse_note(self.vault_root, Path(md_path)))
+                except Exception:
+                    logger.exception("Failed to parse %s", md_path)
+        else:
+            root = str(self.vault_root)
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = executor.map(
+                    _parse_file_worker,
+                    [(root, p) for p in paths],
+                    chunksize=32,
+                )
+                notes = [note for note in results if note is not None]
         logger.info("Parsed %d notes from vault", len(notes))
         return notes
 
-    def parse_file(self, filepath: Path) -> Note:
-        """Parse a single markdown file into a Note."""
-        with open(filepath, encoding="utf-8") as f:
-            post = frontmatter.load(f)
-
-        meta = post.metadata or {}
-        rel_path = filepath.relative_to(self.vault_root)
-
-        # Infer note type from frontmatter or folder
-        note_type = self._infer_type(meta, rel_path)
+    def _iter_md_paths(self, root: str) -> Iterator[str]:
+        """Yield paths of .md files under *root*, pruning excluded folders.
 
-        # Extract note mode from frontmatter
-        mode_str = meta.get("mode", "learning")
+        rglob visited every entry — including whole excluded subtrees
+        that were filtered only afterwards — and built a Path per entry.
+        scandir prunes excluded directories before descending and hands
+        back plain strings, so only actual matches allocate a Path.
+        """
         try:
-            mode = NoteMode(mode_str)
-        except ValueError:
-            mode = NoteMode.LEARNING
+            entries = os.scandir(root)
+        except OSError as e:
+            logger.warning("Skipping unreadable directory %s: %s", root, e)
+            return
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in self.config.excluded_folders:
+                        yield from self._iter_md_paths(entry.path)
+                elif entry.name.endswith(".md") and entry.is_file(follow_symlinks=False):
+                    yield entry.path
 
-        # Extract authority (1-5 provenance level); invalid/missing -> 0 (unstamped,
-        # ranking treats this as the configured neutral default — never raises).
-        try:
-            authority = int(meta.get("authority", 0))
-        except (TypeError, ValueError):
-            authority = 0
-        if not 1 <= authority <= 5:
-            authority = 0
-
-        # Extract inline tags from content (merge with frontmatter tags)
-        inline_tags = TAG_PATTERN.findall(post.content)
-        fm_tags = meta.get("tags", [])
-        if isinstance(fm_tags, str):
-            fm_tags = [fm_tags]
-        all_tags = list(set(fm_tags + inline_tags))
-
-        return Note(
-            path=rel_path,
-            title=meta.get("title", filepath.stem.replace("-", " ").replace("_", " ")),
-            content=post.content,
-            note_type=note_type,
-            mode=mode,
-            tags=all_tags,
-            entities=meta.get("entities", []),
-            related=meta.get("related", []),
-            status=meta.get("status", "active"),
-            source=meta.get("source", "manual"),
-            authority=authority,
-            created=self._parse_date(meta.get("created")),
-            modified=self._parse_date(meta.get("modified", datetime.now())),
-            frontmatter=meta,
-        )
+    def parse_file(self, filepath: Path) -> Note:
+        """Parse a single markdown file into a Note."""
+        return _parse_note(self.vault_root, filepath)
 
     def chunk_note(self, note: Note, max_tokens: int = 500) -> list[NoteChunk]:
         """Split a note into heading-aware chunks.
@@ -119,7 +336,31 @@ class VaultParser:
             entities=note.entities,
         )
 
-        sections = self._split_by_headings(body)
+        # Bind the per-note constants once — every chunk shares them, and
+        # the isoformat() calls in particular were recomputed per chunk.
+        make_chunk = partial(
+            NoteChunk,
+            note_path=str(note.path),
+            note_title=note.title,
+            note_type=note.note_type,
+            tags=tuple(note.tags),
+            entities=tuple(note.entities),
+            created=note.created.isoformat(),
+            modified=note.modified.isoformat(),
+            status=note.status,
+            mode=note.mode.value,
+            authority=note.authority,
+        )
+
+        # Reuse the heading offsets recorded during parsing when they are
+        # valid for this body (identity check: body_without_frontmatter
+        # returns content itself when there was nothing to strip, which is
+        # always the case for parser-produced notes). Otherwise re-scan.
+        spans = note.heading_spans
+        if spans is not None and body is note.content:
+            sections = self._sections_from_spans(body, spans)
+        else:
+            sections = self._split_by_headings(body)
         chunks: list[NoteChunk] = []
 
         for heading, content in sections:
@@ -135,69 +376,48 @@ class VaultParser:
             if estimated_tokens <= max_tokens:
                 body_text = f"{heading}\n\n{content}" if heading else content
                 chunks.append(
-                    NoteChunk(
-                        note_path=str(note.path),
-                        note_title=note.title,
+                    make_chunk(
                         chunk_idx=len(chunks),
                         heading=heading,
                         content=f"{prefix}\n\n{body_text}",
-                        note_type=note.note_type,
-                        tags=note.tags,
-                        entities=note.entities,
-                        created=note.created.isoformat(),
-                        modified=note.modified.isoformat(),
-                        status=note.status,
-                        mode=note.mode.value,
-                        authority=note.authority,
                         importance_score=note_importance,
                     )
                 )
             else:
-                # Split large sections by paragraphs
+                # Split large sections by paragraphs. Accumulate parts in a
+                # list and join only when flushing — f-string concatenation
+                # recopied the whole accumulated chunk per paragraph
+                # (quadratic), and re-encoded it for the token estimate.
                 paragraphs = content.split("\n\n")
-                current_chunk = ""
+                current_parts: list[str] = []
+                current_len = 0
 
                 for para in paragraphs:
-                    if len((current_chunk + para).encode()) // 4 > max_tokens and current_chunk:
+                    new_len = current_len + 2 + len(para) if current_parts else len(para)
+                    if new_len // 4 > max_tokens and current_parts:
+                        current_chunk = "\n\n".join(current_parts)
                         body_text = f"{heading}\n\n{current_chunk}" if heading else current_chunk
                         chunks.append(
-                            NoteChunk(
-                                note_path=str(note.path),
-                                note_title=note.title,
+                            make_chunk(
                                 chunk_idx=len(chunks),
                                 heading=heading,
                                 content=f"{prefix}\n\n{body_text}",
-                                note_type=note.note_type,
-                                tags=note.tags,
-                                entities=note.entities,
-                                created=note.created.isoformat(),
-                                modified=note.modified.isoformat(),
-                                status=note.status,
-                                mode=note.mode.value,
-                                authority=note.authority,
                             )
                         )
-                        current_chunk = para
+                        current_parts = [para]
+                        current_len = len(para)
                     else:
-                        current_chunk = f"{current_chunk}\n\n{para}" if current_chunk else para
+                        current_parts.append(para)
+                        current_len = new_len
 
+                current_chunk = "\n\n".join(current_parts)
                 if current_chunk.strip():
                     body_text = f"{heading}\n\n{current_chunk}" if heading else current_chunk
                     chunks.append(
-                        NoteChunk(
-                            note_path=str(note.path),
-                            note_title=note.title,
+                        make_chunk(
                             chunk_idx=len(chunks),
                             heading=heading,
                             content=f"{prefix}\n\n{body_text}",
-                            note_type=note.note_type,
-                            tags=note.tags,
-                            entities=note.entities,
-                            created=note.created.isoformat(),
-                            modified=note.modified.isoformat(),
-                            status=note.status,
-                            mode=note.mode.value,
-                            authority=note.authority,
                         )
                     )
 
@@ -216,58 +436,49 @@ class VaultParser:
             parts.append(f"tags: {', '.join(note.tags[:5])}")
         return " | ".join(parts)
 
-    def _split_by_headings(self, text: str) -> list[tuple[str, str]]:
-        """Split text into (heading, content) pairs."""
-        matches = list(HEADING_PATTERN.finditer(text))
+    def _sections_from_spans(
+        self, text: str, spans: list[tuple[int, int]]
+    ) -> Iterator[tuple[str, str]]:
+        """Yield (heading, content) pairs from pre-scanned heading offsets.
 
-        if not matches:
-            return [("", text)]
-
-        sections: list[tuple[str, str]] = []
+        Same output as :meth:`_split_by_headings` without re-running the
+        heading regex over a body the parser already scanned once.
+        """
+        if not spans:
+            yield ("", text)
+            return
 
-        # Content before the first heading
-        if matches[0].start() > 0:
-            preamble = text[: matches[0].start()].strip()
+        first_start = spans[0][0]
+        if first_start > 0:
+            preamble = text[:first_start].strip()
             if preamble:
-                sections.append(("", preamble))
-
-        for i, match in enumerate(matches):
-            heading = match.group(0).strip()
-            start = match.end()
-            end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-            content = text[start:end].strip()
-            sections.append((heading, content))
-
-        return sections
-
-    def _infer_type(self, meta: dict[str, Any], rel_path: Path) -> NoteType:
-        """Infer note type from frontmatter or folder structure."""
-        if "type" in meta:
-            try:
-                return NoteType(meta["type"])
-            except ValueError:
-                pass
-
-        # Infer from folder
-        folder_map = {
-            "00-inbox": NoteType.FLEETING,
-            "01-daily": NoteType.DAILY,
-            "02-projects": NoteType.PROJECT,
-            "03-areas": NoteType.AREA,
-            "04-resources": NoteType.LITERATURE,
-            "06-templates": NoteType.TEMPLATE,
-        }
-        first_folder = rel_path.parts[0] if rel_path.parts else ""
-        return folder_map.get(first_folder, NoteType.FLEETING)
-
-    def _parse_date(self, value: str | datetime | None) -> datetime:
-        """Parse a date from frontmatter (string or datetime)."""
-        if isinstance(value, datetime):
-            return value
-        if isinstance(value, str):
-            for fmt in ("%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M"):
-                try:
-                    return datetime.strptime(value, fmt)
-                except ValueError:
-                    continue
-        return datetime.now()
+                yield ("", preamble)
+
+        for i, (start, line_end) in enumerate(spans):
+            end = spans[i + 1][0] if i + 1 < len(spans) else len(text)
+            yield (text[start:line_end].strip(), text[line_end:end].strip())
+
+    def _split_by_headings(self, text: str) -> Iterator[tuple[str, str]]:
+        """Yield (heading, content) pairs one section at a time.
+
+        A generator rather than a list so ``chunk_note`` holds only the
+        section being chunked — materializing every content slice up
+        front roughly doubled peak memory on long literature notes.
+        Each section is emitted once its end (the next heading) is known.
+        """
+        prev = None
+        for match in HEADING_PATTERN.finditer(text):
+            if prev is None:
+                # Content before the first heading
+                if match.start() > 0:
+                    preamble = text[: match.start()].strip()
+                    if preamble:
+                        yield ("", preamble)
+            else:
+                yield (prev.group(0).strip(), text[prev.end() : match.start()].strip())
+            prev = match
+
+        if prev is None:
+            yield ("", text)
+        else:
+            yield (prev.group(0).strip(), text[prev.end() :].strip())
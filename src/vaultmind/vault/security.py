@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import os
+from functools import lru_cache
+from pathlib import Path
 
 from vaultmind.errors import VaultMindError
 
-if TYPE_CHECKING:
-    from pathlib import Path
-
 
 class PathTraversalError(VaultMindError, ValueError):
     """Raised when a user-supplied path escapes the vault root."""
@@ -19,16 +18,66 @@ class PathTraversalError(VaultMindError, ValueError):
         super().__init__(f"Path traversal blocked: '{user_path}' escapes vault root '{vault_root}'")
 
 
+@lru_cache(maxsize=64)
+def _resolved_root(vault_root: str) -> str:
+    """Resolve the vault root once per root string — it never moves mid-run."""
+    return str(Path(vault_root).resolve())
+
+
+def _has_symlink_below(root: str, candidate: str) -> bool:
+    """True if any component of *candidate* strictly below *root* is a symlink."""
+    p = candidate
+    while len(p) > len(root):
+        if os.path.islink(p):
+            return True
+        p = os.path.dirname(p)
+    return False
+
+
+@lru_cache(maxsize=4096)
+def _validate_cached(user_path: str, vault_root: str) -> Path:
+    """Memoized core of ``validate_vault_path``.
+
+    The common case — a relative path with no symlinks — is settled
+    lexically: join onto the pre-resolved root, ``normpath`` away any
+    ``..`` segments, and prefix-check the result. That costs zero
+    syscalls, where the old double ``resolve()`` ran a stat chain over
+    every component of both root and candidate. Only when a symlink
+    actually sits on the candidate's path does the full resolve (and
+    containment re-check) run, since a lexical check cannot see where a
+    link points. Rejected paths raise and are therefore never cached —
+    only the happy path is memoized.
+    """
+    root = _resolved_root(vault_root)
+    candidate = os.path.normpath(os.path.join(root, user_path))
+    if candidate != root and not candidate.startswith(root + os.sep):
+        raise PathTraversalError(user_path, Path(vault_root))
+
+    if _has_symlink_below(root, candidate):
+        resolved = Path(candidate).resolve()
+        try:
+            resolved.relative_to(root)
+        except ValueError:
+            raise PathTraversalError(user_path, Path(vault_root)) from None
+        return resolved
+
+    return Path(candidate)
+
+
 def validate_vault_path(user_path: str, vault_root: Path) -> Path:
     """Resolve a user-supplied path and verify it stays within the vault root.
 
     Returns the resolved absolute path if valid.
     Raises PathTraversalError if the resolved path escapes vault_root.
     """
-    resolved_root = vault_root.resolve()
-    candidate = (resolved_root / user_path).resolve()
-    try:
-        candidate.relative_to(resolved_root)
-    except ValueError:
-        raise PathTraversalError(user_path, vault_root) from None
-    return candidate
+    return _validate_cached(user_path, str(vault_root))
+
+
+def invalidate_validated_paths() -> None:
+    """Drop all cached validations.
+
+    Call after filesystem mutations that can change how paths resolve
+    (e.g. creating directories or symlinks under the vault root).
+    """
+    _validate_cached.cache_clear()
+    _resolved_root.cache_clear()
@@ -20,8 +20,12 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
+from blake3 import blake3
+
 from vaultmind.vault.events import (
     NoteCreatedEvent,
     NoteDeletedEvent,
@@ -35,14 +39,25 @@ if TYPE_CHECKING:
     from vaultmind.config import WatchConfig
     from vaultmind.graph import EntityExtractor, KnowledgeGraph
     from vaultmind.indexer.store import VaultStore
+    from vaultmind.vault.models import Note
     from vaultmind.vault.parser import VaultParser
 
 logger = logging.getLogger(__name__)
 
 
 def _file_content_hash(path: Path) -> str:
-    """SHA-256 of file content, first 16 hex chars."""
-    return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+    """BLAKE3 digest of file content, 16 hex chars.
+
+    A change-detection fingerprint, not an adversarial hash — BLAKE3
+    hashes bytes several times faster than SHA-256 and truncates
+    natively. ``file_digest`` streams the file through the hash in
+    fixed-size blocks, so large notes are never fully resident just to
+    be fingerprinted — this runs twice per stability check.
+    """
+    with open(path, "rb") as f:
+        # blake3's stubs don't declare the hashlib protocol or the
+        # truncating hexdigest, but both work at runtime.
+        return hashlib.file_digest(f, blake3).hexdigest(length=8)  # type: ignore[arg-type,call-arg]
 
 
 class IncrementalWatchHandler:
@@ -85,8 +100,16 @@ class IncrementalWatchHandler:
         self._graph = graph
         self._extractor = extractor
 
-        # Debounce state: path → scheduled asyncio.TimerHandle
-        self._pending: dict[Path, asyncio.TimerHandle] = {}
+        # Debounce state: path → (loop-clock deadline, event type). A single
+        # periodic sweeper drains expired entries instead of one TimerHandle
+        # per path — Obsidian fires 5-10 events per save, and per-event
+        # handle + closure allocation (and cancellation) adds up.
+        self._deadlines: dict[Path, tuple[float, str]] = {}
+        self._sweep_timer: asyncio.TimerHandle | None = None
+
+        # Loop reference, cached on first dispatch — get_event_loop() does
+        # a TLS lookup plus deprecation bookkeeping on every call.
+        self._loop: asyncio.AbstractEventLoop | None = None
 
         # Last-indexed content hash per note path (for stability check)
         self._hash_cache: dict[Path, str] = {}
@@ -95,6 +118,14 @@ class IncrementalWatchHandler:
         self._graph_pending: set[Path] = set()
         self._graph_timer: asyncio.TimerHandle | None = None
 
+        # Long-lived pool for graph-batch parsing. File reads overlap and
+        # the YAML/regex C code releases the GIL in stretches, so a burst
+        # of 50+ edits parses in a fraction of the serial time.
+        self._parse_pool = ThreadPoolExecutor(
+            max_workers=min(8, os.cpu_count() or 1),
+            thread_name_prefix="vault-parse",
+        )
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -102,35 +133,22 @@ class IncrementalWatchHandler:
     def handle_change(self, path: Path, event_type: str) -> None:
         """Entry point called by ``VaultWatcher`` (sync context).
 
-        Schedules debounced async processing on the running event loop.
+        Records the path's debounce deadline; a rapid re-event just
+        overwrites the dict entry rather than cancelling a timer.
         """
-        loop = asyncio.get_event_loop()
-
-        # Cancel any pending debounce for this path
-        if path in self._pending:
-            self._pending[path].cancel()
-
+        loop = self._loop
+        if loop is None:
+            loop = self._loop = asyncio.get_running_loop()
         debounce_s = self._config.debounce_ms / 1000.0
+        self._deadlines[path] = (loop.time() + debounce_s, event_type)
 
-        if event_type == "deleted":
-
-            def _delete_cb(p: Path = path) -> None:
-                loop.create_task(self._process_delete(p))
-
-            handle = loop.call_later(debounce_s, _delete_cb)
-        else:
-
-            def _change_cb(p: Path = path, et: str = event_type) -> None:
-                loop.create_task(self._process_change(p, et))
-
-            handle = loop.call_later(debounce_s, _change_cb)
-
-        self._pending[path] = handle
+        if self._sweep_timer is None:
+            self._sweep_timer = loop.call_later(debounce_s / 2.0, self._sweep)
 
     @property
     def pending_count(self) -> int:
         """Number of paths awaiting debounce resolution."""
-        return len(self._pending)
+        return len(self._deadlines)
 
     @property
     def indexed_hashes(self) -> dict[Path, str]:
@@ -141,10 +159,31 @@ class IncrementalWatchHandler:
     # Internal processing
     # ------------------------------------------------------------------
 
+    def _sweep(self) -> None:
+        """Drain paths whose debounce deadline has passed.
+
+        Runs every ``debounce_ms / 2`` while anything is pending, then
+        parks itself; :meth:`handle_change` restarts it on the next event.
+        """
+        loop = self._loop
+        if loop is None:
+            loop = self._loop = asyncio.get_running_loop()
+        now = loop.time()
+        for path, (deadline, event_type) in list(self._deadlines.items()):
+            if now >= deadline:
+                del self._deadlines[path]
+                if event_type == "deleted":
+                    loop.create_task(self._process_delete(path))
+                else:
+                    loop.create_task(self._process_change(path, event_type))
+
+        if self._deadlines:
+            self._sweep_timer = loop.call_later(self._config.debounce_ms / 2000.0, self._sweep)
+        else:
+            self._sweep_timer = None
+
     async def _process_change(self, path: Path, event_type: str) -> None:
         """Debounce-triggered handler for created/modified events."""
-        self._pending.pop(path, None)
-
         if not path.exists():
             logger.debug("File vanished before processing: %s", path)
             return
@@ -219,7 +258,6 @@ class IncrementalWatchHandler:
 
     async def _process_delete(self, path: Path) -> None:
         """Debounce-triggered handler for deleted events."""
-        self._pending.pop(path, None)
         self._hash_cache.pop(path, None)
 
         # Derive the note_path string the store uses
@@ -247,12 +285,22 @@ class IncrementalWatchHandler:
         if self._graph_timer is not None:
             return  # already scheduled
 
-        loop = asyncio.get_event_loop()
+        loop = self._loop
+        if loop is None:
+            loop = self._loop = asyncio.get_running_loop()
         self._graph_timer = loop.call_later(
             self._config.batch_graph_interval_seconds,
             lambda: loop.create_task(self._run_graph_batch()),
         )
 
+    def _safe_parse(self, path: Path) -> Note | None:
+        """Parse one note for the graph batch, logging instead of raising."""
+        try:
+            return self._parser.parse_file(path)
+        except Exception:
+            logger.exception("Graph batch: failed to parse %s", path)
+            return None
+
     async def _run_graph_batch(self) -> None:
         """Re-extract entities for all queued notes in a single batch."""
         self._graph_timer = None
@@ -262,13 +310,13 @@ class IncrementalWatchHandler:
         if not paths or not self._extractor or not self._graph:
             return
 
-        notes = []
-        for p in paths:
-            if p.exists():
-                try:
-                    notes.append(self._parser.parse_file(p))
-                except Exception:
-                    logger.exception("Graph batch: failed to parse %s", p)
+        # Parse off the event loop, fanned across the thread pool so the
+        # per-file reads overlap instead of running serially.
+        live = [p for p in paths if p.exists()]
+        results = await asyncio.to_thread(
+            lambda: list(self._parse_pool.map(self._safe_parse, live))
+        )
+        notes = [n for n in results if n is not None]
 
         if not notes:
             return
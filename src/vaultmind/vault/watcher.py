@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -22,6 +24,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Once the coalescing map grows past this, expired entries are pruned —
+# they only matter within the coalesce window, so anything older is dead
+# weight in a long-running watcher.
+_COALESCE_PRUNE_SIZE = 1024
+
 
 class _VaultEventHandler(FileSystemEventHandler):
     """Handles file system events for .md files in the vault."""
@@ -31,35 +38,81 @@ class _VaultEventHandler(FileSystemEventHandler):
         vault_root: Path,
         excluded_folders: list[str],
         on_change: Callable[[Path, str], None],
+        coalesce_window_ms: int = 10,
     ) -> None:
         self.vault_root = vault_root
         self.excluded = set(excluded_folders)
         self.on_change = on_change
 
-    def _should_process(self, path: str) -> bool:
-        p = Path(path)
-        if p.suffix != ".md":
-            return False
-        try:
-            rel = p.relative_to(self.vault_root)
-        except ValueError:
-            return False
-        return not any(part in self.excluded for part in rel.parts)
+        # Obsidian's atomic save (write-temp, rename) fires bursts of
+        # identical events; duplicates inside this window are dropped
+        # before any Path construction or downstream scheduling.
+        self._coalesce_s = coalesce_window_ms / 1000.0
+        self._last_event: dict[tuple[str, str], float] = {}
+
+        # Precomputed string matchers so the per-event filter does no Path
+        # construction — bulk operations fire thousands of events and the
+        # repeated Path() + relative_to() dominated the handler's cost.
+        self._root_prefix = str(vault_root) + os.sep
+        self._excluded_parts = tuple(os.sep + ex + os.sep for ex in excluded_folders)
+
+    def _should_process(self, path: str) -> Path | None:
+        """Return the event path as a ``Path`` if it should be processed.
+
+        Returning the constructed ``Path`` (or ``None`` on reject) means
+        accepted events materialize exactly one Path object instead of a
+        second one at the dispatch site.
+        """
+        if not path.endswith(".md"):
+            return None
+        if not path.startswith(self._root_prefix):
+            return None
+        # Sep-wrapped substring match excludes the folder name at any depth
+        # below the root, same as the old rel.parts scan — matching on the
+        # tail (kept sep-prefixed) so an excluded name in the vault root's
+        # own ancestry doesn't drop every event.
+        tail = path[len(self._root_prefix) - 1 :]
+        if any(part in tail for part in self._excluded_parts):
+            return None
+        return Path(path)
+
+    def _coalesced(self, path: str, event_type: str) -> bool:
+        """True if an identical event arrived within the coalesce window."""
+        now = time.monotonic()
+        key = (event_type, path)
+        last = self._last_event.get(key)
+
+        # Opportunistic prune so the map tracks only the current burst
+        # instead of every file ever touched.
+        if len(self._last_event) >= _COALESCE_PRUNE_SIZE:
+            cutoff = now - self._coalesce_s
+            for k, t in list(self._last_event.items()):
+                if t < cutoff:
+                    del self._last_event[k]
+
+        self._last_event[key] = now
+        return last is not None and now - last < self._coalesce_s
 
     def on_created(self, event: FileCreatedEvent) -> None:  # type: ignore[override]
-        if not event.is_directory and self._should_process(event.src_path):
+        if not event.is_directory and (path := self._should_process(event.src_path)):
+            if self._coalesced(event.src_path, "created"):
+                return
             logger.info("Note created: %s", event.src_path)
-            self.on_change(Path(event.src_path), "created")
+            self.on_change(path, "created")
 
     def on_modified(self, event: FileModifiedEvent) -> None:  # type: ignore[override]
-        if not event.is_directory and self._should_process(event.src_path):
+        if not event.is_directory and (path := self._should_process(event.src_path)):
+            if self._coalesced(event.src_path, "modified"):
+                return
             logger.debug("Note modified: %s", event.src_path)
-            self.on_change(Path(event.src_path), "modified")
+            self.on_change(path, "modified")
 
     def on_deleted(self, event: FileDeletedEvent) -> None:  # type: ignore[override]
-        if not event.is_directory and self._should_process(event.src_path):
+        if not event.is_directory and (path := self._should_process(event.src_path)):
+            if self._coalesced(event.src_path, "deleted"):
+                return
             logger.info("Note deleted: %s", event.src_path)
-            self.on_change(Path(event.src_path), "deleted")
+            self.on_change(path, "deleted")
 
 
 class VaultWatcher:
@@ -76,12 +129,14 @@ class VaultWatcher:
         self,
         config: VaultConfig,
         on_change: Callable[[Path, str], None],
+        coalesce_window_ms: int = 10,
     ) -> None:
         self.config = config
         self.handler = _VaultEventHandler(
             vault_root=config.path,
             excluded_folders=config.excluded_folders,
             on_change=on_change,
+            coalesce_window_ms=coalesce_window_ms,
         )
         self._observer: Observer | None = None  # type: ignore[valid-type]
 
@@ -13,7 +13,7 @@ from vaultmind.bench.llm_score import (
     parse_llm_answer,
     score_decline,
 )
-from vaultmind.llm.client import LLMResponse, Message
+from vaultmind.llm.client import LLMResponse, Message, Usage
 
 
 class FakeLLMClient:
@@ -35,7 +35,7 @@ class FakeLLMClient:
         system: str | None = None,
     ) -> LLMResponse:
         self.calls.append((messages, model, max_tokens))
-        return LLMResponse(text=self.response_text, model=model, usage={})
+        return LLMResponse(text=self.response_text, model=model, usage=Usage())
 
     def complete_multimodal(self, *args: Any, **kwargs: Any) -> LLMResponse:
         raise NotImplementedError
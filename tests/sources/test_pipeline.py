@@ -11,7 +11,7 @@ from unittest.mock import MagicMock
 import frontmatter
 import pytest
 
-from vaultmind.llm.client import LLMResponse
+from vaultmind.llm.client import LLMResponse, Usage
 from vaultmind.services.review_queue import (
     Impact,
     Lane,
@@ -56,7 +56,7 @@ def _make_llm(response_obj: object | None = None, *, raise_error: bool = False)
         client.complete.return_value = LLMResponse(
             text=json.dumps(response_obj or _GOOD_RESPONSE),
             model="fake-model",
-            usage={"total_tokens": 40},
+            usage=Usage(),
         )
     return client
 
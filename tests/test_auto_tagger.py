@@ -12,7 +12,7 @@ from pathlib import Path
 from typing import Any
 
 from vaultmind.indexer.auto_tagger import AutoTagger
-from vaultmind.llm.client import LLMResponse, Message
+from vaultmind.llm.client import LLMResponse, Message, Usage
 from vaultmind.vault.models import Note
 
 # ---------------------------------------------------------------------------
@@ -55,7 +55,7 @@ class FakeLLMClient:
     ) -> LLMResponse:
         self.calls.append({"model": model, "messages": messages})
         result = json.dumps({"tags": self._tags, "new_tags": self._new_tags})
-        return LLMResponse(text=result, model=model, usage={"total_tokens": 100})
+        return LLMResponse(text=result, model=model, usage=Usage())
 
 
 def _make_note(
@@ -7,7 +7,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from vaultmind.llm.client import LLMResponse
+from vaultmind.llm.client import LLMResponse, Usage
 from vaultmind.memory.consolidation import ConsolidationReport, MemoryConsolidator
 from vaultmind.memory.models import OutcomeStatus
 from vaultmind.memory.store import EpisodeStore
@@ -34,7 +34,7 @@ def llm_client() -> MagicMock:
     client.complete.return_value = LLMResponse(
         text="- Lesson 1: Always test\n- Lesson 2: Keep it simple",
         model="test",
-        usage={},
+        usage=Usage(),
     )
     return client
 
@@ -20,7 +20,7 @@ from vaultmind.contradiction.eval import (
     load_eval_set,
     run_eval,
 )
-from vaultmind.llm.client import LLMError, LLMResponse
+from vaultmind.llm.client import LLMError, LLMResponse, Usage
 
 
 def _make_llm(response_obj: object) -> MagicMock:
@@ -31,7 +31,7 @@ def _make_llm(response_obj: object) -> MagicMock:
         client.complete.return_value = LLMResponse(
             text=json.dumps(response_obj) if isinstance(response_obj, dict) else response_obj,
             model="test-model",
-            usage={},
+            usage=Usage(),
         )
     return client
 
@@ -183,7 +183,7 @@ class TestRunEval:
             LLMResponse(
                 text=json.dumps({"materially_conflicts": p.materially_conflicts, "reasoning": ""}),
                 model="m",
-                usage={},
+                usage=Usage(),
             )
             for p in pairs
         ]
@@ -206,7 +206,7 @@ class TestRunEval:
         client.complete.return_value = LLMResponse(
             text=json.dumps({"materially_conflicts": True, "reasoning": ""}),
             model="m",
-            usage={},
+            usage=Usage(),
         )
 
         report = run_eval(pairs, client, "test-model")
@@ -10,7 +10,7 @@ from unittest.mock import AsyncMock, MagicMock
 from vaultmind.bot.notifier import Notifier
 from vaultmind.contradiction.detector import ContradictionDetector
 from vaultmind.indexer.duplicate_detector import DuplicateMatch, MatchType
-from vaultmind.llm.client import LLMResponse
+from vaultmind.llm.client import LLMResponse, Usage
 from vaultmind.memory.gaps import GapKind, GapStatus, GapStore
 from vaultmind.vault.events import NoteCreatedEvent
 from vaultmind.vault.models import Note
@@ -53,7 +53,7 @@ def _make_llm(conflicts: bool, reasoning: str = "reason") -> MagicMock:
     client.complete.return_value = LLMResponse(
         text=json.dumps({"materially_conflicts": conflicts, "reasoning": reasoning}),
         model="test-model",
-        usage={},
+        usage=Usage(),
     )
     return client
 
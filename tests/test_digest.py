@@ -58,6 +58,11 @@ class FakeStore:
     def search(self, query: str, n_results: int = 5, where: dict | None = None) -> list[dict]:
         return self._results
 
+    def search_batch(
+        self, queries: list[str], n_results: int = 5, where: dict | None = None
+    ) -> list[list[dict]]:
+        return [self._results for _ in queries]
+
 
 class FakeGraph:
     """Minimal KnowledgeGraph stand-in."""
@@ -285,7 +290,7 @@ class TestTrendingEntities:
 
         # current_note.md mtime is in the current window
         recent = datetime.now(tz=UTC) - timedelta(days=2)
-        with patch.object(generator, "_source_note_mtime", return_value=recent):
+        with patch.object(generator, "_file_mtime", return_value=recent):
             report = generator.generate()
 
         assert any(e.name == "Python" for e in report.trending_entities)
@@ -323,7 +328,7 @@ class TestTrendingEntities:
         )
 
         recent = datetime.now(tz=UTC) - timedelta(days=1)
-        with patch.object(generator, "_source_note_mtime", return_value=recent):
+        with patch.object(generator, "_file_mtime", return_value=recent):
             report = generator.generate()
 
         if len(report.trending_entities) >= 2:
@@ -344,7 +349,7 @@ class TestTrendingEntities:
         generator = _make_generator(notes, tmp_path, graph_nodes=graph_nodes, config=config)
 
         recent = datetime.now(tz=UTC) - timedelta(days=1)
-        with patch.object(generator, "_source_note_mtime", return_value=recent):
+        with patch.object(generator, "_file_mtime", return_value=recent):
             report = generator.generate()
 
         assert len(report.trending_entities) <= 5
@@ -8,7 +8,7 @@ from unittest.mock import MagicMock
 
 import frontmatter
 
-from vaultmind.llm.client import LLMError, LLMResponse
+from vaultmind.llm.client import LLMError, LLMResponse, Usage
 from vaultmind.memory.models import OutcomeStatus
 from vaultmind.memory.store import EpisodeStore
 from vaultmind.pipeline.distill import (
@@ -24,7 +24,7 @@ from vaultmind.vault.parser import VaultParser
 def _make_llm(response_obj: object) -> MagicMock:
     client = MagicMock()
     client.complete.return_value = LLMResponse(
-        text=json.dumps(response_obj), model="fake-model", usage={"total_tokens": 40}
+        text=json.dumps(response_obj), model="fake-model", usage=Usage()
     )
     return client
 
@@ -181,7 +181,7 @@ class TestDistillConversationFailure:
 
     def test_invalid_json_returns_failure(self, tmp_path: Path) -> None:
         llm = MagicMock()
-        llm.complete.return_value = LLMResponse(text="not json", model="fake-model", usage={})
+        llm.complete.return_value = LLMResponse(text="not json", model="fake-model", usage=Usage())
         result = distill_conversation(
             _GOOD_TURNS, llm, "fake-model", tmp_path, "qa-artifacts", "ref"
         )
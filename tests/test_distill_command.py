@@ -15,7 +15,7 @@ import pytest
 
 from vaultmind.bot.handlers.distill import handle_distill
 from vaultmind.config import DistillConfig
-from vaultmind.llm.client import LLMResponse
+from vaultmind.llm.client import LLMResponse, Usage
 from vaultmind.memory.store import EpisodeStore
 from vaultmind.pipeline.distill import DISTILL_SYSTEM_PROMPT
 from vaultmind.vault.models import Note
@@ -86,11 +86,11 @@ _EXTRACT_JSON = [
 def _distill_side_effect(**kwargs: object) -> LLMResponse:
     system = kwargs.get("system", "")
     if system == DISTILL_SYSTEM_PROMPT:
-        return LLMResponse(text=json.dumps(_DISTILL_JSON), model="test-model", usage={})
+        return LLMResponse(text=json.dumps(_DISTILL_JSON), model="test-model", usage=Usage())
     # extractor's system prompt (private) — detected by content, not identity
     if "decision-outcome pairs" in str(system):
-        return LLMResponse(text=json.dumps(_EXTRACT_JSON), model="test-model", usage={})
-    return LLMResponse(text="unused", model="test-model", usage={})
+        return LLMResponse(text=json.dumps(_EXTRACT_JSON), model="test-model", usage=Usage())
+    return LLMResponse(text="unused", model="test-model", usage=Usage())
 
 
 def _make_llm_client() -> MagicMock:
@@ -41,6 +41,12 @@ class FakeStore:
         self.last_query = query
         return self._results
 
+    def search_batch(
+        self, queries: list[str], n_results: int = 5, where: dict | None = None
+    ) -> list[list[dict]]:
+        self.last_query = queries[-1] if queries else None
+        return [self._results for _ in queries]
+
 
 def _make_note(path: str = "test/note.md", title: str = "Test Note", content: str = "") -> Note:
     if not content:
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock
 
 from vaultmind.graph.evolution import LineageStore
-from vaultmind.llm.client import LLMResponse
+from vaultmind.llm.client import LLMResponse, Usage
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -40,7 +40,7 @@ def _make_ctx(
     ctx.settings.llm.max_tokens = 1024
     ctx.llm_client = MagicMock()
     ctx.llm_client.complete = MagicMock(
-        return_value=LLMResponse(text=llm_text, model="test-model", usage={})
+        return_value=LLMResponse(text=llm_text, model="test-model", usage=Usage())
     )
     ctx.store = MagicMock()
     ctx.store.index_single_note = MagicMock(return_value=None)
@@ -137,9 +137,10 @@ class TestStats:
 
 class TestWALMode:
     def test_wal_enabled(self, cache: EmbeddingCache) -> None:
-        row = cache._conn.execute("PRAGMA journal_mode").fetchone()
-        assert row is not None
-        assert row[0] == "wal"
+        for conn in (cache._read_conn, cache._write_conn):
+            row = conn.execute("PRAGMA journal_mode").fetchone()
+            assert row is not None
+            assert row[0] == "wal"
 
 
 class TestClose:
@@ -6,7 +6,7 @@ import json
 from pathlib import Path
 from unittest.mock import MagicMock
 
-from vaultmind.llm.client import LLMResponse
+from vaultmind.llm.client import LLMResponse, Usage
 from vaultmind.memory.extractor import extract_episodes
 from vaultmind.memory.models import Episode, OutcomeStatus
 from vaultmind.memory.store import EpisodeStore
@@ -34,7 +34,7 @@ def _make_fake_llm(response_json: object) -> MagicMock:
     client.complete.return_value = LLMResponse(
         text=json.dumps(response_json),
         model="fake-model",
-        usage={"total_tokens": 50},
+        usage=Usage(),
     )
     return client
 
@@ -256,7 +256,7 @@ class TestExtractHandlesInvalidJson:
         client.complete.return_value = LLMResponse(
             text="not valid json at all }{",
             model="fake-model",
-            usage={"total_tokens": 10},
+            usage=Usage(),
         )
         note = _make_note(content="C" * 200)
 
@@ -269,7 +269,7 @@ class TestExtractHandlesInvalidJson:
         client.complete.return_value = LLMResponse(
             text='{"decision": "something"}',
             model="fake-model",
-            usage={"total_tokens": 10},
+            usage=Usage(),
         )
         note = _make_note(content="D" * 200)
 
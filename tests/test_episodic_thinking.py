@@ -10,7 +10,7 @@ import pytest
 
 from vaultmind.bot.session_store import SessionStore
 from vaultmind.bot.thinking import ThinkingPartner
-from vaultmind.llm.client import LLMResponse
+from vaultmind.llm.client import LLMResponse, Usage
 from vaultmind.memory.models import Episode, OutcomeStatus
 from vaultmind.memory.store import EpisodeStore
 
@@ -55,7 +55,7 @@ def episode_store(tmp_path: Path) -> EpisodeStore:
 @pytest.fixture()
 def llm_client() -> MagicMock:
     client = MagicMock()
-    client.complete.return_value = LLMResponse(text="test reply", model="test-model", usage={})
+    client.complete.return_value = LLMResponse(text="test reply", model="test-model", usage=Usage())
     return client
 
 
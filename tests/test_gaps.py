@@ -341,10 +341,10 @@ def _make_graph() -> MagicMock:
 
 
 def _make_thinking_llm_client(reply_text: str) -> MagicMock:
-    from vaultmind.llm.client import LLMResponse
+    from vaultmind.llm.client import LLMResponse, Usage
 
     client = MagicMock()
-    client.complete.return_value = LLMResponse(text=reply_text, model="test-model", usage={})
+    client.complete.return_value = LLMResponse(text=reply_text, model="test-model", usage=Usage())
     return client
 
 
@@ -580,6 +580,11 @@ class _FakeDigestStore:
     def search(self, query: str, n_results: int = 5, where: dict | None = None) -> list[dict]:
         return []
 
+    def search_batch(
+        self, queries: list[str], n_results: int = 5, where: dict | None = None
+    ) -> list[list[dict]]:
+        return [[] for _ in queries]
+
 
 class _FakeDigestGraph:
     def __init__(self) -> None:
@@ -593,6 +598,9 @@ class _FakeDigestGraph:
 
 
 class _FakeDigestParser:
+    def __init__(self, vault_root: Path) -> None:
+        self.vault_root = vault_root
+
     def iter_notes(self) -> list:
         return []
 
@@ -619,7 +627,7 @@ class TestDigestKnowledgeGapsLifecycle:
         generator = DigestGenerator(
             store=_FakeDigestStore(),  # type: ignore[arg-type]
             graph=_FakeDigestGraph(),  # type: ignore[arg-type]
-            parser=_FakeDigestParser(),  # type: ignore[arg-type]
+            parser=_FakeDigestParser(tmp_path),  # type: ignore[arg-type]
             config=_FakeDigestConfig(),  # type: ignore[arg-type]
             gap_store=gap_store,
         )
@@ -636,7 +644,7 @@ class TestDigestKnowledgeGapsLifecycle:
         generator = DigestGenerator(
             store=_FakeDigestStore(),  # type: ignore[arg-type]
             graph=_FakeDigestGraph(),  # type: ignore[arg-type]
-            parser=_FakeDigestParser(),  # type: ignore[arg-type]
+            parser=_FakeDigestParser(tmp_path),  # type: ignore[arg-type]
             config=_FakeDigestConfig(),  # type: ignore[arg-type]
             gap_store=gap_store,
         )
@@ -652,7 +660,7 @@ class TestDigestKnowledgeGapsLifecycle:
         generator = DigestGenerator(
             store=_FakeDigestStore(),  # type: ignore[arg-type]
             graph=_FakeDigestGraph(),  # type: ignore[arg-type]
-            parser=_FakeDigestParser(),  # type: ignore[arg-type]
+            parser=_FakeDigestParser(tmp_path),  # type: ignore[arg-type]
             config=_FakeDigestConfig(),  # type: ignore[arg-type]
         )
         report = generator.generate()
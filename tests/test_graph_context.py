@@ -11,7 +11,7 @@ import pytest
 
 from vaultmind.graph.context import GraphContextBlock, GraphContextBuilder
 from vaultmind.graph.knowledge_graph import KnowledgeGraph
-from vaultmind.llm.client import LLMError, LLMResponse, Message
+from vaultmind.llm.client import LLMError, LLMResponse, Message, Usage
 
 
 class FakeLLMClient:
@@ -33,7 +33,9 @@ class FakeLLMClient:
         system: str | None = None,
     ) -> LLMResponse:
         self.call_count += 1
-        return LLMResponse(text=self._response, model=model, usage={"input": 10, "output": 5})
+        return LLMResponse(
+            text=self._response, model=model, usage=Usage(input_tokens=10, output_tokens=5)
+        )
 
 
 class FailingLLMClient:
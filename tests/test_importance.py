@@ -90,6 +90,20 @@ class TestNoteChunkImportance:
         meta = chunk.to_chroma_metadata()
         assert meta["importance_score"] == 0.75
 
+    def test_chroma_metadata_bytes_round_trip(self) -> None:
+        import orjson
+
+        from vaultmind.vault.models import NoteChunk
+
+        chunk = NoteChunk(
+            note_path="test.md",
+            note_title="Test",
+            chunk_idx=0,
+            content="test content",
+            tags=["a", "b"],
+        )
+        assert orjson.loads(chunk.to_chroma_metadata_bytes()) == chunk.to_chroma_metadata()
+
     def test_importance_score_default_zero(self) -> None:
         from vaultmind.vault.models import NoteChunk
 
@@ -46,6 +46,11 @@ class FakeStore:
     def search(self, query: str, n_results: int = 5, where: dict | None = None) -> list[dict]:
         return []
 
+    def search_batch(
+        self, queries: list[str], n_results: int = 5, where: dict | None = None
+    ) -> list[list[dict]]:
+        return [[] for _ in queries]
+
 
 class FakeGraph:
     def __init__(self) -> None:
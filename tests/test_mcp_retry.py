@@ -12,7 +12,7 @@ if TYPE_CHECKING:
 
 import pytest
 
-from vaultmind.llm.client import LLMResponse
+from vaultmind.llm.client import LLMResponse, Usage
 from vaultmind.mcp.auth import ProfileError
 from vaultmind.mcp.retry import ToolRetryExecutor, ToolRetryExhaustedError
 from vaultmind.vault.security import PathTraversalError
@@ -62,7 +62,7 @@ def _make_llm(
     response_text: str = '{"arguments": {"query": "fixed"}}',
 ) -> MagicMock:
     client = MagicMock()
-    client.complete.return_value = LLMResponse(text=response_text, model="test", usage={})
+    client.complete.return_value = LLMResponse(text=response_text, model="test", usage=Usage())
     return client
 
 
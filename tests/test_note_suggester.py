@@ -59,9 +59,16 @@ class FakeGraph:
         self._paths = paths or {}
         self._entities = entities or set()
 
-    def find_path(self, source: str, target: str) -> list[str] | None:
-        key = (source.strip().lower(), target.strip().lower())
-        return self._paths.get(key)
+    def normalize(self, name: str) -> str:
+        return name.strip().lower()
+
+    def shortest_path_lengths_from(self, source: str, cutoff: int = 4) -> dict[str, int]:
+        source = self.normalize(source)
+        lengths: dict[str, int] = {source: 0}
+        for (src, target), path in self._paths.items():
+            if src == source and len(path) - 1 <= cutoff:
+                lengths[target] = len(path) - 1
+        return lengths
 
     def get_entity(self, name: str) -> dict | None:
         if name.lower() in self._entities:
@@ -9,7 +9,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from vaultmind.llm.client import ContentPart, LLMResponse, Message, MultimodalMessage
+from vaultmind.llm.client import ContentPart, LLMResponse, Message, MultimodalMessage, Usage
 
 # ---------------------------------------------------------------------------
 # Helpers / fakes
@@ -66,7 +66,7 @@ class FakeLLMClient:
         system: str | None = None,
     ) -> LLMResponse:
         self.calls.append({"messages": messages, "model": model})
-        return LLMResponse(text=self._description, model=model, usage={})
+        return LLMResponse(text=self._description, model=model, usage=Usage())
 
 
 def _make_fake_store() -> MagicMock:
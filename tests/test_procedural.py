@@ -8,7 +8,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from vaultmind.llm.client import LLMResponse
+from vaultmind.llm.client import LLMResponse, Usage
 from vaultmind.memory.models import OutcomeStatus
 from vaultmind.memory.procedural import ProceduralMemory
 from vaultmind.memory.store import EpisodeStore
@@ -31,7 +31,7 @@ def _make_fake_llm(response_data: object) -> MagicMock:
     client.complete.return_value = LLMResponse(
         text=json.dumps(response_data),
         model="fake-model",
-        usage={"total_tokens": 50},
+        usage=Usage(),
     )
     return client
 
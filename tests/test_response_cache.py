@@ -0,0 +1,111 @@
+"""Tests for the semantic LLM response cache."""
+
+from __future__ import annotations
+
+from vaultmind.llm.client import LLMResponse, Message, Usage
+from vaultmind.llm.response_cache import SemanticResponseCache
+
+
+def _response(text: str = "answer") -> LLMResponse:
+    return LLMResponse(text=text, model="test-model", usage=Usage())
+
+
+class TestPromptKey:
+    def test_includes_system_and_messages(self) -> None:
+        key = SemanticResponseCache.prompt_key(
+            [Message(role="user", content="hello")], system="be brief"
+        )
+        assert "be brief" in key
+        assert "hello" in key
+
+    def test_no_system(self) -> None:
+        key = SemanticResponseCache.prompt_key([Message(role="user", content="hello")], None)
+        assert "hello" in key
+
+
+class TestExactMatch:
+    def test_hit_returns_cached(self) -> None:
+        cache = SemanticResponseCache(max_entries=10)
+        cache.put("prompt", _response("cached"))
+
+        result = cache.get("prompt")
+        assert result is not None
+        assert result.text == "cached"
+
+    def test_miss_returns_none(self) -> None:
+        cache = SemanticResponseCache(max_entries=10)
+        assert cache.get("unknown") is None
+
+    def test_lru_eviction(self) -> None:
+        cache = SemanticResponseCache(max_entries=2)
+        cache.put("a", _response("a"))
+        cache.put("b", _response("b"))
+        cache.put("c", _response("c"))
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        assert cache.get("c") is not None
+        assert cache.size == 2
+
+
+class TestSemanticMatch:
+    def test_near_duplicate_served(self) -> None:
+        vectors = {
+            "what is python": [1.0, 0.0, 0.01],
+            "what's python": [1.0, 0.0, 0.0],
+        }
+        cache = SemanticResponseCache(
+            max_entries=10, similarity_threshold=0.95, embed_fn=vectors.__getitem__
+        )
+        cache.put("what is python", _response("a language"))
+
+        result = cache.get("what's python")
+        assert result is not None
+        assert result.text == "a language"
+
+    def test_dissimilar_misses(self) -> None:
+        vectors = {
+            "what is python": [1.0, 0.0, 0.0],
+            "weather tomorrow": [0.0, 1.0, 0.0],
+        }
+        cache = SemanticResponseCache(
+            max_entries=10, similarity_threshold=0.95, embed_fn=vectors.__getitem__
+        )
+        cache.put("what is python", _response())
+
+        assert cache.get("weather tomorrow") is None
+
+    def test_embeddings_stored_as_int8(self) -> None:
+        import numpy as np
+
+        cache = SemanticResponseCache(max_entries=10, embed_fn=lambda _key: [0.6, 0.8, 0.0])
+        cache.put("prompt", _response())
+        cache.get("other")
+
+        assert cache._matrix is not None
+        assert cache._matrix.dtype == np.int8
+
+    def test_miss_embedding_reused_by_put(self) -> None:
+        calls: list[str] = []
+
+        def embed(key: str) -> list[float]:
+            calls.append(key)
+            return [1.0, 0.0]
+
+        cache = SemanticResponseCache(max_entries=10, embed_fn=embed)
+        assert cache.get("prompt") is None
+        cache.put("prompt", _response())
+
+        assert calls == ["prompt"]
+
+
+class TestStats:
+    def test_counts_hits_and_misses(self) -> None:
+        cache = SemanticResponseCache(max_entries=10)
+        cache.put("prompt", _response())
+        cache.get("prompt")
+        cache.get("other")
+
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+        assert cache.stats["size"] == 1
@@ -461,6 +461,11 @@ class _FakeDigestStore:
     ) -> list[dict[str, str]]:
         return []
 
+    def search_batch(
+        self, queries: list[str], n_results: int = 5, where: dict[str, str] | None = None
+    ) -> list[list[dict[str, str]]]:
+        return [[] for _ in queries]
+
 
 class _FakeDigestGraph:
     def __init__(self) -> None:
@@ -474,6 +479,9 @@ class _FakeDigestGraph:
 
 
 class _FakeDigestParser:
+    def __init__(self, vault_root: Path) -> None:
+        self.vault_root = vault_root
+
     def iter_notes(self) -> list[Note]:
         return []
 
@@ -504,7 +512,7 @@ class TestDigestReviewQueueLifecycle:
         generator = DigestGenerator(
             store=_FakeDigestStore(),
             graph=_FakeDigestGraph(),
-            parser=_FakeDigestParser(),
+            parser=_FakeDigestParser(tmp_path),
             config=_FakeDigestConfig(),
             review_queue=queue,
         )
@@ -526,7 +534,7 @@ class TestDigestReviewQueueLifecycle:
         generator = DigestGenerator(
             store=_FakeDigestStore(),
             graph=_FakeDigestGraph(),
-            parser=_FakeDigestParser(),
+            parser=_FakeDigestParser(tmp_path),
             config=_FakeDigestConfig(),
             review_queue=queue,
         )
@@ -549,7 +557,7 @@ class TestDigestReviewQueueLifecycle:
         generator = DigestGenerator(
             store=_FakeDigestStore(),
             graph=_FakeDigestGraph(),
-            parser=_FakeDigestParser(),
+            parser=_FakeDigestParser(tmp_path),
             config=_FakeDigestConfig(),
             review_queue=queue,
         )
@@ -558,13 +566,13 @@ class TestDigestReviewQueueLifecycle:
         assert "## Pending Review" in text
         assert "Merge candidate" in text
 
-    def test_no_review_queue_leaves_report_zeroed(self) -> None:
+    def test_no_review_queue_leaves_report_zeroed(self, tmp_path: Path) -> None:
         from vaultmind.indexer.digest import DigestGenerator
 
         generator = DigestGenerator(
             store=_FakeDigestStore(),
             graph=_FakeDigestGraph(),
-            parser=_FakeDigestParser(),
+            parser=_FakeDigestParser(tmp_path),
             config=_FakeDigestConfig(),
         )
         report = generator.generate()
@@ -578,7 +586,7 @@ class TestDigestReviewQueueLifecycle:
         generator = DigestGenerator(
             store=_FakeDigestStore(),
             graph=_FakeDigestGraph(),
-            parser=_FakeDigestParser(),
+            parser=_FakeDigestParser(tmp_path),
             config=_FakeDigestConfig(),
             review_queue=queue,
         )
@@ -9,7 +9,11 @@ import pytest
 if TYPE_CHECKING:
     from pathlib import Path
 
-from vaultmind.vault.security import PathTraversalError, validate_vault_path
+from vaultmind.vault.security import (
+    PathTraversalError,
+    invalidate_validated_paths,
+    validate_vault_path,
+)
 
 
 @pytest.fixture()
@@ -64,3 +68,22 @@ class TestValidateVaultPath:
 
     def test_error_is_value_error_subclass(self) -> None:
         assert issubclass(PathTraversalError, ValueError)
+
+
+class TestValidationCache:
+    def test_repeat_call_is_cached(self, vault_root: Path) -> None:
+        first = validate_vault_path("subdir/note.md", vault_root)
+        second = validate_vault_path("subdir/note.md", vault_root)
+        assert first is second
+
+    def test_invalidate_drops_cached_entries(self, vault_root: Path) -> None:
+        first = validate_vault_path("subdir/note.md", vault_root)
+        invalidate_validated_paths()
+        second = validate_vault_path("subdir/note.md", vault_root)
+        assert first == second
+        assert first is not second
+
+    def test_traversal_still_raises_after_valid_lookup(self, vault_root: Path) -> None:
+        validate_vault_path("subdir/note.md", vault_root)
+        with pytest.raises(PathTraversalError):
+            validate_vault_path("../../etc/passwd", vault_root)
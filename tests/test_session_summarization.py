@@ -10,7 +10,7 @@ import pytest
 
 from vaultmind.bot.session_store import SessionStore
 from vaultmind.bot.thinking import ThinkingPartner
-from vaultmind.llm.client import LLMResponse, Message
+from vaultmind.llm.client import LLMResponse, Message, Usage
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -48,7 +48,7 @@ def store(tmp_path: Path) -> SessionStore:
 @pytest.fixture()
 def llm_client() -> MagicMock:
     client = MagicMock()
-    client.complete.return_value = LLMResponse(text="test reply", model="test-model", usage={})
+    client.complete.return_value = LLMResponse(text="test reply", model="test-model", usage=Usage())
     return client
 
 
@@ -308,9 +308,9 @@ class TestSummarizeIfNeeded:
                     return LLMResponse(
                         text="SUMMARY: Test summary.\nTOPICS: t1\nQUESTIONS: none",
                         model="test-model",
-                        usage={},
+                        usage=Usage(),
                     )
-            return LLMResponse(text="test reply", model="test-model", usage={})
+            return LLMResponse(text="test reply", model="test-model", usage=Usage())
 
         llm_client.complete.side_effect = fake_complete
 
@@ -13,7 +13,7 @@ import pytest
 from vaultmind.bot.session_store import SessionStore
 from vaultmind.bot.thinking import ThinkingPartner
 from vaultmind.config import VaultConfig
-from vaultmind.llm.client import LLMResponse, Message
+from vaultmind.llm.client import LLMResponse, Message, Usage
 from vaultmind.memory.extractor import _SYSTEM_PROMPT as _EXTRACT_SYSTEM_PROMPT
 from vaultmind.memory.store import EpisodeStore
 from vaultmind.pipeline.distill import DISTILL_SYSTEM_PROMPT
@@ -60,7 +60,7 @@ def store(tmp_path: Path) -> SessionStore:
 @pytest.fixture
 def llm_client() -> MagicMock:
     client = MagicMock()
-    client.complete.return_value = LLMResponse(text="test reply", model="test-model", usage={})
+    client.complete.return_value = LLMResponse(text="test reply", model="test-model", usage=Usage())
     return client
 
 
@@ -221,7 +221,7 @@ def _distill_side_effect(**kwargs: object) -> LLMResponse:
                 }
             ),
             model="test-model",
-            usage={},
+            usage=Usage(),
         )
     if system == _EXTRACT_SYSTEM_PROMPT:
         return LLMResponse(
@@ -238,9 +238,9 @@ def _distill_side_effect(**kwargs: object) -> LLMResponse:
                 ]
             ),
             model="test-model",
-            usage={},
+            usage=Usage(),
         )
-    return LLMResponse(text="test reply", model="test-model", usage={})
+    return LLMResponse(text="test reply", model="test-model", usage=Usage())
 
 
 @pytest.fixture
@@ -194,6 +194,41 @@ class TestEventBus:
         await bus.publish(NoteCreatedEvent(path=Path("b.md")))
         assert count == 1
 
+    @pytest.mark.asyncio
+    async def test_debounce_coalesces_rapid_duplicates(self) -> None:
+        bus = VaultEventBus()
+        received: list[NoteModifiedEvent] = []
+
+        async def on_modified(event: NoteModifiedEvent) -> None:
+            received.append(event)
+
+        bus.subscribe(NoteModifiedEvent, on_modified)  # type: ignore[arg-type]
+
+        for chunks in (1, 2, 3):
+            await bus.publish_debounced(
+                NoteModifiedEvent(path=Path("a.md"), chunks_indexed=chunks), window_ms=20
+            )
+        await asyncio.sleep(0.1)
+
+        assert len(received) == 1
+        assert received[0].chunks_indexed == 3
+
+    @pytest.mark.asyncio
+    async def test_debounce_keeps_distinct_paths(self) -> None:
+        bus = VaultEventBus()
+        received: list[NoteModifiedEvent] = []
+
+        async def on_modified(event: NoteModifiedEvent) -> None:
+            received.append(event)
+
+        bus.subscribe(NoteModifiedEvent, on_modified)  # type: ignore[arg-type]
+
+        await bus.publish_debounced(NoteModifiedEvent(path=Path("a.md")), window_ms=20)
+        await bus.publish_debounced(NoteModifiedEvent(path=Path("b.md")), window_ms=20)
+        await asyncio.sleep(0.1)
+
+        assert {e.path for e in received} == {Path("a.md"), Path("b.md")}
+
     def test_subscriber_count(self) -> None:
         bus = VaultEventBus()
 